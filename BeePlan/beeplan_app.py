@@ -1,238 +1,59 @@
 # beeplan_final.py
 # BeePlan - Week 9 (Student B) FINAL (Tkinter)
 # Dashboard + Scheduler + Report (single-file, no external GUI libs)
+# Models, loaders and scheduling live in beeplan_core.py (headless).
 
 import os
-import json
-import csv
+import queue
+import threading
 import tkinter as tk
+from time import monotonic
 from tkinter import ttk, filedialog, messagebox
-from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
-# Optional: XLSX (if you want to load common schedule)
-try:
-    import openpyxl  # type: ignore
-except Exception:
-    openpyxl = None
+from beeplan_core import (
+    DAYS,
+    LOADERS,
+    TIMES,
+    discover_data_files,
+    export_sessions,
+    generate_all_years,
+    generate_schedule,
+    load_cached,
+    load_folder,
+)
+from engine import ENGINES, ScheduleCancelled, is_lab_code
+from entity_store import CourseStore, EntityIndex, InstructorStore, Interner, RoomStore
+from exporter import available_formats, export_all
+from common_schedule import CommonSchedule, load_common_schedule
+from scheduler import Progress
+from timetable_canvas import TimetableCanvas
+from issues import CRITICAL, WARNING, IssueReport
+from validation import finding_issues, validate_inputs
+
+ISSUES_PER_PAGE = 200  # rows per page of the report window
 
 
 # -----------------------------
-# Constants (Timetable)
-# -----------------------------
-DAYS = ["MON", "TUE", "WED", "THU", "FRI"]
-TIMES = ["9:20", "10:20", "11:20", "12:20", "13:20", "14:20", "15:20", "16:20"]
-
-# Exam block sample (you can adjust later)
-EXAM_BLOCK = {("FRI", "13:20"): "EXAM\nBLOCK\n(13:20-15:10)"}
-
-
-# -----------------------------
-# Data models
-# -----------------------------
-@dataclass
-class Course:
-    code: str
-    name: str = ""
-    year: int = 1
-    students: int = 0
-    hours: int = 1
-    instructor: str = ""  # name/id string
-
-
-@dataclass
-class Instructor:
-    name: str
-    available: Optional[List[Tuple[str, str]]] = None  # list of (day,time)
-
-
-@dataclass
-class Classroom:
-    name: str
-    capacity: int = 0
-
-
-# -----------------------------
-# Helpers: flexible key getter
-# -----------------------------
-def pick(d: dict, *keys: str, default=None):
-    """Pick first matching key in dict (case-insensitive + common variants)."""
-    if not isinstance(d, dict):
-        return default
-    lower_map = {str(k).lower(): k for k in d.keys()}
-    for k in keys:
-        k2 = str(k).lower()
-        if k2 in lower_map:
-            return d[lower_map[k2]]
-    return default
-
-
-def to_int(x, default=0):
-    try:
-        return int(float(str(x).strip()))
-    except Exception:
-        return default
-
-
-# -----------------------------
-# Loaders (JSON/CSV)
+# UI (Dashboard + Scheduler + Report)
 # -----------------------------
-def load_json_or_csv(path: str) -> List[dict]:
-    ext = os.path.splitext(path)[1].lower()
-    if ext == ".json":
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        # accept either list or {"items":[...]}
-        if isinstance(data, dict):
-            if "items" in data and isinstance(data["items"], list):
-                return data["items"]
-            # try common keys
-            for k in ["courses", "instructors", "classrooms", "data"]:
-                if k in data and isinstance(data[k], list):
-                    return data[k]
-            # single object -> list
-            return [data]
-        if isinstance(data, list):
-            return data
-        return []
-    elif ext == ".csv":
-        out: List[dict] = []
-        with open(path, "r", encoding="utf-8-sig", newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                out.append(row)
-        return out
-    else:
-        raise ValueError("Only JSON or CSV supported.")
-
-
-def parse_courses(rows: List[dict]) -> List[Course]:
-    courses: List[Course] = []
-    for r in rows:
-        code = str(pick(r, "code", "courseCode", "course_code", "CourseCode", default="")).strip()
-        if not code:
-            # try 'name' as code fallback
-            code = str(pick(r, "name", "course", default="")).strip()
-        if not code:
-            continue
-        name = str(pick(r, "title", "courseName", "course_name", "name", default="")).strip()
-        year = to_int(pick(r, "year", "classYear", "grade", default=1), 1)
-        students = to_int(pick(r, "students", "studentCount", "capacityNeeded", "enrolled", default=0), 0)
-        hours = to_int(pick(r, "hours", "duration", "weeklyHours", default=1), 1)
-        instructor = str(pick(r, "instructor", "instructorName", "teacher", "lecturer", default="")).strip()
-        courses.append(Course(code=code, name=name, year=year, students=students, hours=max(1, hours), instructor=instructor))
-    return courses
-
-
-def parse_instructors(rows: List[dict]) -> List[Instructor]:
-    instructors: List[Instructor] = []
-    for r in rows:
-        name = str(pick(r, "name", "instructor", "instructorName", "teacher", "lecturer", default="")).strip()
-        if not name:
-            continue
-        # optional availability
-        avail = pick(r, "available", "availability", "slots", default=None)
-        parsed_avail = None
-        if isinstance(avail, list):
-            tmp = []
-            for item in avail:
-                if isinstance(item, dict):
-                    d = str(pick(item, "day", default="")).upper()
-                    t = str(pick(item, "time", default=""))
-                    if d and t:
-                        tmp.append((d, t))
-                elif isinstance(item, str) and "-" in item:
-                    # "MON-9:20"
-                    parts = item.split("-", 1)
-                    tmp.append((parts[0].strip().upper(), parts[1].strip()))
-            parsed_avail = tmp if tmp else None
-
-        instructors.append(Instructor(name=name, available=parsed_avail))
-    return instructors
-
-
-def parse_classrooms(rows: List[dict]) -> List[Classroom]:
-    rooms: List[Classroom] = []
-    for r in rows:
-        name = str(pick(r, "name", "room", "classroom", "id", "roomId", "roomName", default="")).strip()
-        if not name:
-            continue
-        cap = to_int(pick(r, "capacity", "kontenjan", "roomCapacity", "cap", "quota", "size", default=0), 0)
-        rooms.append(Classroom(name=name, capacity=cap))
-    return rooms
+GRID_VIEWS = ["Year", "Room", "Instructor"]
+SLOTS = [(d, t) for d in DAYS for t in TIMES]  # columns of the per-room / per-instructor grids
 
 
-# -----------------------------
-# Scheduling (Week 9: simple heuristic)
-# - We aim to place courses in free slots
-# - Conflicts are counted if slot already used
-# -----------------------------
-def generate_schedule(courses: List[Course], year_filter: Optional[int] = None) -> Dict:
-    # Prepare schedule dict
-    schedule: Dict[str, Dict[str, str]] = {d: {t: "" for t in TIMES} for d in DAYS}
-
-    # put exam blocks
-    for (d, t), txt in EXAM_BLOCK.items():
-        if d in schedule and t in schedule[d]:
-            schedule[d][t] = txt
-
-    # Filter courses
-    pool = courses
-    if year_filter:
-        pool = [c for c in courses if c.year == year_filter]
-
-    # Place courses
-    conflicts = 0
-    placed = 0
-
-    # deterministic order
-    pool_sorted = sorted(pool, key=lambda c: (c.year, c.code))
-
-    for c in pool_sorted:
-        placed_this = False
-        for day in DAYS:
-            for time in TIMES:
-                # skip exam block
-                if schedule[day][time].startswith("EXAM"):
-                    continue
-                if schedule[day][time] == "":
-                    # place
-                    label = c.code
-                    # show (Lab) if code ends with L or contains LAB
-                    if c.code.endswith("L") or "LAB" in c.code.upper():
-                        label = f"{c.code}\n(Lab)"
-                    schedule[day][time] = label
-                    placed += 1
-                    placed_this = True
-                    break
-                else:
-                    # already occupied
-                    continue
-            if placed_this:
-                break
-        if not placed_this:
-            conflicts += 1
-
-    # Create a simple report (Week 9 style)
-    rules_total = 6
-    rules_passed = max(0, rules_total - conflicts)
-    warnings = 1 if placed > 0 else 0
-    critical = 1 if conflicts > 0 else 0
-
-    return {
-        "schedule": schedule,
-        "scheduled_courses": placed,
-        "conflicts": conflicts,
-        "warnings": warnings,
-        "critical": critical,
-        "rules_passed": rules_passed,
-        "rules_total": rules_total,
-    }
+def cell_colors(text: str) -> Tuple[str, str]:
+    """(background, text colour) of a timetable cell."""
+    if text.startswith("EXAM"):
+        return "#ffb5b5", "#d10000"
+    if "CENG" in text:
+        return "#2f86d6", "white"
+    if "MATH" in text:
+        return "#7a58d6", "white"
+    if "SENG" in text:
+        return "#f08a1a", "white"
+    return "#eaf6ff", "#111"
 
 
-# -----------------------------
-# UI (Dashboard + Scheduler + Report)
-# -----------------------------
 class BeePlanFinalApp:
     def __init__(self):
         self.root = tk.Tk()
@@ -240,15 +61,34 @@ class BeePlanFinalApp:
         self.root.geometry("1200x720")
         self.root.configure(bg="#cfe9ff")
 
-        # loaded data
-        self.courses: List[Course] = []
-        self.instructors: List[Instructor] = []
-        self.classrooms: List[Classroom] = []
+        # loaded data (column stores once loaded, see entity_store.py)
+        self.names = Interner()  # instructor names, shared by courses and instructors
+        self.courses: CourseStore = CourseStore(self.names)
+        self.instructors: InstructorStore = InstructorStore(self.names)
+        self.classrooms: RoomStore = RoomStore()
         self.common_xlsx_loaded = False
+        self.common: Optional[CommonSchedule] = None
+
+        # lookup indexes: loaded data (rebuilt on load/reset) and the shown schedule
+        self.index = EntityIndex(self.courses, self.instructors)
+        self.by_room: Dict[str, List[Tuple[str, str, str]]] = {}  # room -> (day, time, code)
+        self.slots_of: Dict[str, List[Tuple[str, str]]] = {}  # code -> (day, time)
+        self.room_of: Dict[Tuple[str, str, str], str] = {}  # (day, time, code) -> room
 
         self.last_result: Optional[Dict] = None
+        self.last_year: Optional[int] = None  # year last_result was generated for
+        self.all_results: Dict[int, Dict] = {}
         self.selected_year: Optional[int] = 1  # default 1st year
 
+        # the scheduler window is built once and reused for every result
+        self.sched_win: Optional[tk.Toplevel] = None
+        self.sched_ui: Dict = {}
+        self.shown_schedule: Dict[str, Dict[str, str]] = {}
+
+        # background scheduling: the running job (None when idle); a new one supersedes it
+        self.job: Optional[Dict] = None
+        self.job_seq = 0
+
         self._build_styles()
         self._build_dashboard()
 
@@ -293,6 +133,11 @@ class BeePlanFinalApp:
 
         self.set_year(1)
 
+        ttk.Label(year_row, text="Engine:", font=("Segoe UI", 12, "bold"), background="#cfe9ff").pack(side="left", padx=(24, 8))
+        self.engine_var = tk.StringVar(value="greedy")
+        ttk.Combobox(year_row, textvariable=self.engine_var, values=list(ENGINES), width=10,
+                     state="readonly").pack(side="left")
+
         # Main content row
         main = ttk.Frame(self.root)
         main.pack(fill="both", expand=True, padx=18, pady=10)
@@ -304,37 +149,66 @@ class BeePlanFinalApp:
 
         ttk.Label(left, text="QUICK ACTIONS", style="Section.TLabel").pack(pady=(15, 12))
 
-        self.btn_load_courses = tk.Button(left, text="📄  Load Courses", font=("Segoe UI", 12, "bold"),
+        # the buttons scroll when the window is too short to show them all
+        actions_canvas = tk.Canvas(left, bg="white", highlightthickness=0, width=300)
+        actions_sb = ttk.Scrollbar(left, orient="vertical", command=actions_canvas.yview)
+        actions_canvas.configure(yscrollcommand=actions_sb.set)
+        actions_sb.pack(side="right", fill="y")
+        actions_canvas.pack(side="left", fill="both", expand=True)
+        actions = tk.Frame(actions_canvas, bg="white")
+        actions_win = actions_canvas.create_window(0, 0, window=actions, anchor="nw")
+        actions.bind("<Configure>", lambda e: actions_canvas.configure(scrollregion=actions_canvas.bbox("all")))
+        actions_canvas.bind("<Configure>", lambda e: actions_canvas.itemconfigure(actions_win, width=e.width))
+        scroll = lambda e: actions_canvas.yview_scroll(-1 if e.delta > 0 else 1, "units")
+        actions_canvas.bind("<Enter>", lambda e: actions_canvas.bind_all("<MouseWheel>", scroll))
+        actions_canvas.bind("<Leave>", lambda e: actions_canvas.unbind_all("<MouseWheel>"))
+
+        self.btn_load_folder = tk.Button(actions, text="📂  Load Folder", font=("Segoe UI", 12, "bold"),
+                                         bg="#4b2aa8", fg="white", relief="flat", height=2,
+                                         command=self.on_load_folder)
+        self.btn_load_folder.pack(fill="x", padx=25, pady=10)
+
+        self.btn_load_courses = tk.Button(actions, text="📄  Load Courses", font=("Segoe UI", 12, "bold"),
                                           bg="#6f35d9", fg="white", relief="flat", height=2,
                                           command=self.on_load_courses)
         self.btn_load_courses.pack(fill="x", padx=25, pady=10)
 
-        self.btn_load_instructors = tk.Button(left, text="👩‍🏫  Load Instructors", font=("Segoe UI", 12, "bold"),
+        self.btn_load_instructors = tk.Button(actions, text="👩‍🏫  Load Instructors", font=("Segoe UI", 12, "bold"),
                                               bg="#1f63d7", fg="white", relief="flat", height=2,
                                               command=self.on_load_instructors)
         self.btn_load_instructors.pack(fill="x", padx=25, pady=10)
 
-        self.btn_load_classrooms = tk.Button(left, text="🏫  Load Classrooms", font=("Segoe UI", 12, "bold"),
+        self.btn_load_classrooms = tk.Button(actions, text="🏫  Load Classrooms", font=("Segoe UI", 12, "bold"),
                                              bg="#f39c12", fg="white", relief="flat", height=2,
                                              command=self.on_load_classrooms)
         self.btn_load_classrooms.pack(fill="x", padx=25, pady=10)
 
-        self.btn_generate = tk.Button(left, text="⚡  Generate Schedule", font=("Segoe UI", 12, "bold"),
+        self.btn_load_common = tk.Button(actions, text="📅  Load Common Schedule", font=("Segoe UI", 12, "bold"),
+                                         bg="#8e44ad", fg="white", relief="flat", height=2,
+                                         command=self.on_load_common)
+        self.btn_load_common.pack(fill="x", padx=25, pady=10)
+
+        self.btn_generate = tk.Button(actions, text="⚡  Generate Schedule", font=("Segoe UI", 12, "bold"),
                                       bg="#16b879", fg="white", relief="flat", height=2,
                                       command=self.on_generate_schedule)
         self.btn_generate.pack(fill="x", padx=25, pady=10)
 
-        self.btn_view_report = tk.Button(left, text="🧾  View Report", font=("Segoe UI", 12, "bold"),
+        self.btn_generate_all = tk.Button(actions, text="🗓  Generate All Years", font=("Segoe UI", 12, "bold"),
+                                          bg="#0e9e8a", fg="white", relief="flat", height=2,
+                                          command=self.on_generate_all_years)
+        self.btn_generate_all.pack(fill="x", padx=25, pady=10)
+
+        self.btn_view_report = tk.Button(actions, text="🧾  View Report", font=("Segoe UI", 12, "bold"),
                                          bg="#1449c8", fg="white", relief="flat", height=2,
                                          command=self.on_view_report)
         self.btn_view_report.pack(fill="x", padx=25, pady=10)
 
-        self.btn_export = tk.Button(left, text="📤  Export Schedule", font=("Segoe UI", 12, "bold"),
+        self.btn_export = tk.Button(actions, text="📤  Export Schedule", font=("Segoe UI", 12, "bold"),
                                     bg="#7ec90d", fg="white", relief="flat", height=2,
                                     command=self.on_export_schedule)
         self.btn_export.pack(fill="x", padx=25, pady=10)
 
-        self.btn_reset = tk.Button(left, text="🔁  Reset", font=("Segoe UI", 12, "bold"),
+        self.btn_reset = tk.Button(actions, text="🔁  Reset", font=("Segoe UI", 12, "bold"),
                                    bg="#f24444", fg="white", relief="flat", height=2,
                                    command=self.on_reset)
         self.btn_reset.pack(fill="x", padx=25, pady=(10, 18))
@@ -379,6 +253,17 @@ class BeePlanFinalApp:
         self.lbl_last_time = ttk.Label(self.card_last, text="Time: -", style="Info.TLabel")
         self.lbl_last_time.pack(anchor="w", padx=35, pady=(2, 10))
 
+        progress_row = ttk.Frame(self.card_last, style="Card.TFrame")
+        progress_row.pack(fill="x", padx=35, pady=(0, 10))
+        self.progress_bar = ttk.Progressbar(progress_row, mode="determinate", maximum=1)
+        self.progress_bar.pack(side="left", fill="x", expand=True)
+        self.btn_cancel = tk.Button(progress_row, text="Cancel", font=("Segoe UI", 10, "bold"),
+                                    bg="#f24444", fg="white", relief="flat", state="disabled",
+                                    command=self.on_cancel_job)
+        self.btn_cancel.pack(side="left", padx=(10, 0))
+        self.lbl_progress = ttk.Label(self.card_last, text="", style="Small.TLabel")
+        self.lbl_progress.pack(anchor="w", padx=35, pady=(0, 10))
+
     def set_year(self, year: int):
         self.selected_year = year
         # simple highlight
@@ -401,8 +286,8 @@ class BeePlanFinalApp:
         if not path:
             return
         try:
-            rows = load_json_or_csv(path)
-            self.courses = parse_courses(rows)
+            self._store_loaded("courses", load_cached(path, "courses"))
+            self._reindex()
             if not self.courses:
                 raise ValueError("No valid course rows found.")
             self._set_loaded_label(self.lbl_file_courses, True, os.path.basename(path))
@@ -414,8 +299,8 @@ class BeePlanFinalApp:
         if not path:
             return
         try:
-            rows = load_json_or_csv(path)
-            self.instructors = parse_instructors(rows)
+            self._store_loaded("instructors", load_cached(path, "instructors"))
+            self._reindex()
             if not self.instructors:
                 raise ValueError("No valid instructor rows found.")
             self._set_loaded_label(self.lbl_file_instructors, True, os.path.basename(path))
@@ -427,23 +312,154 @@ class BeePlanFinalApp:
         if not path:
             return
         try:
-            rows = load_json_or_csv(path)
-            self.classrooms = parse_classrooms(rows)
+            self.classrooms = RoomStore.from_classrooms(load_cached(path, "classrooms"))
             if not self.classrooms:
                 raise ValueError("No valid classroom rows found.")
             self._set_loaded_label(self.lbl_file_classrooms, True, os.path.basename(path))
         except Exception as e:
             messagebox.showerror("Load Classrooms", str(e))
 
+    def on_load_folder(self):
+        folder = filedialog.askdirectory(title="Select data folder (Courses / Instructors / Classrooms)")
+        if not folder:
+            return
+        try:
+            files = discover_data_files(folder)
+        except OSError as e:
+            messagebox.showerror("Load Folder", str(e))
+            return
+        kinds = [kind for kind in (*LOADERS, "common") if kind in files]
+        if not kinds:
+            messagebox.showwarning("Load Folder", "No Courses, Instructors, Classrooms or CommonSchedule file found in that folder.")
+            return
+
+        labels = self._file_labels()
+        for kind in kinds:
+            labels[kind].config(text=f"⏳ {os.path.basename(files[kind])}", fg="#2b2b2b")
+        self.btn_load_folder.config(state="disabled")
+
+        # parse off the Tk thread; finished files come back through the queue,
+        # then None once the loader is done, whether or not it got through
+        done: "queue.Queue" = queue.Queue()
+
+        def work():
+            try:
+                load_folder(folder, files=files, on_loaded=lambda *item: done.put(item))
+            except Exception as e:
+                done.put((None, folder, None, e))
+            finally:
+                done.put(None)
+
+        threading.Thread(target=work, daemon=True).start()
+        self._poll_folder_load(done, {kind: files[kind] for kind in kinds}, [])
+
+    def _file_labels(self) -> Dict[str, tk.Label]:
+        return {"courses": self.lbl_file_courses, "instructors": self.lbl_file_instructors,
+                "classrooms": self.lbl_file_classrooms, "common": self.lbl_file_common}
+
+    def _poll_folder_load(self, done: "queue.Queue", pending: Dict[str, str], errors: List[str]):
+        """Apply loaded files until the loader signals it finished; `pending` is kind -> path."""
+        while True:
+            try:
+                item = done.get_nowait()
+            except queue.Empty:
+                self.root.after(50, self._poll_folder_load, done, pending, errors)
+                return
+            if item is None:
+                break
+            kind, path, records, error = item
+            if kind is None:  # the loader itself failed
+                errors.append(f"{os.path.basename(path)}: {error}")
+                continue
+            pending.pop(kind, None)
+            try:
+                if error is not None:
+                    raise error
+                self._apply_loaded(kind, records)
+                self._set_loaded_label(self._file_labels()[kind], True, os.path.basename(path))
+            except Exception as e:
+                self._set_loaded_label(self._file_labels()[kind], False, os.path.basename(path))
+                errors.append(f"{os.path.basename(path)}: {e}")
+        for kind, path in pending.items():  # never reported back
+            self._set_loaded_label(self._file_labels()[kind], False, os.path.basename(path))
+        self.btn_load_folder.config(state="normal")
+        if errors:
+            messagebox.showerror("Load Folder", "\n".join(errors))
+
+    def _apply_loaded(self, kind: str, records):
+        if not records:
+            what = "common schedule (needs Day and Time columns)" if kind == "common" else kind[:-1]
+            raise ValueError(f"No valid {what} rows found.")
+        if kind == "common":
+            self.common = records
+            self.common_xlsx_loaded = True
+        elif kind in ("courses", "instructors"):
+            self._store_loaded(kind, records)
+        else:
+            self.classrooms = RoomStore.from_classrooms(records)
+        self._reindex()
+
+    def _store_loaded(self, kind: str, records):
+        """
+        Replace the courses or the instructors. Names are interned afresh, with the
+        other store moved over, so names only the replaced data used are dropped.
+        """
+        self.names = Interner()
+        if kind == "courses":
+            self.courses = CourseStore.from_courses(records, self.names)
+            self.instructors = InstructorStore.from_instructors(self.instructors, self.names)
+            self.all_results = {}  # generated from the old courses
+        else:
+            self.instructors = InstructorStore.from_instructors(records, self.names)
+            self.courses = CourseStore.from_courses(self.courses, self.names)
+
+    # -------- Indexes ----------
+    def _reindex(self):
+        self.index = EntityIndex(self.courses, self.instructors)
+
+    def _index_result(self, result: Optional[Dict]):
+        """Room and slot lookups for the schedule being shown."""
+        self.by_room, self.slots_of, self.room_of = {}, {}, {}
+        if not result:
+            return
+        for (day, time, code), room in zip(result["placements"], result.get("placement_rooms", ())):
+            self.by_room.setdefault(room, []).append((day, time, code))
+            self.slots_of.setdefault(code, []).append((day, time))
+            self.room_of[(day, time, code)] = room
+
+    def on_load_common(self):
+        path = filedialog.askopenfilename(title="Select CommonSchedule XLSX", filetypes=[("Excel", "*.xlsx")])
+        if not path:
+            return
+        try:
+            self._apply_loaded("common", load_common_schedule(path))
+            self._set_loaded_label(self.lbl_file_common, True, os.path.basename(path))
+        except Exception as e:
+            messagebox.showerror("Load Common Schedule", str(e))
+
     def on_generate_schedule(self):
         if not self.courses:
             messagebox.showwarning("Missing Data", "Please load Courses first.")
             return
 
         year = self.selected_year
-        result = generate_schedule(self.courses, year_filter=year)
+        courses, instructors, classrooms = self.courses, self.instructors, self.classrooms
+        engine, common = self.engine_var.get(), self.common
+
+        def run(progress: Progress) -> Dict:
+            result = generate_schedule(courses, year_filter=year, classrooms=classrooms, engine=engine,
+                                       common=common, progress=progress, instructors=instructors)
+            result["findings"] = validate_inputs(courses, instructors, classrooms)
+            result["input_issues"] = IssueReport(finding_issues(result["findings"]))
+            return result
 
+        self._start_job(f"Year {year}", run, lambda result: self._show_generated(year, result))
+
+    def _show_generated(self, year: int, result: Dict):
         self.last_result = result
+        self.last_year = year
+        self.all_results = {}  # export this year, not an older all-years run
+        self._index_result(result)
         # update last schedule card
         ytxt = f"{year}st Year" if year == 1 else f"{year}nd Year" if year == 2 else f"{year}rd Year" if year == 3 else f"{year}th Year"
         self.lbl_last_year.config(text=f"Year: {ytxt}")
@@ -462,6 +478,119 @@ class BeePlanFinalApp:
         # ✅ THIS IS THE IMPORTANT PART: OPEN SCHEDULE WINDOW
         self.open_schedule_window(result["schedule"])
 
+    def on_generate_all_years(self):
+        if not self.courses:
+            messagebox.showwarning("Missing Data", "Please load Courses first.")
+            return
+
+        courses, instructors, classrooms = self.courses, self.instructors, self.classrooms
+        engine, common = self.engine_var.get(), self.common
+
+        def run(progress: Progress) -> Dict[int, Dict]:
+            results = generate_all_years(courses, classrooms=classrooms, engine=engine, common=common,
+                                         progress=progress, instructors=instructors)
+            # one report of input findings, shared by every year instead of copied into each
+            findings = validate_inputs(courses, instructors, classrooms)
+            inputs = IssueReport(finding_issues(findings))
+            for r in results.values():
+                r["findings"] = findings
+                r["input_issues"] = inputs
+            return results
+
+        self._start_job("All years", run, self._show_generated_all)
+
+    def _show_generated_all(self, results: Dict[int, Dict]):
+        self.all_results = results
+        self.last_year = self.selected_year if self.selected_year in results else next(iter(results))
+        result = self.last_result = results[self.last_year]
+        self._index_result(result)
+
+        self.lbl_last_year.config(text="Year: All Years")
+        any_issues = any(r["conflicts"] for r in self.all_results.values())
+        self.lbl_last_status.config(text=f"Status: {'With Issues' if any_issues else 'Successful'}")
+        self.lbl_last_time.config(text="Time: (now)")
+
+        lines = [f"Year {y}: {r['scheduled_courses']} placed, {r['conflicts']} conflicts"
+                 for y, r in self.all_results.items()]
+        clashes = sum(len(r["clashes"]) for r in self.all_results.values())
+        messagebox.showinfo("Generated", "All years scheduled.\n" + "\n".join(lines) +
+                            f"\nCross-year clashes: {clashes}")
+
+        self.open_schedule_window(result["schedule"])
+
+    # -------- Background scheduling ----------
+    def _start_job(self, title: str, run, on_done):
+        """
+        Run run(progress) on a worker thread; progress and the outcome come back
+        through a queue polled with root.after. A running job is cancelled and
+        superseded: its late messages are ignored.
+        """
+        if self.job is not None:
+            self.job["cancel"].set()
+        self.job_seq += 1
+        job = {"id": self.job_seq, "title": title, "cancel": threading.Event(), "queue": queue.Queue()}
+        self.job = job
+        last = [0.0]
+
+        def progress(done: int, total: int, conflicts: int):
+            if job["cancel"].is_set():
+                raise ScheduleCancelled()
+            now = monotonic()
+            if now - last[0] >= 0.1:  # the UI only shows the latest count
+                last[0] = now
+                job["queue"].put(("progress", (done, total, conflicts)))
+
+        def work():
+            try:
+                job["queue"].put(("done", run(progress)))
+            except ScheduleCancelled:
+                job["queue"].put(("cancelled", None))
+            except Exception as e:
+                job["queue"].put(("error", e))
+
+        threading.Thread(target=work, daemon=True).start()
+        self.progress_bar.config(value=0, maximum=1)
+        self.lbl_progress.config(text=f"{title}: starting...")
+        self.btn_cancel.config(state="normal")
+        self._poll_job(job, on_done)
+
+    def _poll_job(self, job: Dict, on_done):
+        if job is not self.job:
+            return  # cancelled or superseded
+        outcome = None
+        while outcome is None:
+            try:
+                kind, payload = job["queue"].get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                done, total, conflicts = payload
+                self.progress_bar.config(value=done, maximum=max(total, 1))
+                self.lbl_progress.config(text=f"{job['title']}: {done}/{total} courses, {conflicts} conflicts so far")
+            else:
+                outcome = (kind, payload)
+        if outcome is None:
+            self.root.after(50, self._poll_job, job, on_done)
+            return
+        self.job = None
+        self.btn_cancel.config(state="disabled")
+        kind, payload = outcome
+        if kind == "done":
+            self.progress_bar.config(value=1, maximum=1)
+            self.lbl_progress.config(text=f"{job['title']}: done")
+            on_done(payload)
+        elif kind == "error":
+            self.lbl_progress.config(text=f"{job['title']}: failed")
+            messagebox.showerror("Generate", str(payload))
+
+    def on_cancel_job(self):
+        if self.job is None:
+            return
+        self.job["cancel"].set()
+        self.lbl_progress.config(text=f"{self.job['title']}: cancelled")
+        self.job = None
+        self.btn_cancel.config(state="disabled")
+
     def on_view_report(self):
         if not self.last_result:
             messagebox.showwarning("No Report", "Please generate schedule first.")
@@ -472,30 +601,33 @@ class BeePlanFinalApp:
         if not self.last_result:
             messagebox.showwarning("No Schedule", "Generate schedule first.")
             return
-        save_path = filedialog.asksaveasfilename(title="Export Schedule", defaultextension=".txt",
-                                                 filetypes=[("Text", "*.txt")])
-        if not save_path:
+        out_dir = filedialog.askdirectory(title="Export Schedule (every year, instructor and room view)")
+        if not out_dir:
             return
         try:
-            sched = self.last_result["schedule"]
-            with open(save_path, "w", encoding="utf-8") as f:
-                f.write("BeePlan Export\n\n")
-                for t in TIMES:
-                    f.write(f"{t}: ")
-                    row = []
-                    for d in DAYS:
-                        row.append(f"{d}={sched[d][t] or '-'}")
-                    f.write(" | ".join(row) + "\n")
-            messagebox.showinfo("Export", f"Exported to:\n{save_path}")
+            # all years when they were generated together, else the year last generated
+            results = self.all_results or {self.last_year: self.last_result}
+            formats = available_formats()
+            written = export_all(export_sessions(results, self.index), out_dir, formats,
+                                 workers=min(4, os.cpu_count() or 1))
+            note = "" if "xlsx" in formats else "\n(XLSX skipped: openpyxl is not installed.)"
+            messagebox.showinfo("Export", f"Exported {len(written)} files ({', '.join(formats)}) to:\n{out_dir}{note}")
         except Exception as e:
             messagebox.showerror("Export", str(e))
 
     def on_reset(self):
-        self.courses = []
-        self.instructors = []
-        self.classrooms = []
+        self.on_cancel_job()
+        self.names = Interner()
+        self.courses = CourseStore(self.names)
+        self.instructors = InstructorStore(self.names)
+        self.classrooms = RoomStore()
         self.last_result = None
+        self.last_year = None
+        self.all_results = {}
         self.common_xlsx_loaded = False
+        self.common = None
+        self._reindex()
+        self._index_result(None)
 
         self._set_loaded_label(self.lbl_file_instructors, False, "Instructors.json")
         self._set_loaded_label(self.lbl_file_courses, False, "Courses.json")
@@ -508,10 +640,21 @@ class BeePlanFinalApp:
 
     # -------- Scheduler Window ----------
     def open_schedule_window(self, schedule: Dict[str, Dict[str, str]]):
+        """Show a schedule in the scheduler window; the window is built once and reused."""
+        self.shown_schedule = schedule
+        if self.sched_win is None or not self.sched_win.winfo_exists():
+            self._build_schedule_window()
+        self._refresh_schedule_window()
+        self.sched_win.deiconify()
+        self.sched_win.lift()
+
+    def _build_schedule_window(self):
         win = tk.Toplevel(self.root)
         win.title("BeePlan - Department Scheduler")
         win.geometry("1180x720")
         win.configure(bg="#cfe9ff")
+        self.sched_win = win
+        ui = self.sched_ui = {}
 
         # Left sidebar (matches your UI feeling)
         sidebar = tk.Frame(win, bg="#cfe9ff", width=240)
@@ -532,18 +675,14 @@ class BeePlanFinalApp:
         side_btn("👩‍🏫  Instructor Manager", lambda: messagebox.showinfo("Instructor Manager", "Week 9 placeholder."))
         side_btn("🏫  Classroom Manager", lambda: messagebox.showinfo("Classroom Manager", "Week 9 placeholder."))
 
-        # Status card (bottom-left)
+        # Status card (bottom-left), filled in by _refresh_schedule_window
         status_card = tk.Frame(sidebar, bg="white")
         status_card.pack(side="bottom", fill="x", pady=10)
 
         tk.Label(status_card, text="STATUS", font=("Segoe UI", 12, "bold"), bg="white").pack(anchor="w", padx=12, pady=(10, 8))
-        conflicts = self.last_result["conflicts"] if self.last_result else 0
-        warnings = self.last_result["warnings"] if self.last_result else 0
-        rules_txt = f"{self.last_result['rules_passed']}/{self.last_result['rules_total']} Rules" if self.last_result else "N/A"
-
-        tk.Label(status_card, text=f"{conflicts} Conflict", font=("Segoe UI", 11, "bold"), fg="#d10000", bg="white").pack(anchor="w", padx=12, pady=2)
-        tk.Label(status_card, text=f"{warnings} Warnings", font=("Segoe UI", 11, "bold"), fg="#f39c12", bg="white").pack(anchor="w", padx=12, pady=2)
-        tk.Label(status_card, text=rules_txt, font=("Segoe UI", 11, "bold"), fg="#1aa84a", bg="white").pack(anchor="w", padx=12, pady=(2, 12))
+        for key, fg, pady in (("conflicts", "#d10000", 2), ("warnings", "#f39c12", 2), ("rules", "#1aa84a", (2, 12))):
+            ui[key] = tk.Label(status_card, font=("Segoe UI", 11, "bold"), fg=fg, bg="white")
+            ui[key].pack(anchor="w", padx=12, pady=pady)
 
         # Right main area
         main = tk.Frame(win, bg="#cfe9ff")
@@ -553,9 +692,8 @@ class BeePlanFinalApp:
         top.pack(fill="x")
 
         tk.Label(top, text="Currently Viewing:", font=("Segoe UI", 11, "bold"), bg="#cfe9ff").pack(side="left", padx=(0, 8))
-
-        year_lbl = f"{self.selected_year}st Year" if self.selected_year == 1 else f"{self.selected_year}nd Year" if self.selected_year == 2 else f"{self.selected_year}rd Year" if self.selected_year == 3 else f"{self.selected_year}th Year"
-        tk.Label(top, text=year_lbl, font=("Segoe UI", 10, "bold"), bg="white", fg="#0b4aa2", padx=10, pady=4).pack(side="left")
+        ui["year"] = tk.Label(top, font=("Segoe UI", 10, "bold"), bg="white", fg="#0b4aa2", padx=10, pady=4)
+        ui["year"].pack(side="left")
 
         tk.Label(top, text="  Week:", font=("Segoe UI", 11, "bold"), bg="#cfe9ff").pack(side="left", padx=(15, 6))
         week_combo = ttk.Combobox(top, values=["1. Week"], width=10, state="readonly")
@@ -570,76 +708,112 @@ class BeePlanFinalApp:
                   font=("Segoe UI", 10, "bold"), relief="flat",
                   padx=14, pady=8, command=self.on_view_report).pack(side="right", padx=8)
 
-        # Filters row (visual only for Week 9)
+        # Filters row: the grid layout (year week, one row per room or per
+        # instructor) and instructor / classroom filters served by the indexes
         filters = tk.Frame(main, bg="#cfe9ff")
         filters.pack(fill="x", pady=(10, 10))
 
+        tk.Label(filters, text="VIEW:", font=("Segoe UI", 10, "bold"), bg="#cfe9ff").pack(side="left", padx=(0, 6))
+        ui["view"] = tk.StringVar(value=GRID_VIEWS[0])
+        view_combo = ttk.Combobox(filters, textvariable=ui["view"], values=GRID_VIEWS, state="readonly", width=12)
+        view_combo.pack(side="left", padx=(0, 12))
+        view_combo.bind("<<ComboboxSelected>>", lambda e: self._render_timetable())
+
         tk.Label(filters, text="FILTERS:", font=("Segoe UI", 10, "bold"), bg="#cfe9ff").pack(side="left", padx=(0, 10))
-        for txt in ["Year", "Instructor", "Course", "Classroom"]:
-            tk.Label(filters, text=f"{txt}: All", font=("Segoe UI", 9, "bold"),
-                     bg="white", fg="#0b4aa2", padx=8, pady=3).pack(side="left", padx=6)
-
-        # Timetable grid (blue borders like your UI)
-        grid_wrap = tk.Frame(main, bg="#cfe9ff")
-        grid_wrap.pack(fill="both", expand=True, pady=(5, 0))
-
-        grid = tk.Frame(grid_wrap, bg="#cfe9ff")
-        grid.pack()
-
-        border_color = "#0a49b5"
-        cell_bg = "#eaf6ff"
-
-        # header row
-        tk.Label(grid, text="", bg="#cfe9ff", width=9).grid(row=0, column=0, padx=2, pady=2)
-        for c, day in enumerate(DAYS, start=1):
-            tk.Label(grid, text=day, bg=cell_bg, fg="#111",
-                     font=("Segoe UI", 10, "bold"),
-                     width=14, height=2,
-                     highlightbackground=border_color, highlightthickness=2).grid(row=0, column=c, padx=2, pady=2)
-
-        # time rows + cells
-        def cell_color(text: str) -> str:
-            if text.startswith("EXAM"):
-                return "#ffb5b5"
-            if "CENG" in text:
-                return "#2f86d6"
-            if "MATH" in text:
-                return "#7a58d6"
-            if "SENG" in text:
-                return "#f08a1a"
-            return cell_bg
-
-        def on_cell_click(day: str, time: str, text: str):
-            if not text:
+        for txt in ("Instructor", "Classroom"):
+            tk.Label(filters, text=f"{txt}:", font=("Segoe UI", 9, "bold"), bg="#cfe9ff").pack(side="left", padx=(6, 2))
+            var = tk.StringVar(value="All")
+            combo = ttk.Combobox(filters, textvariable=var, values=["All"], state="readonly", width=16)
+            combo.pack(side="left", padx=(0, 6))
+            combo.bind("<<ComboboxSelected>>", lambda e: self._render_timetable())
+            ui[txt] = (var, combo)
+
+        # Timetable: one canvas for every view (see timetable_canvas.py)
+        ui["grid"] = TimetableCanvas(main, colors=cell_colors, on_click=self._on_timetable_click)
+        ui["grid"].pack(fill="both", expand=True, pady=(5, 0))
+
+    def _refresh_schedule_window(self):
+        """Status, year and filter choices for the shown result, then the grid."""
+        ui, result = self.sched_ui, self.last_result
+        ui["conflicts"].config(text=f"{result['conflicts'] if result else 0} Conflict")
+        ui["warnings"].config(text=f"{result['warnings'] if result else 0} Warnings")
+        ui["rules"].config(text=f"{result['rules_passed']}/{result['rules_total']} Rules" if result else "N/A")
+        y = self.selected_year
+        ui["year"].config(text=f"{y}st Year" if y == 1 else f"{y}nd Year" if y == 2 else f"{y}rd Year" if y == 3 else f"{y}th Year")
+
+        shown_instructors = set()
+        for code in self.slots_of:
+            course = self.index.course(code)
+            if course is not None and course.instructor:
+                shown_instructors.add(course.instructor)
+        for txt, values in (("Instructor", sorted(shown_instructors)), ("Classroom", self._shown_rooms())):
+            var, combo = ui[txt]
+            combo.config(values=["All"] + values)
+            if var.get() not in values:
+                var.set("All")
+        self._render_timetable()
+
+    def _shown_rooms(self) -> List[str]:
+        return sorted(r for r in self.by_room if not r.startswith("TBA"))
+
+    def _render_timetable(self):
+        """
+        Year view: times x days, the schedule's cell texts. Room / Instructor
+        views: one row per room or instructor, one column per slot. Filters keep
+        the matching placements; only changed cells are repainted.
+        """
+        ui = self.sched_ui
+        view = ui["view"].get()
+        instructor, room = ui["Instructor"][0].get(), ui["Classroom"][0].get()
+
+        keep = None  # (day, time, code) placements left by the filters; None = all
+        if room != "All":
+            keep = set(self.by_room.get(room, ()))
+        if instructor != "All":
+            mine = {(d, t, c.code) for c in self.index.courses_of_instructor(instructor)
+                    for d, t in self.slots_of.get(c.code, ())}
+            keep = mine if keep is None else keep & mine
+
+        texts: Dict[Tuple, List[str]] = {}
+        if view == "Year":
+            ui["grid"].set_layout(TIMES, DAYS, cell_size=(130, 56))
+            if keep is None:
+                cells = {(t, d): self.shown_schedule[d][t] for d in DAYS for t in TIMES}
+                ui["grid"].show({k: v for k, v in cells.items() if v})
                 return
-            self.open_detail_card(day, time, text)
-
-        for r, time in enumerate(TIMES, start=1):
-            tk.Label(grid, text=time, bg=cell_bg, fg="#111",
-                     font=("Segoe UI", 10, "bold"),
-                     width=9, height=2,
-                     highlightbackground=border_color, highlightthickness=2).grid(row=r, column=0, padx=2, pady=2)
-
-            for c, day in enumerate(DAYS, start=1):
-                text = schedule[day][time]
-                bg = cell_color(text)
-                fg = "white" if bg in ["#2f86d6", "#7a58d6", "#f08a1a"] else "#111"
-                if text.startswith("EXAM"):
-                    fg = "#d10000"
-
-                lbl = tk.Label(grid, text=text, bg=bg, fg=fg,
-                               font=("Segoe UI", 9, "bold"),
-                               width=14, height=3,
-                               justify="center",
-                               highlightbackground=border_color, highlightthickness=2)
-                lbl.grid(row=r, column=c, padx=2, pady=2)
-                lbl.bind("<Button-1>", lambda e, dd=day, tt=time, tx=text: on_cell_click(dd, tt, tx))
+            for day, time, code in keep:
+                texts.setdefault((time, day), []).append(f"{code}\n(Lab)" if is_lab_code(code) else code)
+        else:
+            placements = keep if keep is not None else self.room_of.keys()
+            by_row: Dict[str, List[Tuple[str, str, str]]] = {}
+            for day, time, code in placements:
+                if view == "Room":
+                    row = self.room_of.get((day, time, code), "")
+                    if row.startswith("TBA"):
+                        continue
+                else:
+                    course = self.index.course(code)
+                    row = course.instructor if course is not None else ""
+                if row:
+                    by_row.setdefault(row, []).append((day, time, code))
+            rows = sorted(by_row)
+            ui["grid"].set_layout(rows, SLOTS, column_labels=[f"{d}\n{t}" for d, t in SLOTS], cell_size=(84, 44))
+            for row, items in by_row.items():
+                for day, time, code in items:
+                    texts.setdefault((row, (day, time)), []).append(code)
+        ui["grid"].show({key: "\n".join(sorted(v)) for key, v in texts.items()})
+
+    def _on_timetable_click(self, row, column, text: str):
+        if not text:
+            return
+        day, time = (column, row) if self.sched_ui["view"].get() == "Year" else column
+        self.open_detail_card(day, time, text)
 
     # -------- Detail Card ----------
     def open_detail_card(self, day: str, time: str, text: str):
         card = tk.Toplevel(self.root)
         card.title("Course Detail")
-        card.geometry("420x260")
+        card.geometry("420x320")
         card.configure(bg="#cfe9ff")
 
         box = tk.Frame(card, bg="white")
@@ -649,19 +823,22 @@ class BeePlanFinalApp:
         tk.Label(box, text=title, font=("Segoe UI", 13, "bold"), bg="white", fg="#0b4aa2").pack(anchor="w", padx=12, pady=(12, 8))
         tk.Label(box, text=f"🕒 Time: {day} {time}", font=("Segoe UI", 11), bg="white").pack(anchor="w", padx=12, pady=4)
 
-        # Try to find course object to show more info
+        # Look the course up in the indexes to show more info
         code = title.split()[0].strip()
-        found = None
-        for c in self.courses:
-            if c.code == code:
-                found = c
-                break
+        found = self.index.course(code)
 
         if found:
             tk.Label(box, text=f"📌 Name: {found.name or '-'}", font=("Segoe UI", 11), bg="white").pack(anchor="w", padx=12, pady=4)
             tk.Label(box, text=f"👩‍🏫 Instructor: {found.instructor or '-'}", font=("Segoe UI", 11), bg="white").pack(anchor="w", padx=12, pady=4)
             tk.Label(box, text=f"🎓 Year: {found.year}", font=("Segoe UI", 11), bg="white").pack(anchor="w", padx=12, pady=4)
             tk.Label(box, text=f"👥 Students: {found.students}", font=("Segoe UI", 11), bg="white").pack(anchor="w", padx=12, pady=4)
+            room = self.room_of.get((day, time, code))
+            if room and not room.startswith("TBA"):
+                tk.Label(box, text=f"🏫 Room: {room}", font=("Segoe UI", 11), bg="white").pack(anchor="w", padx=12, pady=4)
+            if found.instructor:
+                load = len(self.index.by_instructor.get(found.instructor, ()))
+                known = "" if self.index.instructor(found.instructor) or not self.instructors else " (not in Instructors file)"
+                tk.Label(box, text=f"📚 Teaches {load} course(s){known}", font=("Segoe UI", 11), bg="white").pack(anchor="w", padx=12, pady=4)
         else:
             tk.Label(box, text="(Details from loaded data not found)", font=("Segoe UI", 11), bg="white").pack(anchor="w", padx=12, pady=8)
 
@@ -681,39 +858,87 @@ class BeePlanFinalApp:
         summary = tk.Frame(box, bg="white")
         summary.pack(fill="x", padx=20, pady=10)
 
-        tk.Label(summary, text=f"🔴 Critical Issues: {result['critical']}", font=("Segoe UI", 12, "bold"),
+        # schedule issues of this result; input findings (shared by the years of a run) apart
+        report: IssueReport = result["issues"]
+        inputs: IssueReport = result.get("input_issues") or IssueReport()
+        tk.Label(summary, text=f"🔴 Critical Issues: {report.count(CRITICAL)}", font=("Segoe UI", 12, "bold"),
                  bg="white", fg="#d10000").pack(side="left", padx=10)
-        tk.Label(summary, text=f"🟠 Warnings: {result['warnings']}", font=("Segoe UI", 12, "bold"),
+        tk.Label(summary, text=f"🟠 Warnings: {report.count(WARNING)}", font=("Segoe UI", 12, "bold"),
                  bg="white", fg="#f39c12").pack(side="left", padx=10)
+        tk.Label(summary, text=f"📋 Input Findings: {len(inputs)}", font=("Segoe UI", 12, "bold"),
+                 bg="white", fg="#1665c1").pack(side="left", padx=10)
         compliance = int((result["rules_passed"] / max(1, result["rules_total"])) * 100)
         tk.Label(summary, text=f"✅ {compliance}% Compliance", font=("Segoe UI", 12, "bold"),
                  bg="white", fg="#1aa84a").pack(side="left", padx=10)
 
         ttk.Separator(box, orient="horizontal").pack(fill="x", padx=20, pady=15)
 
-        # Issues detail (simple Week 9 placeholder)
+        # Issues detail: one page of the precomputed issue report at a time
         issues = tk.Frame(box, bg="white")
         issues.pack(fill="both", expand=True, padx=25, pady=10)
 
-        tk.Label(issues, text="ISSUES DETAIL", font=("Segoe UI", 14, "bold"), bg="white").pack(anchor="w", pady=(0, 10))
-
-        text = tk.Text(issues, height=18, font=("Consolas", 11))
-        text.pack(fill="both", expand=True)
-
-        # Fill with something meaningful
-        text.insert("end", "CRITICAL ISSUES:\n")
-        if result["conflicts"] > 0:
-            text.insert("end", f"1) Not enough free slots for all courses. Conflicts={result['conflicts']}\n")
-            text.insert("end", "   Solution: Move some courses to other days/times or add more slots.\n\n")
-        else:
-            text.insert("end", "None\n\n")
-
-        text.insert("end", "WARNINGS:\n")
-        text.insert("end", "1) Week 9 prototype uses a simple heuristic.\n")
-        text.insert("end", "   Solution: Improve rules and constraints in later weeks.\n\n")
-
-        text.insert("end", f"SUMMARY:\nScheduled Courses: {result['scheduled_courses']}\nRules Passed: {result['rules_passed']}/{result['rules_total']}\n")
-        text.configure(state="disabled")
+        head = tk.Frame(issues, bg="white")
+        head.pack(fill="x", pady=(0, 10))
+        tk.Label(head, text="ISSUES DETAIL", font=("Segoe UI", 14, "bold"), bg="white").pack(side="left")
+
+        groups = {f"All ({len(report)})": (report, "")}  # label -> (report, group)
+        for severity in (CRITICAL, WARNING):
+            groups[f"{severity.capitalize()} ({report.count(severity)})"] = (report, severity)
+        for kind, count in report.type_counts().items():
+            groups[f"{kind.replace('_', ' ').capitalize()} ({count})"] = (report, kind)
+        if inputs:
+            groups[f"Inputs ({len(inputs)})"] = (inputs, "")
+        group_var = tk.StringVar(value=next(iter(groups)))
+        ttk.Combobox(head, textvariable=group_var, values=list(groups), state="readonly",
+                     width=28).pack(side="right")
+
+        columns = ("severity", "type", "day", "time", "course", "room", "instructor", "message")
+        widths = (80, 130, 85, 55, 110, 90, 130, 420)
+        table = tk.Frame(issues, bg="white")
+        table.pack(fill="both", expand=True)
+        tree = ttk.Treeview(table, columns=columns, show="headings", height=14)
+        for col, width in zip(columns, widths):
+            tree.heading(col, text=col.capitalize())
+            tree.column(col, width=width, stretch=col == "message", anchor="w")
+        tree.tag_configure(CRITICAL, foreground="#d10000")
+        tree.tag_configure(WARNING, foreground="#b86e00")
+        ysb = ttk.Scrollbar(table, orient="vertical", command=tree.yview)
+        xsb = ttk.Scrollbar(table, orient="horizontal", command=tree.xview)
+        tree.configure(yscrollcommand=ysb.set, xscrollcommand=xsb.set)
+        tree.grid(row=0, column=0, sticky="nsew")
+        ysb.grid(row=0, column=1, sticky="ns")
+        xsb.grid(row=1, column=0, sticky="ew")
+        table.grid_rowconfigure(0, weight=1)
+        table.grid_columnconfigure(0, weight=1)
+
+        pager = tk.Frame(issues, bg="white")
+        pager.pack(fill="x", pady=(8, 0))
+        page = {"number": 0}
+        page_lbl = tk.Label(pager, font=("Segoe UI", 10), bg="white")
+
+        def show_page(number: int):
+            shown, group = groups[group_var.get()]
+            number = max(0, min(number, shown.page_count(ISSUES_PER_PAGE, group) - 1))
+            page["number"] = number
+            tree.delete(*tree.get_children())
+            for issue in shown.page(number, ISSUES_PER_PAGE, group):
+                tree.insert("", "end", tags=(issue.severity,), values=(
+                    issue.severity, issue.type, issue.day, issue.time, issue.course,
+                    issue.room, issue.instructor, issue.message))
+            tree.yview_moveto(0)
+            page_lbl.config(text=f"Page {number + 1} of {shown.page_count(ISSUES_PER_PAGE, group)}")
+
+        tk.Button(pager, text="◀ Prev", font=("Segoe UI", 10, "bold"), bg="#eaf6ff", relief="flat",
+                  command=lambda: show_page(page["number"] - 1)).pack(side="left")
+        page_lbl.pack(side="left", padx=12)
+        tk.Button(pager, text="Next ▶", font=("Segoe UI", 10, "bold"), bg="#eaf6ff", relief="flat",
+                  command=lambda: show_page(page["number"] + 1)).pack(side="left")
+        tk.Label(pager, text=f"Scheduled Courses: {result['scheduled_courses']}   "
+                             f"Rules Passed: {result['rules_passed']}/{result['rules_total']}",
+                 font=("Segoe UI", 10, "bold"), bg="white").pack(side="right")
+
+        group_var.trace_add("write", lambda *_: show_page(0))
+        show_page(0)
 
     def run(self):
         self.root.mainloop()
@@ -0,0 +1,392 @@
+"""
+BeePlan command line (headless).
+
+    python beeplan.py schedule --folder data/ --out out/
+    python beeplan.py schedule --courses Courses.csv --classrooms Classrooms.json --year 2 --engine csp
+    python beeplan.py batch departments.json --out out/ --workers 4
+
+Inputs are the dashboard's files (Courses / Instructors / Classrooms as JSON
+or CSV, optional CommonSchedule.xlsx), given one by one or found in a folder.
+The schedule and the report are written to --out as JSON and/or CSV:
+- schedule.json / schedule.csv: every placement (day, time, course, instructor, room, year)
+- report.json / report.csv: per-year counts and issue records (scheduling conflicts,
+  unplaced courses, cross-year clashes) plus input validation findings
+The batch command schedules many departments (a manifest of input folders)
+in a process pool: one output folder per department plus summary.json /
+summary.csv. A department that fails is recorded in the summary and the rest
+of the batch carries on.
+Only argparse and the standard library load at start-up; the scheduling core
+is imported when a command runs.
+"""
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import time
+from typing import Dict, List, Optional
+
+FORMATS = ("json", "csv")
+INPUT_KINDS = ("courses", "instructors", "classrooms", "common")
+SUMMARY_FIELDS = ["name", "status", "folder", "placed", "conflicts", "warnings", "seconds", "error"]
+
+
+def load_inputs(paths: Dict[str, str], cache: bool = True) -> Dict[str, object]:
+    """kind -> loaded data (column stores, CommonSchedule or None) for the given kind -> path map."""
+    from beeplan_core import load_cached, parse_file
+    from common_schedule import load_common_schedule
+    from entity_store import CourseStore, InstructorStore, Interner, RoomStore
+
+    load = load_cached if cache else parse_file
+    names = Interner()
+    data: Dict[str, object] = {
+        "courses": CourseStore(names),
+        "instructors": InstructorStore(names),
+        "classrooms": RoomStore(),
+        "common": None,
+    }
+    if "courses" in paths:
+        data["courses"] = CourseStore.from_courses(load(paths["courses"], "courses"), names)
+    if "instructors" in paths:
+        data["instructors"] = InstructorStore.from_instructors(load(paths["instructors"], "instructors"), names)
+    if "classrooms" in paths:
+        data["classrooms"] = RoomStore.from_classrooms(load(paths["classrooms"], "classrooms"))
+    if "common" in paths:
+        data["common"] = load_common_schedule(paths["common"])
+    return data
+
+
+def schedule_files(paths: Dict[str, str], out_dir: str, year: Optional[int] = None, engine: str = "greedy",
+                   formats=FORMATS, workers: Optional[int] = None, cache: bool = True) -> Dict:
+    """
+    Load, schedule (one year, or every year present) and write the outputs.
+    Returns a summary: per-year counts, totals, seconds spent and the files written.
+    """
+    from dataclasses import asdict
+
+    from beeplan_core import export_sessions, generate_all_years, generate_schedule
+    from entity_store import EntityIndex
+    from validation import finding_issues, summarize, validate_inputs
+
+    start = time.perf_counter()
+    data = load_inputs(paths, cache)
+    courses = data["courses"]
+    if not len(courses):
+        raise ValueError("No courses to schedule (give --courses or a folder with a Courses file).")
+    loaded = time.perf_counter()
+
+    classrooms = data["classrooms"] or None
+    if year is not None:
+        results = {year: generate_schedule(courses, year_filter=year, classrooms=classrooms, engine=engine,
+                                           common=data["common"], instructors=data["instructors"])}
+    else:
+        years = tuple(sorted(set(courses.years)))
+        results = generate_all_years(courses, years=years, workers=workers, classrooms=classrooms,
+                                     engine=engine, common=data["common"], instructors=data["instructors"])
+    scheduled = time.perf_counter()
+
+    findings = validate_inputs(courses, data["instructors"], data["classrooms"])
+    index = EntityIndex(courses, data["instructors"])
+    sessions = export_sessions(results, index)
+    summary = {
+        "engine": engine,
+        "years": {
+            str(y): {
+                "courses": len(index.by_year.get(y, ())),
+                "placed": r["scheduled_courses"],
+                "conflicts": r["conflicts"],
+                "warnings": r["warnings"],
+                "clashes": len(r.get("clashes", ())),
+                "issues": r["issues"].type_counts(),
+            }
+            for y, r in results.items()
+        },
+        "placed": sum(r["scheduled_courses"] for r in results.values()),
+        "conflicts": sum(r["conflicts"] for r in results.values()),
+        "findings": summarize(findings),
+    }
+
+    os.makedirs(out_dir, exist_ok=True)
+    files: List[str] = []
+    if "json" in formats:
+        files.append(os.path.join(out_dir, "schedule.json"))
+        with open(files[-1], "w", encoding="utf-8") as f:
+            json.dump({"summary": summary, "placements": [asdict(s) for s in sessions]}, f, ensure_ascii=False)
+        files.append(os.path.join(out_dir, "report.json"))
+        with open(files[-1], "w", encoding="utf-8") as f:
+            json.dump({
+                "summary": summary,
+                "years": {str(y): {"issues": [dict(asdict(i), message=i.message) for i in r["issues"].issues]}
+                          for y, r in results.items()},
+                "findings": [asdict(fd) for fd in findings],
+            }, f, ensure_ascii=False, indent=1)
+    if "csv" in formats:
+        from exporter import write_csv
+
+        files.append(os.path.join(out_dir, "schedule.csv"))
+        write_csv(files[-1], sessions)
+        files.append(os.path.join(out_dir, "report.csv"))
+        with open(files[-1], "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Year", "Source", "Severity", "Type", "Day", "Time", "Course", "Room", "Instructor", "Message"])
+            rows = [(y, "engine", r["issues"].issues) for y, r in results.items()] + [("", "validation", finding_issues(findings))]
+            for y, source, issues in rows:
+                for i in issues:
+                    writer.writerow([y, source, i.severity, i.type, i.day, i.time, i.course, i.room, i.instructor, i.message])
+
+    summary["seconds"] = {"load": round(loaded - start, 3), "schedule": round(scheduled - loaded, 3),
+                          "total": round(time.perf_counter() - start, 3)}
+    summary["files"] = files
+    return summary
+
+
+def input_paths(args) -> Dict[str, str]:
+    """kind -> path from --folder (discovered) overridden by explicit file options."""
+    paths: Dict[str, str] = {}
+    if args.folder:
+        from beeplan_core import discover_data_files
+
+        paths.update(discover_data_files(args.folder))
+    for kind in INPUT_KINDS:
+        if getattr(args, kind):
+            paths[kind] = getattr(args, kind)
+    return paths
+
+
+def cmd_schedule(args) -> int:
+    paths = input_paths(args)
+    summary = schedule_files(paths, args.out, year=args.year, engine=args.engine, formats=args.format,
+                             workers=args.workers, cache=not args.no_cache)
+    for y, counts in summary["years"].items():
+        print(f"Year {y}: {counts['placed']}/{counts['courses']} placed, {counts['conflicts']} conflicts, "
+              f"{counts['warnings']} warnings")
+    print(f"Wrote {len(summary['files'])} files to {args.out} in {summary['seconds']['total']:.2f}s")
+    return 0
+
+
+# -----------------------------
+# Batch (many departments)
+# - Manifest: JSON ({"departments": [...]} or a list) with name / folder and
+#   optional year / engine per department, or a text file with one folder
+#   per line (# starts a comment); paths are relative to the manifest
+# - Departments run in a process pool; each one schedules its years in its
+#   own worker, with no nested pool
+# -----------------------------
+def read_manifest(path: str) -> List[Dict]:
+    """Departments of a manifest: dicts with name, folder and optional year / engine."""
+    base = os.path.dirname(os.path.abspath(path))
+    with open(path, "r", encoding="utf-8-sig") as f:
+        text = f.read()
+    if path.lower().endswith(".json"):
+        data = json.loads(text)
+        entries = data.get("departments", []) if isinstance(data, dict) else data
+        entries = [{"folder": e} if isinstance(e, str) else dict(e) for e in entries]
+    else:
+        lines = (line.split("#", 1)[0].strip() for line in text.splitlines())
+        entries = [{"folder": line} for line in lines if line]
+
+    departments: List[Dict] = []
+    taken: Dict[str, int] = {}
+    for e in entries:
+        if not e.get("folder"):
+            raise ValueError(f"{path}: every department needs a folder ({e!r}).")
+        folder = os.path.join(base, e["folder"])
+        name = str(e.get("name") or os.path.basename(os.path.normpath(folder)))
+        slug = re.sub(r"[^\w.-]+", "_", name).strip("_") or "department"
+        taken[slug] = taken.get(slug, 0) + 1
+        if taken[slug] > 1:  # two departments with the same name get separate outputs
+            slug = f"{slug}_{taken[slug]}"
+        departments.append({"name": name, "slug": slug, "folder": folder,
+                             "year": e.get("year"), "engine": e.get("engine")})
+    return departments
+
+
+def _row(dept: Dict, status: str = "failed", error: str = "") -> Dict:
+    return {"name": dept["name"], "status": status, "folder": dept["folder"],
+            "placed": 0, "conflicts": 0, "warnings": 0, "seconds": 0.0, "error": error}
+
+
+def _running_marker(out_dir: str, dept: Dict) -> str:
+    """File that exists while the department runs; left behind if its process dies."""
+    return os.path.join(out_dir, f".{dept['slug']}.running")
+
+
+def run_department(dept: Dict, out_dir: str, engine: str = "greedy", formats=FORMATS, cache: bool = True) -> Dict:
+    """Schedule one department into out_dir/<slug>; never raises, failures become a summary row."""
+    start = time.perf_counter()
+    row = _row(dept)
+    marker = _running_marker(out_dir, dept)
+    try:
+        os.makedirs(out_dir, exist_ok=True)
+        open(marker, "w").close()
+        from beeplan_core import discover_data_files
+
+        summary = schedule_files(discover_data_files(dept["folder"]), os.path.join(out_dir, dept["slug"]),
+                                 year=dept.get("year"), engine=dept.get("engine") or engine,
+                                 formats=formats, workers=1, cache=cache)
+    except Exception as e:
+        row["error"] = f"{type(e).__name__}: {e}"
+    else:
+        row.update(status="ok", placed=summary["placed"], conflicts=summary["conflicts"],
+                   warnings=sum(y["warnings"] for y in summary["years"].values()), years=summary["years"])
+    finally:
+        if os.path.exists(marker):
+            os.remove(marker)
+    row["seconds"] = round(time.perf_counter() - start, 3)
+    return row
+
+
+def run_batch(departments: List[Dict], out_dir: str, workers: Optional[int] = None, engine: str = "greedy",
+              formats=FORMATS, cache: bool = True, on_done=None) -> List[Dict]:
+    """
+    Run every department; returns their summary rows in manifest order.
+    workers > 1 uses a process pool. If a worker process dies (e.g. out of
+    memory), the departments it took down with the pool are re-submitted to a
+    fresh pool of the same size. A department that was running when a pool
+    died twice is re-run alone, and marked failed if its process dies again.
+    Departments still queued at a break do not count against themselves.
+    on_done(row) is called as each department finishes.
+    """
+    rows: Dict[int, Dict] = {}
+
+    def done(i: int, row: Dict) -> None:
+        rows[i] = row
+        if on_done is not None:
+            on_done(row)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1 and len(departments) > 1:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        from concurrent.futures.process import BrokenProcessPool
+
+        def pooled(indices: List[int], size: int) -> List[int]:
+            """Run the departments in one pool; returns those lost to a broken pool."""
+            lost: List[int] = []
+            with ProcessPoolExecutor(max_workers=size) as ex:
+                futures = {ex.submit(run_department, departments[i], out_dir, engine, formats, cache): i
+                           for i in indices}
+                for fut in as_completed(futures):
+                    i = futures[fut]
+                    try:
+                        done(i, fut.result())
+                    except BrokenProcessPool:
+                        lost.append(i)
+                    except Exception as e:  # e.g. a result that cannot be sent back
+                        done(i, _row(departments[i], error=f"{type(e).__name__}: {e}"))
+            return lost
+
+        strikes: Dict[int, int] = {}
+        isolate: List[int] = []
+        pending = list(range(len(departments)))
+        while pending:
+            lost = sorted(pooled(pending, min(workers, len(pending))))
+            running = []
+            for i in lost:
+                marker = _running_marker(out_dir, departments[i])
+                if os.path.exists(marker):
+                    running.append(i)
+                    os.remove(marker)
+            for i in running or lost:  # no marker at all: the pool died before any started
+                strikes[i] = strikes.get(i, 0) + 1
+            isolate.extend(i for i in lost if strikes.get(i, 0) >= 2)
+            pending = [i for i in lost if strikes.get(i, 0) < 2]
+        for i in isolate:
+            for j in pooled([i], 1):
+                marker = _running_marker(out_dir, departments[j])
+                if os.path.exists(marker):
+                    os.remove(marker)
+                done(j, _row(departments[j], error="worker process died"))
+    else:
+        for i, dept in enumerate(departments):
+            done(i, run_department(dept, out_dir, engine, formats, cache))
+    return [rows[i] for i in range(len(departments))]
+
+
+def write_batch_summary(rows: List[Dict], out_dir: str, seconds: float) -> List[str]:
+    """summary.json (totals + one entry per department) and summary.csv; returns the paths."""
+    os.makedirs(out_dir, exist_ok=True)
+    totals = {
+        "departments": len(rows),
+        "ok": sum(r["status"] == "ok" for r in rows),
+        "failed": sum(r["status"] != "ok" for r in rows),
+        "placed": sum(r["placed"] for r in rows),
+        "conflicts": sum(r["conflicts"] for r in rows),
+        "warnings": sum(r["warnings"] for r in rows),
+        "seconds": round(seconds, 3),
+    }
+    json_path = os.path.join(out_dir, "summary.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump({"totals": totals, "departments": rows}, f, ensure_ascii=False, indent=1)
+    csv_path = os.path.join(out_dir, "summary.csv")
+    with open(csv_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+    return [json_path, csv_path]
+
+
+def cmd_batch(args) -> int:
+    departments = read_manifest(args.manifest)
+    if not departments:
+        raise ValueError(f"{args.manifest}: no departments listed.")
+    start = time.perf_counter()
+    finished = [0]
+
+    def report(row: Dict) -> None:
+        finished[0] += 1
+        detail = (f"{row['placed']} placed, {row['conflicts']} conflicts" if row["status"] == "ok"
+                  else f"FAILED: {row['error']}")
+        print(f"[{finished[0]}/{len(departments)}] {row['name']}: {detail} ({row['seconds']:.2f}s)", flush=True)
+
+    rows = run_batch(departments, args.out, workers=args.workers, engine=args.engine,
+                     formats=args.format, cache=not args.no_cache, on_done=report)
+    write_batch_summary(rows, args.out, time.perf_counter() - start)
+    failed = sum(r["status"] != "ok" for r in rows)
+    print(f"{len(rows) - failed}/{len(rows)} departments scheduled; summary in {args.out}")
+    return 1 if failed else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="beeplan", description="BeePlan course scheduler (headless).")
+    sub = parser.add_subparsers(dest="command")
+    sub.required = True
+
+    p = sub.add_parser("schedule", help="schedule one department's input files")
+    p.add_argument("--folder", help="folder with Courses / Instructors / Classrooms (.json or .csv) and CommonSchedule.xlsx")
+    p.add_argument("--courses", help="Courses file (.json or .csv)")
+    p.add_argument("--instructors", help="Instructors file (.json or .csv)")
+    p.add_argument("--classrooms", help="Classrooms file (.json or .csv)")
+    p.add_argument("--common", help="CommonSchedule.xlsx (needs openpyxl)")
+    p.add_argument("--year", type=int, help="schedule only this year (default: every year in the courses)")
+    # engine names are checked when the run starts, so --help does not import the engines
+    p.add_argument("--engine", default="greedy", help="scheduling engine: greedy, csp or anneal (default: greedy)")
+    p.add_argument("--format", nargs="+", choices=FORMATS, default=list(FORMATS), help="output formats")
+    p.add_argument("--out", default="beeplan_out", help="output folder (default: beeplan_out)")
+    p.add_argument("--workers", type=int, help="worker processes for the year runs (default: one per CPU)")
+    p.add_argument("--no-cache", action="store_true", help="parse inputs without the on-disk parse cache")
+    p.set_defaults(func=cmd_schedule)
+
+    p = sub.add_parser("batch", help="schedule every department of a manifest in parallel")
+    p.add_argument("manifest", help="JSON ({\"departments\": [{\"name\", \"folder\", ...}]}) or text file, one folder per line")
+    p.add_argument("--out", default="beeplan_batch", help="output folder (default: beeplan_batch)")
+    p.add_argument("--workers", type=int, help="departments scheduled at once (default: one per CPU)")
+    p.add_argument("--engine", default="greedy", help="engine for departments that do not name one (default: greedy)")
+    p.add_argument("--format", nargs="+", choices=FORMATS, default=list(FORMATS), help="output formats")
+    p.add_argument("--no-cache", action="store_true", help="parse inputs without the on-disk parse cache")
+    p.set_defaults(func=cmd_batch)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"beeplan: error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
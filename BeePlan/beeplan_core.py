@@ -0,0 +1,781 @@
+"""
+Headless BeePlan core: the dashboard's data models, loaders and scheduling
+entry points, importable without tkinter or openpyxl.
+
+beeplan_app (the Tkinter dashboard) and beeplan_cli (command line) are both
+built on this module. Heavy or optional dependencies load on first use:
+openpyxl when a CommonSchedule.xlsx is read, multiprocessing when a process
+pool is started.
+"""
+import os
+import json
+import csv
+import io
+import mmap
+import operator
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from engine import ScheduleResult, availability_from_app, is_lab_code, model_from_app, run_app
+from entity_store import EntityIndex, courses_of_year
+from exporter import Session
+from common_schedule import CommonSchedule, CommonSession, load_common_schedule
+from input_cache import ParsedInputCache
+from issues import CRITICAL, ROOM_OVERLAP, YEAR_CLASH, Issue, IssueReport
+from scheduler import BLOCKED, DAYS as SLOT_DAYS, TIMES as SLOT_TIMES, Progress, Reservations, RoomIndex, slot_bit
+
+
+# -----------------------------
+# Constants (Timetable)
+# -----------------------------
+DAYS = ["MON", "TUE", "WED", "THU", "FRI"]
+TIMES = ["9:20", "10:20", "11:20", "12:20", "13:20", "14:20", "15:20", "16:20"]
+
+# Exam block: every slot the engines keep closed (scheduler.BLOCKED) shows it
+EXAM_BLOCK = {(DAYS[d], TIMES[t]): "EXAM\nBLOCK\n(13:20-15:10)" for d, t in sorted(BLOCKED)}
+
+# -----------------------------
+# Data models
+# -----------------------------
+@dataclass
+class Course:
+    code: str
+    name: str = ""
+    year: int = 1
+    students: int = 0
+    hours: int = 1
+    instructor: str = ""  # name/id string
+
+
+@dataclass
+class Instructor:
+    name: str
+    available: Optional[List[Tuple[str, str]]] = None  # list of (day,time); unparsed entries stay raw strings
+
+
+@dataclass
+class Classroom:
+    name: str
+    capacity: int = 0
+
+
+# -----------------------------
+# Helpers: flexible key getter
+# -----------------------------
+def pick(d: dict, *keys: str, default=None):
+    """Pick first matching key in dict (case-insensitive + common variants)."""
+    if not isinstance(d, dict):
+        return default
+    lower_map = {str(k).lower(): k for k in d.keys()}
+    for k in keys:
+        k2 = str(k).lower()
+        if k2 in lower_map:
+            return d[lower_map[k2]]
+    return default
+
+
+class RowSchema:
+    """
+    pick() aliases compiled per key layout.
+    Each distinct tuple of row keys is resolved once (same rules as pick) into an
+    itemgetter, so CSV rows - which all share the header layout - cost one
+    cached lookup plus a C-level getter. Heterogeneous JSON objects just add
+    layouts to the cache.
+    """
+
+    MAX_LAYOUTS = 256
+
+    def __init__(self, fields: List[Tuple[Tuple[str, ...], object]]):
+        self.fields = fields  # [(aliases, default)] in output order
+        self._getters: Dict[tuple, object] = {}
+
+    def _compile(self, row: dict):
+        lower_map = {str(k).lower(): k for k in row.keys()}
+        keys = []
+        for aliases, _ in self.fields:
+            keys.append(next((lower_map[a.lower()] for a in aliases if a.lower() in lower_map), None))
+        present = [i for i, k in enumerate(keys) if k is not None]
+        defaults = [d for _, d in self.fields]
+        if not present:
+            return lambda r: tuple(defaults)
+        get = operator.itemgetter(*[keys[i] for i in present])
+        if len(present) == len(keys):
+            return get if len(keys) > 1 else (lambda r: (get(r),))
+
+        def fill(r, get=get, single=len(present) == 1):
+            vals = list(defaults)
+            got = (get(r),) if single else get(r)
+            for i, v in zip(present, got):
+                vals[i] = v
+            return vals
+        return fill
+
+    def values(self, row: dict):
+        layout = tuple(row.keys())
+        getter = self._getters.get(layout)
+        if getter is None:
+            getter = self._compile(row)
+            if len(self._getters) < self.MAX_LAYOUTS:
+                self._getters[layout] = getter
+        return getter(row)
+
+
+def to_int(x, default=0):
+    try:
+        return int(float(str(x).strip()))
+    except Exception:
+        return default
+
+
+# -----------------------------
+# Loaders (JSON/CSV)
+# -----------------------------
+def load_json_or_csv(path: str) -> List[dict]:
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        # accept either list or {"items":[...]}
+        if isinstance(data, dict):
+            if "items" in data and isinstance(data["items"], list):
+                return data["items"]
+            # try common keys
+            for k in ["courses", "instructors", "classrooms", "data"]:
+                if k in data and isinstance(data[k], list):
+                    return data[k]
+            # single object -> list
+            return [data]
+        if isinstance(data, list):
+            return data
+        return []
+    elif ext == ".csv":
+        out: List[dict] = []
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                out.append(row)
+        return out
+    else:
+        raise ValueError("Only JSON or CSV supported.")
+
+
+# -----------------------------
+# Streaming loaders (generators)
+# - Records are yielded while the file is read, so peak memory stays flat
+# -----------------------------
+LIST_KEYS = ("items", "courses", "instructors", "classrooms", "data")
+
+
+_JSON_DELIMITERS = ",]} \t\r\n"
+
+
+class _JsonStream:
+    """Buffered reader that decodes one JSON value at a time from a text file."""
+
+    def __init__(self, f, chunk_size: int = 1 << 16):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self, size: int = 0) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(max(size, self.chunk_size))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of file)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def take(self, ch: str) -> None:
+        if self.peek() != ch:
+            raise ValueError(f"Invalid JSON: expected {ch!r} at offset {self.pos}")
+        self.pos += 1
+
+    def value(self):
+        # numbers and literals have no closing character: "1." decodes as 1, so
+        # one is only complete once a delimiter (or the end of file) follows it
+        scalar = self.peek() not in '{["'
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # incomplete value: grow the buffer geometrically and retry
+                if self._fill(len(self.buf) - self.pos):
+                    continue
+                raise
+            if scalar and (end == len(self.buf) or self.buf[end] not in _JSON_DELIMITERS) and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+    def array_items(self) -> Iterator:
+        self.take("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.take("]")
+            return
+
+
+def iter_json_or_csv(path: str) -> Iterator[dict]:
+    """
+    Streaming counterpart of load_json_or_csv: yields rows as the file is read.
+    JSON: a top-level list, or the first list under items/courses/instructors/
+    classrooms/data (in file order); an object without such a list is one row.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            stream = _JsonStream(f)
+            head = stream.peek()
+            if head == "[":
+                yield from stream.array_items()
+                return
+            if head != "{":
+                return
+            stream.take("{")
+            seen: Dict = {}
+            while stream.peek() != "}":
+                if seen:
+                    stream.take(",")
+                key = stream.value()
+                stream.take(":")
+                if key in LIST_KEYS and stream.peek() == "[":
+                    yield from stream.array_items()
+                    return
+                seen[key] = stream.value()
+            yield seen
+    elif ext == ".csv":
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            yield from csv.DictReader(f)
+    else:
+        raise ValueError("Only JSON or CSV supported.")
+
+
+COURSE_FIELDS = [
+    (("code", "courseCode", "course_code", "CourseCode"), ""),
+    (("name", "course"), ""),  # code fallback
+    (("title", "courseName", "course_name", "name"), ""),
+    (("year", "classYear", "grade"), 1),
+    (("students", "studentCount", "capacityNeeded", "enrolled"), 0),
+    (("hours", "duration", "weeklyHours"), 1),
+    (("instructor", "instructorName", "teacher", "lecturer"), ""),
+]
+INSTRUCTOR_FIELDS = [
+    (("name", "instructor", "instructorName", "teacher", "lecturer"), ""),
+    (("available", "availability", "slots"), None),
+]
+CLASSROOM_FIELDS = [
+    (("name", "room", "classroom", "id", "roomId", "roomName"), ""),
+    (("capacity", "kontenjan", "roomCapacity", "cap", "quota", "size"), 0),
+]
+
+
+def iter_courses(rows: Iterable[dict]) -> Iterator[Course]:
+    schema = RowSchema(COURSE_FIELDS)
+    for r in rows:
+        if not isinstance(r, dict):
+            continue
+        code, alt_code, name, year, students, hours, instructor = schema.values(r)
+        code = str(code).strip()
+        if not code:
+            # try 'name' as code fallback
+            code = str(alt_code).strip()
+        if not code:
+            continue
+        yield Course(code=code, name=str(name).strip(), year=to_int(year, 1), students=to_int(students, 0),
+                     hours=max(1, to_int(hours, 1)), instructor=str(instructor).strip())
+
+
+def iter_instructors(rows: Iterable[dict]) -> Iterator[Instructor]:
+    schema = RowSchema(INSTRUCTOR_FIELDS)
+    for r in rows:
+        if not isinstance(r, dict):
+            continue
+        name, avail = schema.values(r)
+        name = str(name).strip()
+        if not name:
+            continue
+        # optional availability
+        parsed_avail = None
+        if isinstance(avail, list):
+            tmp = []
+            for item in avail:
+                if isinstance(item, dict):
+                    d = str(pick(item, "day", default="")).upper()
+                    t = str(pick(item, "time", default=""))
+                    tmp.append((d, t))  # a missing day or time is left for validation to report
+                elif isinstance(item, str) and "-" in item:
+                    # "MON-9:20"
+                    parts = item.split("-", 1)
+                    tmp.append((parts[0].strip().upper(), parts[1].strip()))
+                else:
+                    tmp.append(str(item).strip())  # kept raw so validation can report it
+            parsed_avail = tmp if tmp else None
+
+        yield Instructor(name=name, available=parsed_avail)
+
+
+def iter_classrooms(rows: Iterable[dict]) -> Iterator[Classroom]:
+    schema = RowSchema(CLASSROOM_FIELDS)
+    for r in rows:
+        if not isinstance(r, dict):
+            continue
+        name, cap = schema.values(r)
+        name = str(name).strip()
+        if not name:
+            continue
+        yield Classroom(name=name, capacity=to_int(cap, 0))
+
+
+def parse_courses(rows: Iterable[dict]) -> List[Course]:
+    return list(iter_courses(rows))
+
+
+def parse_instructors(rows: Iterable[dict]) -> List[Instructor]:
+    return list(iter_instructors(rows))
+
+
+def parse_classrooms(rows: Iterable[dict]) -> List[Classroom]:
+    return list(iter_classrooms(rows))
+
+
+def stream_courses(path: str) -> Iterator[Course]:
+    return iter_courses(iter_json_or_csv(path))
+
+
+def stream_instructors(path: str) -> Iterator[Instructor]:
+    return iter_instructors(iter_json_or_csv(path))
+
+
+def stream_classrooms(path: str) -> Iterator[Classroom]:
+    return iter_classrooms(iter_json_or_csv(path))
+
+
+# -----------------------------
+# Chunked CSV ingest (large exports)
+# - The file is mmap'ed and cut into line-aligned byte ranges; a cut is only
+#   made where the quote count since the range start is even, so quoted
+#   newlines never split a record
+# - Each range is parsed in its own process with the same row parsers
+#   (and alias rules) as the streaming loaders; ranges merge in file order
+# -----------------------------
+CSV_CHUNK_MIN_BYTES = 16 * 1024 * 1024  # smaller CSVs are read in one pass
+ROW_PARSERS = {"courses": iter_courses, "instructors": iter_instructors, "classrooms": iter_classrooms}
+
+
+def _record_end(mm, start: int, pos: int) -> int:
+    """Offset just past the first newline at/after pos that ends a record (quotes counted from start)."""
+    quotes = mm[start:pos].count(b'"')
+    while True:
+        nl = mm.find(b"\n", pos)
+        if nl == -1:
+            return len(mm)
+        quotes += mm[pos:nl + 1].count(b'"')
+        pos = nl + 1
+        if quotes % 2 == 0:
+            return pos
+
+
+def _ingest_chunk(path: str, kind: str, header: List[str], start: int, end: int) -> list:
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode("utf-8")
+    rows = csv.DictReader(io.StringIO(text, newline=""), fieldnames=header)
+    return list(ROW_PARSERS[kind](rows))
+
+
+def ingest_csv(path: str, kind: str = "courses", workers: Optional[int] = None,
+               chunk_bytes: Optional[int] = None) -> list:
+    """
+    Parse a large CSV in parallel; same records, in the same order, as the
+    matching stream_* loader. workers=1 parses the chunks in this process.
+    """
+    workers = workers or os.cpu_count() or 1
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            body = 3 if mm[:3] == b"\xef\xbb\xbf" else 0  # utf-8-sig
+            header_end = _record_end(mm, body, body)
+            header = next(csv.reader(io.StringIO(mm[body:header_end].decode("utf-8"), newline="")), None)
+            if header is None:
+                return []
+            size = len(mm)
+            if chunk_bytes is None:
+                chunk_bytes = max(1 << 20, (size - header_end) // (workers * 4) + 1)
+            starts: List[int] = []
+            ends: List[int] = []
+            pos = header_end
+            while pos < size:
+                cut = size if pos + chunk_bytes >= size else _record_end(mm, pos, pos + chunk_bytes)
+                starts.append(pos)
+                ends.append(cut)
+                pos = cut
+
+    args = (repeat(path), repeat(kind), repeat(header), starts, ends)
+    if workers > 1 and len(starts) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(starts))) as ex:
+            parts = list(ex.map(_ingest_chunk, *args))  # map keeps chunk (= row) order
+    else:
+        parts = list(map(_ingest_chunk, *args))
+    out: list = []
+    for part in parts:
+        out.extend(part)
+    return out
+
+
+# -----------------------------
+# Parsed-file cache
+# - Parsed files are cached on disk (see input_cache.py); reloading an
+#   unchanged file skips parsing entirely
+# -----------------------------
+LOADERS = {
+    "courses": (Course, stream_courses),
+    "instructors": (Instructor, stream_instructors),
+    "classrooms": (Classroom, stream_classrooms),
+}
+LOADER_VERSION = 2  # bump when parsing changes; alias tables are keyed automatically
+LOADER_FIELDS = {"courses": COURSE_FIELDS, "instructors": INSTRUCTOR_FIELDS, "classrooms": CLASSROOM_FIELDS}
+INPUT_CACHE = ParsedInputCache()
+
+
+def parse_file(path: str, kind: str, workers: Optional[int] = None) -> list:
+    """All records of a data file; large CSVs go through ingest_csv unless workers=1."""
+    if (workers != 1 and path.lower().endswith(".csv")
+            and os.path.getsize(path) >= CSV_CHUNK_MIN_BYTES):
+        return ingest_csv(path, kind, workers)
+    return list(LOADERS[kind][1](path))
+
+
+def load_cached(path: str, kind: str, workers: Optional[int] = None) -> list:
+    def parse(p: str) -> list:
+        return parse_file(p, kind, workers)
+
+    try:
+        return INPUT_CACHE.load(path, LOADERS[kind][0], parse, version=f"{LOADER_VERSION}:{LOADER_FIELDS[kind]!r}")
+    except OSError:
+        # cache directory not writable: fall back to a plain parse
+        return parse(path)
+
+
+# -----------------------------
+# Folder loading
+# - Finds Courses / Instructors / Classrooms (.json before .csv) and
+#   CommonSchedule.xlsx in one folder, case-insensitively
+# - Parses the data files in parallel worker processes
+# -----------------------------
+COMMON_FILE = "commonschedule.xlsx"
+
+
+def discover_data_files(folder: str) -> Dict[str, str]:
+    """kind -> path for the data files present in folder ("common" for the xlsx)."""
+    by_name = {name.lower(): name for name in os.listdir(folder)}
+    found: Dict[str, str] = {}
+    for kind in LOADERS:
+        for ext in (".json", ".csv"):
+            name = by_name.get(kind + ext)
+            if name:
+                found[kind] = os.path.join(folder, name)
+                break
+    if COMMON_FILE in by_name:
+        found["common"] = os.path.join(folder, by_name[COMMON_FILE])
+    return found
+
+
+def _load_kind(kind: str, path: str):
+    if kind == "common":
+        return load_common_schedule(path)
+    # already inside a pool worker: no nested chunk pool
+    return load_cached(path, kind, workers=1)
+
+
+def load_folder(folder: str, workers: Optional[int] = None, on_loaded=None,
+                files: Optional[Dict[str, str]] = None) -> Tuple[Dict[str, list], Dict[str, Exception]]:
+    """
+    Parse every data file found in folder (or the given kind -> path map);
+    CommonSchedule.xlsx comes back as a CommonSchedule under "common".
+    Files are parsed in a process pool (workers=1 parses them here, in order).
+    on_loaded(kind, path, records, error) is called from this thread as each
+    file finishes, with records=None when it failed.
+    Returns ({kind: records}, {kind: error}).
+    """
+    files = files if files is not None else discover_data_files(folder)
+    jobs = [(kind, files[kind]) for kind in (*LOADERS, "common") if kind in files]
+    loaded: Dict[str, list] = {}
+    errors: Dict[str, Exception] = {}
+
+    def finish(kind: str, path: str, records, error) -> None:
+        if error is None:
+            loaded[kind] = records
+        else:
+            errors[kind] = error
+        if on_loaded is not None:
+            on_loaded(kind, path, records, error)
+
+    if workers is None:
+        workers = min(len(jobs), os.cpu_count() or 1)
+    if workers > 1 and len(jobs) > 1:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            futures = {ex.submit(_load_kind, kind, path): (kind, path) for kind, path in jobs}
+            for fut in as_completed(futures):
+                kind, path = futures[fut]
+                try:
+                    records = fut.result()
+                except Exception as e:
+                    finish(kind, path, None, e)
+                else:
+                    finish(kind, path, records, None)
+    else:
+        for kind, path in jobs:
+            try:
+                records = _load_kind(kind, path)
+            except Exception as e:
+                finish(kind, path, None, e)
+            else:
+                finish(kind, path, records, None)
+    return loaded, errors
+
+
+# -----------------------------
+# Scheduling (shared engine, see engine.py)
+# - Courses go through the same engines as headless callers
+# - Results are turned back into the dashboard's day/time grid
+# -----------------------------
+def _grid_result(result: ScheduleResult, pool: List[Course],
+                 common: Optional[Dict[Tuple[int, int], List[CommonSession]]] = None) -> Dict:
+    # Prepare schedule dict
+    schedule: Dict[str, Dict[str, str]] = {d: {t: "" for t in TIMES} for d in DAYS}
+
+    # put exam blocks
+    for (d, t), txt in EXAM_BLOCK.items():
+        if d in schedule and t in schedule[d]:
+            schedule[d][t] = txt
+
+    # put common schedule sessions (already reserved for the engine)
+    for (day_idx, time_idx), sessions in sorted((common or {}).items()):
+        day, time = DAYS[day_idx], TIMES[time_idx]
+        label = "\n".join(s.course_code or "COMMON" for s in sessions) + "\n(Common)"
+        schedule[day][time] = f"{schedule[day][time]}\n{label}" if schedule[day][time] else label
+
+    placements: List[Tuple[str, str, str]] = []  # (day, time, code) in slot order
+    rooms: List[str] = []  # room of each placement, same order
+    for (day_idx, time_idx), p in result.placements():
+        day, time = DAYS[day_idx], TIMES[time_idx]
+        label = p.course_code
+        # show (Lab) if code ends with L or contains LAB
+        if is_lab_code(p.course_code):
+            label = f"{p.course_code}\n(Lab)"
+        schedule[day][time] = f"{schedule[day][time]}\n{label}" if schedule[day][time] else label
+        placements.append((day, time, p.course_code))
+        rooms.append(p.room_id)
+
+    # as in the Week 9 dashboard an unplaced course is a conflict; the engine
+    # also reports it as a warning (see README, Scheduling engines)
+    placed = result.placed
+    conflicts = len(pool) - placed  # courses left without a slot
+
+    # Create a simple report (Week 9 style)
+    rules_total = 6
+    rules_passed = max(0, rules_total - conflicts)
+    critical = 1 if conflicts > 0 else 0
+
+    return {
+        "schedule": schedule,
+        "scheduled_courses": placed,
+        "conflicts": conflicts,
+        "warnings": result.warnings,
+        "critical": critical,
+        "rules_passed": rules_passed,
+        "rules_total": rules_total,
+        "placements": placements,
+        "placement_rooms": rooms,
+        "issues": IssueReport(result.issues),  # grouped once here, read by the report views
+        "engine": result.engine,
+    }
+
+
+def _reservations(common: Optional[CommonSchedule], instructors) -> Optional[Reservations]:
+    """Common schedule cells plus the instructors' availability, as engine reservations."""
+    reserved = common.reservations() if common else None
+    availability = availability_from_app(instructors) if instructors else {}
+    if availability:
+        reserved = (reserved or Reservations()).with_availability(availability)
+    return reserved
+
+
+def generate_schedule(courses: List[Course], year_filter: Optional[int] = None,
+                      classrooms: Optional[List[Classroom]] = None, engine: str = "greedy",
+                      common: Optional[CommonSchedule] = None, progress: Optional[Progress] = None,
+                      instructors=None) -> Dict:
+    """Schedule one year (every course when year_filter is None); instructors restrict to their availability."""
+    pool = courses_of_year(courses, year_filter) if year_filter else courses
+    reserved = _reservations(common, instructors)
+    cells = common.by_slot(year_filter) if common else None
+    return _grid_result(run_app(pool, classrooms, engine=engine, reserved=reserved, progress=progress), pool, cells)
+
+
+def generate_all_years(courses: List[Course], years: Tuple[int, ...] = (1, 2, 3, 4),
+                       workers: Optional[int] = None, classrooms: Optional[List[Classroom]] = None,
+                       engine: str = "greedy", common: Optional[CommonSchedule] = None,
+                       progress: Optional[Progress] = None, instructors=None) -> Dict[int, Dict]:
+    """
+    Schedule every year at once.
+    Years are solved in parallel worker processes (workers=1 runs them in this
+    process), then a merge pass reserves instructors and rooms year by year. A
+    course whose room another year already uses then takes the smallest free
+    fitting room of the same slot; if there is none, or its instructor already
+    teaches another year in that slot, it is moved to a free slot of its own year
+    (keeping its room if that is free there, else the smallest free fitting
+    room), or reported as a clash. The merge is deterministic, so the
+    result does not depend on the worker count. Common schedule sessions are
+    reserved in every year's run and never used by the merge; so are the slots
+    outside an instructor's availability when instructors are given.
+    progress counts over all years: per course when years run in this
+    process, per finished year when they run in workers.
+    Returns {year: result}; each result also has a "clashes" list (report
+    lines), and the clashes are added to its issues.
+    """
+    pools = [courses_of_year(courses, y) for y in years]
+    reserved = _reservations(common, instructors)
+    total = sum(len(pool) for pool in pools)
+    if workers is None:
+        workers = min(len(pools), os.cpu_count() or 1)
+    runs: List[ScheduleResult] = []
+    if workers > 1 and len(pools) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            futures = [ex.submit(run_app, pool, classrooms, None, engine, reserved) for pool in pools]
+            try:
+                for fut in futures:
+                    runs.append(fut.result())
+                    if progress is not None:
+                        progress(sum(map(len, pools[:len(runs)])), total, sum(r.conflicts for r in runs))
+            except BaseException:
+                for fut in futures:
+                    fut.cancel()  # years not started yet; running ones finish and are dropped
+                raise
+    else:
+        for pool in pools:
+            step = None
+            if progress is not None:
+                before = (sum(map(len, pools[:len(runs)])), sum(r.conflicts for r in runs))
+                step = lambda done, _total, conflicts, before=before: progress(
+                    before[0] + done, total, before[1] + conflicts)
+            runs.append(run_app(pool, classrooms, engine=engine, reserved=reserved, progress=step))
+    solved = [_grid_result(run, pool, common.by_slot(y) if common else None)
+              for run, pool, y in zip(runs, pools, years)]
+
+    # Merge/repair: (day, time) -> instructors already teaching and rooms in use then
+    by_code = {c.code: c for c in courses}
+    model_courses, model_rooms = model_from_app(courses, classrooms or [])
+    model_by_code = {c.code: c for c in model_courses}
+    room_index = RoomIndex(model_rooms)
+    held_rooms = reserved.rooms if reserved else {}
+    busy: Dict[Tuple[str, str], set] = {}
+    in_use: Dict[Tuple[str, str], Dict[str, str]] = {}  # room -> course using it
+
+    def free_room(code: str, room: str, d: str, t: str) -> Optional[str]:
+        """The course's room if free at (d, t), else the smallest free room that fits it."""
+        bit = slot_bit(DAYS.index(d), TIMES.index(t))
+        used = in_use.get((d, t), {})
+        for r in [room] + [r.id for r in room_index.fitting(model_by_code[code])]:
+            if r not in used and not held_rooms.get(r, 0) & bit:
+                return r
+        return None
+
+    results: Dict[int, Dict] = {}
+    for year, result in zip(years, solved):
+        sched = result["schedule"]
+        clashes: List[Issue] = []
+        placements = []
+        placement_rooms = []
+        for (day, time, code), room in zip(result["placements"], result["placement_rooms"]):
+            instructor = by_code[code].instructor if code in by_code else ""
+            teaching = bool(instructor) and instructor in busy.get((day, time), ())
+            other = in_use.get((day, time), {}).get(room)
+            if other and not teaching:
+                # only the room is taken: another free fitting room in the same slot will do
+                r = free_room(code, room, day, time)
+                if r is not None:
+                    room, other = r, None
+            if teaching or other:
+                # the same cells the engines keep off limits (closed, instructor's, year's)
+                held = reserved.course_mask(model_by_code[code]) if reserved else 0
+                target = None
+                for d in DAYS:
+                    for t in TIMES:
+                        di, ti = DAYS.index(d), TIMES.index(t)
+                        if (sched[d][t] == "" and (di, ti) not in BLOCKED
+                                and not held & slot_bit(di, ti)
+                                and instructor not in busy.get((d, t), ())):
+                            r = free_room(code, room, d, t)
+                            if r is not None:
+                                target = (d, t, r)
+                                break
+                    if target:
+                        break
+                if target:
+                    sched[target[0]][target[1]] = sched[day][time]
+                    sched[day][time] = ""
+                    day, time, room = target
+                else:
+                    # issues carry the engines' labels (scheduler.DAYS / TIMES), not the grid's
+                    slot_day, slot_time = SLOT_DAYS[DAYS.index(day)], SLOT_TIMES[TIMES.index(time)]
+                    if teaching:
+                        clashes.append(Issue(YEAR_CLASH, CRITICAL, code, slot_day, slot_time, instructor=instructor))
+                    if other:
+                        clashes.append(Issue(ROOM_OVERLAP, CRITICAL, code, slot_day, slot_time, room=room, detail=other))
+            if instructor:
+                busy.setdefault((day, time), set()).add(instructor)
+            in_use.setdefault((day, time), {}).setdefault(room, code)
+            placements.append((day, time, code))
+            placement_rooms.append(room)
+
+        result["placements"] = placements
+        result["placement_rooms"] = placement_rooms
+        result["clashes"] = [c.message for c in clashes]
+        result["issues"].extend(clashes)
+        if clashes:
+            result["conflicts"] += len(clashes)
+            result["critical"] = 1
+            result["rules_passed"] = max(0, result["rules_total"] - result["conflicts"])
+        results[year] = result
+    return results
+
+
+def export_sessions(results: Dict[int, Dict], index: EntityIndex) -> List[Session]:
+    """Placed courses of {year: result} as exporter sessions (instructor looked up by code)."""
+    sessions: List[Session] = []
+    for year, result in results.items():
+        rooms = result.get("placement_rooms") or [""] * len(result["placements"])
+        for (day, time, code), room in zip(result["placements"], rooms):
+            course = index.course(code)
+            sessions.append(Session(year, day, time, code, course.instructor if course else "",
+                                    "" if room.startswith("TBA") else room))
+    return sessions
@@ -0,0 +1,136 @@
+"""
+Scheduler benchmark suite for BeePlan.
+
+For each workload size and file format it times loading (load_json_or_csv),
+parsing (parse_*) and every schedule variant (each registered engine over all
+years, plus generate_all_years), and records wall time, peak traced memory and
+placement quality to a JSON results file. Workloads come from workload.py, so
+runs with the same seed are comparable across commits.
+
+Usage:
+    python benchmark.py [--sizes 50 500 5000] [--engines greedy csp]
+                        [--formats json csv] [--out bench_results.json]
+"""
+import argparse
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from beeplan_core import (
+    generate_all_years,
+    generate_schedule,
+    load_json_or_csv,
+    parse_classrooms,
+    parse_courses,
+    parse_instructors,
+)
+from engine import ENGINES
+from workload import write_workload
+
+PARSERS = {"Courses": parse_courses, "Instructors": parse_instructors, "Classrooms": parse_classrooms}
+
+
+def measure(fn: Callable, memory: bool = True) -> Dict:
+    """Run fn once for wall time, and once more under tracemalloc for peak memory."""
+    start = time.perf_counter()
+    value = fn()
+    out = {"seconds": round(time.perf_counter() - start, 6), "value": value}
+    if memory:
+        tracemalloc.start()
+        try:
+            fn()
+            out["peak_kb"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+        finally:
+            tracemalloc.stop()
+    return out
+
+
+def quality(result: Dict) -> Dict:
+    return {
+        "placed": result["scheduled_courses"],
+        "unplaced": result["conflicts"],
+        "warnings": result["warnings"],
+    }
+
+
+def bench_case(folder: str, size: int, fmt: str, engines: List[str], memory: bool = True) -> List[Dict]:
+    rows: List[Dict] = []
+    parsed: Dict[str, list] = {}
+    for entity, parser in PARSERS.items():
+        path = os.path.join(folder, f"{entity}.{fmt}")
+        loaded = measure(lambda: load_json_or_csv(path), memory)
+        rows.append({"size": size, "format": fmt, "stage": "load", "entity": entity,
+                     "seconds": loaded["seconds"], "peak_kb": loaded.get("peak_kb"),
+                     "bytes": os.path.getsize(path)})
+        data = loaded["value"]
+        parsed_m = measure(lambda: parser(data), memory)
+        parsed[entity] = parsed_m["value"]
+        rows.append({"size": size, "format": fmt, "stage": "parse", "entity": entity,
+                     "seconds": parsed_m["seconds"], "peak_kb": parsed_m.get("peak_kb"),
+                     "records": len(parsed[entity])})
+
+    courses, rooms = parsed["Courses"], parsed["Classrooms"]
+    for engine in engines:
+        run = measure(lambda: generate_schedule(courses, classrooms=rooms, engine=engine), memory)
+        rows.append({"size": size, "format": fmt, "stage": "schedule", "variant": engine,
+                     "seconds": run["seconds"], "peak_kb": run.get("peak_kb"), **quality(run["value"])})
+
+    # worker processes are not traced, so only wall time is recorded here
+    run = measure(lambda: generate_all_years(courses, classrooms=rooms), memory=False)
+    placed = sum(r["scheduled_courses"] for r in run["value"].values())
+    rows.append({"size": size, "format": fmt, "stage": "schedule", "variant": "all_years",
+                 "seconds": run["seconds"], "peak_kb": None, "placed": placed,
+                 "unplaced": len(courses) - placed,
+                 "clashes": sum(len(r["clashes"]) for r in run["value"].values())})
+    return rows
+
+
+def run_benchmarks(sizes: List[int], engines: List[str], formats: List[str], seed: int = 1,
+                   memory: bool = True, work_dir: Optional[str] = None) -> Dict:
+    results: List[Dict] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        base = work_dir or tmp
+        for size in sizes:
+            folder = os.path.join(base, f"workload_{size}")
+            write_workload(folder, size, seed, formats)
+            for fmt in formats:
+                results.extend(bench_case(folder, size, fmt, engines, memory))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "seed": seed,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Benchmark BeePlan loading, parsing and scheduling.")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 2000])
+    ap.add_argument("--engines", nargs="+", default=list(ENGINES), choices=list(ENGINES))
+    ap.add_argument("--formats", nargs="+", default=["json", "csv"], choices=["json", "csv"])
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    ap.add_argument("--work-dir", help="keep generated workloads here instead of a temp dir")
+    ap.add_argument("--out", default="bench_results.json")
+    args = ap.parse_args(argv)
+
+    report = run_benchmarks(args.sizes, args.engines, args.formats, args.seed,
+                            memory=not args.no_memory, work_dir=args.work_dir)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    for row in report["results"]:
+        label = row.get("entity") or row.get("variant")
+        print(f"{row['size']:>7} {row['format']:<4} {row['stage']:<8} {label:<12} {row['seconds']:>9.4f}s")
+    print(f"Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
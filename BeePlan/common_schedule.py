@@ -0,0 +1,144 @@
+"""
+Faculty common schedule import (CommonSchedule.xlsx).
+
+Every worksheet is read as a table, one row per common course session, with
+a header row naming the columns (aliases as in the dashboard loaders):
+day, time, course, room, instructor, year and optional hours. The workbook
+is opened read-only and walked with iter_rows, so only one row is held in
+memory at a time. The sessions become scheduler.Reservations masks, which
+every engine treats as occupied cells.
+"""
+import datetime
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from optional_deps import optional
+from scheduler import DAYS, TIMES, Reservations
+
+HEADER_ALIASES = {
+    "day": ("day", "gun", "weekday"),
+    "time": ("time", "start", "starttime", "start_time", "slot", "hour"),
+    "course": ("course", "code", "coursecode", "course_code", "lesson", "ders"),
+    "room": ("room", "classroom", "roomname", "room_name", "location", "derslik"),
+    "instructor": ("instructor", "lecturer", "teacher", "instructorname", "instructor_name", "hoca"),
+    "year": ("year", "class", "classyear", "class_year", "grade", "sinif"),
+    "hours": ("hours", "duration", "length", "weeklyhours", "weekly_hours"),
+}
+
+_DAY_INDEX = {d[:3].upper(): i for i, d in enumerate(DAYS)}
+_TIME_INDEX = {tuple(int(x) for x in t.split(":")): i for i, t in enumerate(TIMES)}
+
+
+@dataclass(frozen=True)
+class CommonSession:
+    day_idx: int
+    time_idx: int
+    course_code: str
+    room_id: str = ""
+    instructor_id: str = ""
+    year: int = 0
+
+
+@dataclass
+class CommonSchedule:
+    """Sessions of the common schedule, plus the rows that could not be placed on the grid."""
+    sessions: List[CommonSession] = field(default_factory=list)
+    skipped: int = 0
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def reservations(self) -> Reservations:
+        reserved = Reservations()
+        for s in self.sessions:
+            reserved.reserve(s.day_idx, s.time_idx, s.room_id or None, s.instructor_id or None, s.year)
+        return reserved
+
+    def by_slot(self, year: Optional[int] = None) -> Dict[Tuple[int, int], List[CommonSession]]:
+        """
+        (day_idx, time_idx) -> sessions that take the slot from a year grid: those
+        of the given year (every year-tied one when year is None) and slot-wide
+        closures. Sessions tied only to a room or instructor are left out.
+        """
+        out: Dict[Tuple[int, int], List[CommonSession]] = {}
+        for s in self.sessions:
+            closure = not (s.room_id or s.instructor_id or s.year)
+            if closure or (s.year and (year is None or s.year == year)):
+                out.setdefault((s.day_idx, s.time_idx), []).append(s)
+        return out
+
+
+def day_index(value) -> Optional[int]:
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        i = value.weekday()
+        return i if i < len(DAYS) else None
+    return _DAY_INDEX.get(str(value or "").strip()[:3].upper())
+
+
+def time_index(value) -> Optional[int]:
+    """Index into TIMES for 9:20, "09:20", "09:20-10:10" or a time/datetime cell."""
+    if isinstance(value, (datetime.time, datetime.datetime)):
+        return _TIME_INDEX.get((value.hour, value.minute))
+    text = str(value or "").strip().split("-")[0].strip().replace(".", ":")
+    try:
+        hour, minute = (int(x) for x in text.split(":")[:2])
+    except ValueError:
+        return None
+    return _TIME_INDEX.get((hour, minute))
+
+
+def _to_int(value, default: int = 0) -> int:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def _header_map(row) -> Dict[str, int]:
+    """Column position per field for a header row (empty if it is not one)."""
+    cols: Dict[str, int] = {}
+    for pos, cell in enumerate(row):
+        key = str(cell or "").strip().lower().replace(" ", "")
+        for name, aliases in HEADER_ALIASES.items():
+            if name not in cols and key in aliases:
+                cols[name] = pos
+    return cols if {"day", "time"} <= cols.keys() else {}
+
+
+def load_common_schedule(path: str) -> CommonSchedule:
+    """Stream every worksheet of the workbook into a CommonSchedule. Requires openpyxl."""
+    openpyxl = optional("openpyxl")
+    if openpyxl is None:
+        raise RuntimeError("openpyxl is required to read CommonSchedule.xlsx (pip install openpyxl).")
+    result = CommonSchedule()
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        for ws in wb.worksheets:
+            cols: Dict[str, int] = {}
+            for row in ws.iter_rows(values_only=True):
+                if not cols:
+                    cols = _header_map(row)
+                    continue
+                if not any(v not in (None, "") for v in row):
+                    continue
+
+                def cell(name: str):
+                    pos = cols.get(name)
+                    return row[pos] if pos is not None and pos < len(row) else None
+
+                d, t = day_index(cell("day")), time_index(cell("time"))
+                if d is None or t is None:
+                    result.skipped += 1
+                    continue
+                code = str(cell("course") or "").strip()
+                room = str(cell("room") or "").strip()
+                instructor = str(cell("instructor") or "").strip()
+                year = _to_int(cell("year"))
+                # a multi-hour session covers consecutive time slots
+                for k in range(max(1, _to_int(cell("hours"), 1))):
+                    if t + k >= len(TIMES):
+                        break
+                    result.sessions.append(CommonSession(d, t + k, code, room, instructor, year))
+    finally:
+        wb.close()
+    return result
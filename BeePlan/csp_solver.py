@@ -0,0 +1,294 @@
+"""
+Backtracking CSP engine for BeePlan.
+
+Every schedulable course is a variable. Its domain is the set of (slot, room)
+cells it can still take, kept as one slot bitmask per fitting room (same bit
+layout as scheduler.OccupancyIndex). The search uses MRV variable ordering,
+forward checking and conflict-directed backjumping (FC-CBJ).
+"""
+from typing import Dict, List, Optional, Set, Tuple
+
+from feasibility import feasible_domains, illegal_placements
+from issues import Issue
+from scheduler import (
+    ALL_SLOTS,
+    BLOCKED_MASK,
+    Classroom,
+    Course,
+    Placement,
+    Progress,
+    Reservations,
+    RoomIndex,
+    Schedule,
+    greedy_schedule,
+    placement_count,
+    slot_of,
+    unplaced_issue,
+)
+
+# Search nodes (value assignments) tried before giving up on a complete timetable.
+DEFAULT_MAX_NODES = 20000
+PROGRESS_EVERY = 256  # nodes between progress reports
+
+Value = Tuple[int, str]  # (slot bit index, room_id)
+
+
+def _popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+def _clash_groups(courses: List[Course]) -> Dict[Tuple[str, object], List[int]]:
+    """Courses that may never share a slot: same instructor, or same (non-zero) year."""
+    groups: Dict[Tuple[str, object], List[int]] = {}
+    for var, course in enumerate(courses):
+        groups.setdefault(("instructor", course.instructor_id), []).append(var)
+        if course.year:
+            groups.setdefault(("year", course.year), []).append(var)
+    return groups
+
+
+class _Frame:
+    """One level of the search stack: a variable and the values left to try."""
+
+    def __init__(self, var: int, candidates: List[Value]):
+        self.var = var
+        self.candidates = candidates
+        self.pos = 0
+        self.conf: Set[int] = set()
+        self.removed: Optional[List[Tuple[int, str, int]]] = None
+
+
+class _Search:
+    def __init__(self, courses: List[Course], fits: List[List[Classroom]],
+                 domains: List[Dict[str, int]], max_nodes: int,
+                 progress: Optional[Progress] = None, total: int = 0):
+        self.courses = courses
+        self.fits = fits  # fitting rooms per course, smallest first
+        self.domains = domains  # room_id -> legal slot mask, per course
+        self.sizes: List[int] = [sum(_popcount(m) for m in d.values()) for d in domains]
+        self.values: List[Optional[Value]] = [None] * len(courses)
+        # past_fc[v]: assigned variables whose forward checks pruned v's domain
+        self.past_fc: List[Set[int]] = [set() for _ in courses]
+        # by_room[r]: courses that fit room r (the only ones a cell assignment can prune)
+        self.by_room: Dict[str, List[int]] = {}
+        for var, fit in enumerate(fits):
+            for r in fit:
+                self.by_room.setdefault(r.id, []).append(var)
+        # neighbours[v]: courses that may never share a slot with v (same instructor or year)
+        linked: List[Set[int]] = [set() for _ in courses]
+        for members in _clash_groups(courses).values():
+            for var in members:
+                linked[var].update(members)
+        self.neighbours: List[List[int]] = [sorted(s - {var}) for var, s in enumerate(linked)]
+        self.max_nodes = max_nodes
+        self.nodes = 0
+        self.depth = 0
+        self.best: Dict[int, Value] = {}
+        self.progress = progress
+        self.total = total or len(courses)
+
+    # -------- Ordering ----------
+    def select(self) -> Optional[int]:
+        """MRV: the unassigned course with the fewest legal (slot, room) cells."""
+        best = None
+        best_size = 0
+        sizes = self.sizes
+        for var, value in enumerate(self.values):
+            if value is None and (best is None or sizes[var] < best_size):
+                best, best_size = var, sizes[var]
+        return best
+
+    def candidates(self, var: int) -> List[Value]:
+        """Earliest slot first, then the smallest fitting room (like pick_room)."""
+        domain = self.domains[var]
+        union = 0
+        for mask in domain.values():
+            union |= mask
+        out: List[Value] = []
+        while union:
+            low = union & -union
+            for room in self.fits[var]:
+                if domain[room.id] & low:
+                    out.append((low.bit_length() - 1, room.id))
+            union ^= low
+        return out
+
+    # -------- Assignment ----------
+    def assign(self, frame: _Frame, value: Value) -> Optional[int]:
+        """Assign and forward-check. Returns the variable whose domain wiped out, if any."""
+        var = frame.var
+        self.values[var] = value
+        self.depth += 1
+        removed: List[Tuple[int, str, int]] = []
+        frame.removed = removed
+
+        # Clashing courses lose the whole slot; every other course loses this cell.
+        bit = 1 << value[0]
+        room = value[1]
+        values = self.values
+        for other in self.neighbours[var]:
+            if values[other] is not None:
+                continue
+            domain = self.domains[other]
+            hit = False
+            for room_id, mask in domain.items():
+                if mask & bit:
+                    domain[room_id] = mask & ~bit
+                    removed.append((other, room_id, bit))
+                    self.sizes[other] -= 1
+                    hit = True
+            if hit:
+                self.past_fc[other].add(var)
+                if not self.sizes[other]:
+                    return other
+        for other in self.by_room[room]:
+            if values[other] is not None:
+                continue
+            domain = self.domains[other]
+            if domain[room] & bit:
+                domain[room] &= ~bit
+                removed.append((other, room, bit))
+                self.sizes[other] -= 1
+                self.past_fc[other].add(var)
+                if not self.sizes[other]:
+                    return other
+        return None
+
+    def unassign(self, frame: _Frame) -> None:
+        if frame.removed is None:
+            return
+        for other, room_id, bits in frame.removed:
+            self.domains[other][room_id] |= bits
+            self.sizes[other] += 1
+            self.past_fc[other].discard(frame.var)
+        frame.removed = None
+        self.values[frame.var] = None
+        self.depth -= 1
+
+    # -------- Search ----------
+    def run(self) -> bool:
+        """FC-CBJ over an explicit stack. True if every course got a cell."""
+        var = self.select()
+        if var is None:
+            return True
+        stack = [_Frame(var, self.candidates(var))]
+        failed: Optional[Set[int]] = None
+
+        while stack:
+            frame = stack[-1]
+            if failed is not None:
+                self.unassign(frame)
+                if frame.var not in failed:
+                    # not part of the conflict: jump straight past this level
+                    stack.pop()
+                    continue
+                frame.conf |= failed
+                frame.conf.discard(frame.var)
+                failed = None
+
+            if frame.pos == len(frame.candidates):
+                failed = frame.conf | self.past_fc[frame.var]
+                stack.pop()
+                continue
+
+            if self.nodes >= self.max_nodes:
+                return False
+            if self.progress is not None and self.nodes % PROGRESS_EVERY == 0:
+                self.progress(len(self.best), self.total, 0)
+            self.nodes += 1
+
+            value = frame.candidates[frame.pos]
+            frame.pos += 1
+            wiped = self.assign(frame, value)
+            # assigned values are pairwise consistent even if a future domain wiped out
+            if self.depth > len(self.best):
+                self.best = {v: val for v, val in enumerate(self.values) if val is not None}
+            if wiped is not None:
+                failed = set(self.past_fc[wiped])
+                continue
+
+            var = self.select()
+            if var is None:
+                return True
+            stack.append(_Frame(var, self.candidates(var)))
+
+        return False
+
+
+def _overflow(courses: List[Course], fitting: List[List[Classroom]]) -> Set[int]:
+    """
+    Courses that can never be placed because their instructor or year already has
+    more courses than open slots. The latest codes in each such group are dropped
+    up front, so the search does not spend its budget proving the pigeonhole.
+    """
+    capacity = _popcount(ALL_SLOTS & ~BLOCKED_MASK)
+    candidates = [i for i, fit in enumerate(fitting) if fit]
+    groups = _clash_groups([courses[i] for i in candidates])
+    dropped: Set[int] = set()
+    for key in sorted(groups, key=str):
+        members = [candidates[m] for m in groups[key] if candidates[m] not in dropped]
+        dropped.update(members[capacity:])
+    return dropped
+
+
+def csp_schedule(
+    courses: List[Course],
+    rooms: List[Classroom],
+    max_nodes: int = DEFAULT_MAX_NODES,
+    availability: Optional[Dict[str, int]] = None,
+    reserved: Optional[Reservations] = None,
+    progress: Optional[Progress] = None,
+) -> Tuple[Schedule, List[Issue], int, int]:
+    """
+    Backtracking scheduler (MRV + forward checking + conflict-directed backjumping).
+    Returns the same tuple as scheduler.greedy_schedule. Initial domains come
+    from feasibility.feasible_domains; availability maps instructor_id -> mask
+    of slots they can teach and reserved holds cells taken up front (the
+    common schedule). progress gets the deepest assignment so far every
+    PROGRESS_EVERY nodes. If no complete timetable is found within
+    max_nodes, the deepest partial assignment is used, or the greedy result
+    when that places more courses and passes the feasibility re-check.
+    """
+    courses_sorted = sorted(courses, key=lambda c: c.code)
+    room_index = RoomIndex(rooms)
+
+    fitting = [room_index.fitting(c) for c in courses_sorted]
+    overflow = _overflow(courses_sorted, fitting)
+
+    variables: List[Course] = []
+    fits: List[List[Classroom]] = []
+    var_of: List[Optional[int]] = []  # per sorted course; None if it is not searched
+    for i, (course, fit) in enumerate(zip(courses_sorted, fitting)):
+        if fit and i not in overflow:
+            var_of.append(len(variables))
+            variables.append(course)
+            fits.append(fit)
+        else:
+            var_of.append(None)
+
+    domains = feasible_domains(variables, rooms, availability=availability, reserved=reserved)
+    search = _Search(variables, fits, domains, max_nodes, progress, len(courses_sorted))
+    if search.run():
+        assignment = {v: val for v, val in enumerate(search.values) if val is not None}
+    else:
+        assignment = search.best
+        greedy = greedy_schedule(courses, rooms, reserved)
+        if placement_count(greedy[0]) > len(assignment) and (
+            not availability or not illegal_placements(courses, rooms, greedy[0], availability=availability)
+        ):
+            if progress is not None:
+                progress(placement_count(greedy[0]), len(courses_sorted), 0)
+            return greedy
+
+    if progress is not None:
+        progress(len(assignment), len(courses_sorted), 0)
+    schedule: Schedule = {}
+    for var, (slot, room_id) in assignment.items():
+        course = variables[var]
+        schedule.setdefault(slot_of(slot), {})[room_id] = Placement(course.code, course.instructor_id, room_id)
+
+    issues = [unplaced_issue(course, bool(fit))
+              for course, fit, var in zip(courses_sorted, fitting, var_of)
+              if not fit or var is None or var not in assignment]
+
+    return schedule, issues, 0, len(issues)
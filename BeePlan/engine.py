@@ -0,0 +1,181 @@
+"""
+Unified scheduling engine for BeePlan.
+
+Backends share one signature: (courses, rooms) in scheduler.py's model ->
+(schedule, issues, conflicts, warnings), and take cells reserved up
+front (the common schedule) as an optional `reserved` keyword and a
+scheduler.Progress callback as `progress`. They are registered by name in
+ENGINES, and run_engine wraps their output in a ScheduleResult; instructor
+availability reaches every backend as part of `reserved`. The adapter
+at the bottom maps the dashboard's data (instructor names, classroom names,
+years) onto that model, so the Tkinter app and headless callers share one path.
+"""
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from csp_solver import csp_schedule
+from issues import Issue, report_lines
+from local_search import improve_schedule
+from scheduler import (
+    Classroom,
+    Course,
+    Placement,
+    Progress,
+    Reservations,
+    Schedule,
+    greedy_schedule,
+    instructor_views,
+    placement_count,
+    room_views,
+)
+
+EngineFn = Callable[[List[Course], List[Classroom]], Tuple[Schedule, List[Issue], int, int]]
+
+ENGINES: Dict[str, EngineFn] = {}
+
+
+def register_engine(name: str) -> Callable[[EngineFn], EngineFn]:
+    """Decorator: make a backend selectable by name."""
+    def deco(fn: EngineFn) -> EngineFn:
+        ENGINES[name] = fn
+        return fn
+    return deco
+
+
+register_engine("greedy")(greedy_schedule)
+register_engine("csp")(csp_schedule)
+
+
+@register_engine("anneal")
+def anneal_schedule(courses: List[Course], rooms: List[Classroom], reserved: Optional[Reservations] = None,
+                    progress: Optional[Progress] = None) -> Tuple[Schedule, List[Issue], int, int]:
+    """Greedy start improved by local search (default budget, seed 0)."""
+    return improve_schedule(courses, rooms, reserved=reserved, progress=progress)
+
+
+class ScheduleCancelled(Exception):
+    """Raised from a progress callback to abandon a run (see beeplan_app's background jobs)."""
+
+
+@dataclass
+class ScheduleResult:
+    """Output of any engine, plus what the callers need to render it."""
+    engine: str
+    schedule: Schedule
+    issues: List[Issue]
+    conflicts: int
+    warnings: int
+    elapsed: float = 0.0  # seconds spent in the engine
+
+    @property
+    def placed(self) -> int:
+        return placement_count(self.schedule)
+
+    @property
+    def report(self) -> List[str]:
+        """The issues as report lines."""
+        return report_lines(self.issues)
+
+    def as_tuple(self) -> Tuple[Schedule, List[str], int, int]:
+        return self.schedule, self.report, self.conflicts, self.warnings
+
+    def placements(self) -> List[Tuple[Tuple[int, int], Placement]]:
+        """Every placement in slot order, then room order."""
+        return [(key, row[room_id]) for key, row in sorted(self.schedule.items()) for room_id in sorted(row)]
+
+    def room_views(self) -> Dict[str, Dict[Tuple[int, int], Placement]]:
+        return room_views(self.schedule)
+
+    def instructor_views(self) -> Dict[str, Dict[Tuple[int, int], Placement]]:
+        return instructor_views(self.schedule)
+
+
+def run_engine(name: str, courses: List[Course], rooms: List[Classroom],
+               reserved: Optional[Reservations] = None, progress: Optional[Progress] = None,
+               availability: Optional[Dict[str, int]] = None) -> ScheduleResult:
+    """availability: instructor_id -> mask of the slots they can teach (others are unrestricted)."""
+    try:
+        fn = ENGINES[name]
+    except KeyError:
+        raise ValueError(f"Unknown scheduling engine: {name!r} (expected one of {', '.join(ENGINES)})")
+    if availability:
+        reserved = (reserved or Reservations()).with_availability(availability)
+    # only pass the optional keywords that are set, so plain (courses, rooms) backends still work
+    options = {}
+    if reserved is not None:
+        options["reserved"] = reserved
+    if progress is not None:
+        options["progress"] = progress
+    start = time.perf_counter()
+    schedule, issues, conflicts, warnings = fn(courses, rooms, **options)
+    return ScheduleResult(name, schedule, issues, conflicts, warnings, time.perf_counter() - start)
+
+
+# -----------------------------
+# Adapter: dashboard data -> engine model
+# -----------------------------
+def is_lab_code(code: str) -> bool:
+    """Dashboard rule: codes ending in L or containing LAB are labs."""
+    return code.endswith("L") or "LAB" in code.upper()
+
+
+def model_from_app(courses, classrooms) -> Tuple[List[Course], List[Classroom]]:
+    """
+    Map dashboard Course/Classroom records (beeplan_core) to the engine model.
+    Courses without an instructor get a private placeholder id so they do not
+    clash with each other. Without classrooms, one unlimited room per year in
+    the pool stands in, which keeps the dashboard's one-course-per-year-slot grid.
+    """
+    from entity_store import CourseStore
+
+    if isinstance(courses, CourseStore):
+        # column store: read the columns directly instead of going through views
+        model_courses = courses.model_courses()
+        students, years = courses.students, courses.years
+    else:
+        model_courses = [
+            Course(code=c.code, instructor_id=c.instructor or f"(unassigned {c.code})",
+                   students=c.students, is_lab=is_lab_code(c.code), year=c.year)
+            for c in courses
+        ]
+        students, years = [c.students for c in courses], [c.year for c in courses]
+    if classrooms:
+        rooms = [Classroom(id=r.name, name=r.name, capacity=r.capacity) for r in classrooms]
+    else:
+        biggest = max(students, default=0)
+        years = sorted(set(years)) or [1]
+        rooms = [Classroom(id=f"TBA-{y}", name="TBA", capacity=biggest) for y in years]
+    return model_courses, rooms
+
+
+def availability_from_app(instructors) -> Dict[str, int]:
+    """
+    Instructor name -> mask of the (day, time) slots listed in its availability.
+    Instructors without availability, or with no entry that names a slot, are
+    left out (unrestricted); validation reports the entries that do not parse.
+    """
+    from common_schedule import day_index, time_index
+    from scheduler import slot_bit
+
+    masks: Dict[str, int] = {}
+    for ins in instructors:
+        mask = 0
+        for entry in ins.available or ():
+            if isinstance(entry, tuple) and len(entry) == 2:
+                day_idx, time_idx = day_index(entry[0]), time_index(entry[1])
+                if day_idx is not None and time_idx is not None:
+                    mask |= slot_bit(day_idx, time_idx)
+        if mask:
+            masks[ins.name] = masks.get(ins.name, 0) | mask
+    return masks
+
+
+def run_app(courses, classrooms=None, year_filter: Optional[int] = None, engine: str = "greedy",
+            reserved: Optional[Reservations] = None, progress: Optional[Progress] = None) -> ScheduleResult:
+    """Schedule dashboard records (optionally one year) with a named engine."""
+    from entity_store import courses_of_year
+
+    pool = courses_of_year(courses, year_filter) if year_filter else courses
+    model_courses, rooms = model_from_app(pool, classrooms or [])
+    return run_engine(engine, model_courses, rooms, reserved, progress)
@@ -0,0 +1,305 @@
+"""
+Compact column store for dashboard entities.
+
+Instead of one dataclass per record, a CourseStore keeps each attribute in a
+column: strings in lists, numbers in typed `array`s, and instructor names
+interned to integer ids shared with the InstructorStore. Views (CourseView,
+InstructorView, RoomView) are built on access and expose the same fields as
+beeplan_core's Course / Instructor / Classroom, so UI code and the engine
+adapter accept either form.
+"""
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from engine import is_lab_code
+from scheduler import Course
+
+
+class Interner:
+    """name <-> small integer id."""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+
+    def intern(self, name: str) -> int:
+        i = self.ids.get(name)
+        if i is None:
+            i = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return i
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+# -----------------------------
+# Courses
+# -----------------------------
+class CourseView:
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: "CourseStore", index: int):
+        self.store = store
+        self.index = index
+
+    @property
+    def code(self) -> str:
+        return self.store.codes[self.index]
+
+    @property
+    def name(self) -> str:
+        return self.store.names[self.index]
+
+    @property
+    def year(self) -> int:
+        return self.store.years[self.index]
+
+    @property
+    def students(self) -> int:
+        return self.store.students[self.index]
+
+    @property
+    def hours(self) -> int:
+        return self.store.hours[self.index]
+
+    @property
+    def instructor_id(self) -> int:
+        return self.store.instructor_ids[self.index]
+
+    @property
+    def instructor(self) -> str:
+        return self.store.instructors.names[self.store.instructor_ids[self.index]]
+
+    @property
+    def is_lab(self) -> bool:
+        return bool(self.store.is_lab[self.index])
+
+    def __repr__(self) -> str:
+        return (f"CourseView(code={self.code!r}, year={self.year}, students={self.students}, "
+                f"instructor={self.instructor!r})")
+
+
+class CourseStore:
+    """Courses as columns; instructor "" (unassigned) is interned like any other name."""
+
+    def __init__(self, instructors: Optional[Interner] = None):
+        self.instructors = instructors if instructors is not None else Interner()
+        self.codes: List[str] = []
+        self.names: List[str] = []
+        self.years = array("q")
+        self.students = array("q")
+        self.hours = array("q")
+        self.instructor_ids = array("i")
+        self.is_lab = array("b")
+
+    @classmethod
+    def from_courses(cls, courses: Iterable, instructors: Optional[Interner] = None) -> "CourseStore":
+        store = cls(instructors)
+        store.extend(courses)
+        return store
+
+    def append(self, course) -> None:
+        self.codes.append(course.code)
+        self.names.append(course.name)
+        self.years.append(course.year)
+        self.students.append(course.students)
+        self.hours.append(course.hours)
+        self.instructor_ids.append(self.instructors.intern(course.instructor))
+        self.is_lab.append(is_lab_code(course.code))
+
+    def extend(self, courses: Iterable) -> None:
+        for c in courses:
+            self.append(c)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> CourseView:
+        if index < 0:
+            index += len(self.codes)
+        if not 0 <= index < len(self.codes):
+            raise IndexError(index)
+        return CourseView(self, index)
+
+    def __iter__(self) -> Iterator[CourseView]:
+        for i in range(len(self.codes)):
+            yield CourseView(self, i)
+
+    def take(self, indices: Iterable[int]) -> "CourseStore":
+        """A new store with the given rows (sharing the instructor interner)."""
+        out = CourseStore(self.instructors)
+        for i in indices:
+            out.codes.append(self.codes[i])
+            out.names.append(self.names[i])
+            out.years.append(self.years[i])
+            out.students.append(self.students[i])
+            out.hours.append(self.hours[i])
+            out.instructor_ids.append(self.instructor_ids[i])
+            out.is_lab.append(self.is_lab[i])
+        return out
+
+    def of_year(self, year: int) -> "CourseStore":
+        return self.take(i for i, y in enumerate(self.years) if y == year)
+
+    def model_courses(self) -> List[Course]:
+        """Engine model courses (see engine.model_from_app), built from the columns."""
+        names = self.instructors.names
+        return [
+            Course(code=code, instructor_id=names[ins] or f"(unassigned {code})",
+                   students=students, is_lab=bool(lab), year=year)
+            for code, ins, students, lab, year in zip(
+                self.codes, self.instructor_ids, self.students, self.is_lab, self.years)
+        ]
+
+
+class EntityIndex:
+    """
+    Hash indexes over the loaded data: code -> course, instructor -> courses,
+    year -> courses and instructor name -> instructor record. Works on stores
+    or plain lists; rebuild it whenever courses or instructors are (re)loaded.
+    """
+
+    def __init__(self, courses=(), instructors=()):
+        self.courses = courses
+        self.instructors = instructors
+        self.by_code: Dict[str, int] = {}
+        self.by_instructor: Dict[str, List[int]] = {}
+        self.by_year: Dict[int, List[int]] = {}
+        if isinstance(courses, CourseStore):
+            names = courses.instructors.names
+            rows = zip(courses.codes, courses.years, (names[i] for i in courses.instructor_ids))
+        else:
+            rows = ((c.code, c.year, c.instructor) for c in courses)
+        for i, (code, year, name) in enumerate(rows):
+            self.by_code.setdefault(code, i)  # duplicates: the first row wins
+            self.by_instructor.setdefault(name, []).append(i)
+            self.by_year.setdefault(year, []).append(i)
+        self.instructor_rows: Dict[str, int] = {}
+        for i, ins in enumerate(instructors):
+            self.instructor_rows.setdefault(ins.name, i)
+
+    def course(self, code: str):
+        i = self.by_code.get(code)
+        return None if i is None else self.courses[i]
+
+    def courses_of_instructor(self, name: str) -> list:
+        return [self.courses[i] for i in self.by_instructor.get(name, ())]
+
+    def courses_of_year(self, year: int) -> list:
+        return [self.courses[i] for i in self.by_year.get(year, ())]
+
+    def instructor(self, name: str):
+        i = self.instructor_rows.get(name)
+        return None if i is None else self.instructors[i]
+
+
+def courses_of_year(courses, year: int):
+    """Courses of one year: a CourseStore stays a store, anything else becomes a list."""
+    if isinstance(courses, CourseStore):
+        return courses.of_year(year)
+    return [c for c in courses if c.year == year]
+
+
+# -----------------------------
+# Instructors
+# -----------------------------
+class InstructorView:
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: "InstructorStore", index: int):
+        self.store = store
+        self.index = index
+
+    @property
+    def id(self) -> int:
+        return self.store.ids[self.index]
+
+    @property
+    def name(self) -> str:
+        return self.store.interner.names[self.store.ids[self.index]]
+
+    @property
+    def available(self) -> Optional[List[Tuple[str, str]]]:
+        avail = self.store.available.get(self.index)
+        return list(avail) if avail is not None else None
+
+
+class InstructorStore:
+    """Instructor names as interned ids; availability is kept only for the rows that have it."""
+
+    def __init__(self, interner: Optional[Interner] = None):
+        self.interner = interner if interner is not None else Interner()
+        self.ids = array("i")
+        self.available: Dict[int, Tuple[Tuple[str, str], ...]] = {}
+
+    @classmethod
+    def from_instructors(cls, instructors: Iterable, interner: Optional[Interner] = None) -> "InstructorStore":
+        store = cls(interner)
+        for ins in instructors:
+            if ins.available is not None:
+                store.available[len(store.ids)] = tuple(ins.available)
+            store.ids.append(store.interner.intern(ins.name))
+        return store
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> InstructorView:
+        if index < 0:
+            index += len(self.ids)
+        if not 0 <= index < len(self.ids):
+            raise IndexError(index)
+        return InstructorView(self, index)
+
+    def __iter__(self) -> Iterator[InstructorView]:
+        for i in range(len(self.ids)):
+            yield InstructorView(self, i)
+
+
+# -----------------------------
+# Classrooms
+# -----------------------------
+class RoomView:
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: "RoomStore", index: int):
+        self.store = store
+        self.index = index
+
+    @property
+    def name(self) -> str:
+        return self.store.rooms.names[self.store.ids[self.index]]
+
+    @property
+    def capacity(self) -> int:
+        return self.store.capacities[self.index]
+
+
+class RoomStore:
+    def __init__(self):
+        self.rooms = Interner()
+        self.ids = array("i")
+        self.capacities = array("q")
+
+    @classmethod
+    def from_classrooms(cls, classrooms: Iterable) -> "RoomStore":
+        store = cls()
+        for r in classrooms:
+            store.ids.append(store.rooms.intern(r.name))
+            store.capacities.append(r.capacity)
+        return store
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> RoomView:
+        if index < 0:
+            index += len(self.ids)
+        if not 0 <= index < len(self.ids):
+            raise IndexError(index)
+        return RoomView(self, index)
+
+    def __iter__(self) -> Iterator[RoomView]:
+        for i in range(len(self.ids)):
+            yield RoomView(self, i)
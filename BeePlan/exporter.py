@@ -0,0 +1,225 @@
+"""
+Bulk timetable export for BeePlan.
+
+export_all writes every year, instructor and room view of a schedule in one
+run, as CSV, JSON, iCalendar (.ics) and XLSX:
+- csv/json/ics: one file per view under <out>/<format>/<years|instructors|rooms>/
+- xlsx: one workbook per view kind, one sheet per view (openpyxl write-only)
+Files are written through large buffers row by row, and can be fanned out to
+a thread pool (one task per output file).
+"""
+import csv
+import datetime
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from common_schedule import day_index
+from optional_deps import installed, optional
+
+FORMATS = ("csv", "json", "ics", "xlsx")
+HEADER = ["Day", "Time", "Course", "Instructor", "Room", "Year"]
+BUFFER = 1 << 16
+SLOT_MINUTES = 50  # 9:20-10:10, ...
+
+
+@dataclass(frozen=True)
+class Session:
+    """One placed course in a timetable view."""
+    year: int
+    day: str
+    time: str
+    code: str
+    instructor: str = ""
+    room: str = ""
+
+    def row(self) -> List:
+        return [self.day, self.time, self.code, self.instructor, self.room, self.year]
+
+
+def _minutes(time: str) -> int:
+    hour, minute = time.split(":")[:2]
+    return int(hour) * 60 + int(minute)
+
+
+def _order(s: Session) -> Tuple:
+    day = day_index(s.day)
+    return (day if day is not None else 99, _minutes(s.time), s.code)
+
+
+def build_views(sessions: Iterable[Session]) -> Dict[str, Dict[str, List[Session]]]:
+    """{"years": {name: sessions}, "instructors": {...}, "rooms": {...}}, each view in day/time order."""
+    views: Dict[str, Dict[str, List[Session]]] = {"years": {}, "instructors": {}, "rooms": {}}
+    for s in sessions:
+        views["years"].setdefault(f"Year {s.year}" if s.year else "No year", []).append(s)
+        if s.instructor:
+            views["instructors"].setdefault(s.instructor, []).append(s)
+        if s.room:
+            views["rooms"].setdefault(s.room, []).append(s)
+    for kind in views.values():
+        for view in kind.values():
+            view.sort(key=_order)
+    return views
+
+
+def available_formats() -> List[str]:
+    """FORMATS minus xlsx when openpyxl is missing."""
+    return [f for f in FORMATS if f != "xlsx" or installed("openpyxl")]
+
+
+def safe_name(name: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", name).strip("_") or "view"
+
+
+# -----------------------------
+# Writers (one output file each)
+# -----------------------------
+def write_csv(path: str, sessions: List[Session]) -> None:
+    with open(path, "w", encoding="utf-8", newline="", buffering=BUFFER) as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        for s in sessions:
+            writer.writerow(s.row())
+
+
+def write_json(path: str, name: str, sessions: List[Session]) -> None:
+    with open(path, "w", encoding="utf-8", buffering=BUFFER) as f:
+        f.write('{"view": %s, "sessions": [' % json.dumps(name, ensure_ascii=False))
+        for i, s in enumerate(sessions):
+            f.write(("\n  " if i == 0 else ",\n  ") + json.dumps(asdict(s), ensure_ascii=False))
+        f.write("\n]}\n")
+
+
+def _ics_text(value: str) -> str:
+    return value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _ics_fold(line: str) -> str:
+    """Fold content lines at 75 octets (RFC 5545 3.1)."""
+    out, buf, size = [], "", 0
+    for ch in line:
+        n = len(ch.encode("utf-8"))
+        if size + n > 75:
+            out.append(buf)
+            buf, size = " ", 1
+        buf += ch
+        size += n
+    out.append(buf)
+    return "\r\n".join(out)
+
+
+def write_ics(path: str, name: str, sessions: List[Session], week_of: datetime.date,
+              stamp: datetime.datetime, slot_minutes: int = SLOT_MINUTES) -> None:
+    """Weekly recurring events, starting in the week of week_of (floating local time)."""
+    monday = week_of - datetime.timedelta(days=week_of.weekday())
+    dtstamp = stamp.strftime("%Y%m%dT%H%M%SZ")
+    with open(path, "w", encoding="utf-8", newline="", buffering=BUFFER) as f:
+        f.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//BeePlan//Timetable Export//EN\r\n")
+        f.write(_ics_fold(f"X-WR-CALNAME:{_ics_text(name)}") + "\r\n")
+        for s in sessions:
+            day = day_index(s.day)
+            if day is None:
+                continue
+            start = datetime.datetime.combine(monday + datetime.timedelta(days=day), datetime.time()) \
+                + datetime.timedelta(minutes=_minutes(s.time))
+            end = start + datetime.timedelta(minutes=slot_minutes)
+            where = f"\r\n{_ics_fold('LOCATION:' + _ics_text(s.room))}" if s.room else ""
+            who = f" ({s.instructor})" if s.instructor else ""
+            f.write(
+                "BEGIN:VEVENT\r\n"
+                + _ics_fold(f"UID:{safe_name(s.code)}-{day}-{s.time.replace(':', '')}-{safe_name(name)}@beeplan") + "\r\n"
+                + f"DTSTAMP:{dtstamp}\r\n"
+                + f"DTSTART:{start:%Y%m%dT%H%M%S}\r\nDTEND:{end:%Y%m%dT%H%M%S}\r\n"
+                + "RRULE:FREQ=WEEKLY\r\n"
+                + _ics_fold(f"SUMMARY:{_ics_text(s.code + who)}") + where + "\r\n"
+                + "END:VEVENT\r\n"
+            )
+        f.write("END:VCALENDAR\r\n")
+
+
+def _sheet_title(name: str, used: set) -> str:
+    base = re.sub(r"[\[\]:*?/\\]", "_", name)[:31] or "Sheet"
+    title, n = base, 1
+    while title.lower() in used:
+        n += 1
+        suffix = f"~{n}"
+        title = base[:31 - len(suffix)] + suffix
+    used.add(title.lower())
+    return title
+
+
+def write_xlsx(path: str, views: Dict[str, List[Session]]) -> None:
+    """One sheet per view, streamed with openpyxl's write-only workbook."""
+    openpyxl = optional("openpyxl")
+    if openpyxl is None:
+        raise RuntimeError("openpyxl is required for XLSX export (pip install openpyxl).")
+    wb = openpyxl.Workbook(write_only=True)
+    used: set = set()
+    for name, sessions in views.items():
+        ws = wb.create_sheet(title=_sheet_title(name, used))
+        ws.append(HEADER)
+        for s in sessions:
+            ws.append(s.row())
+    wb.save(path)
+
+
+# -----------------------------
+# Driver
+# -----------------------------
+def export_all(
+    sessions: Iterable[Session],
+    out_dir: str,
+    formats: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+    week_of: Optional[datetime.date] = None,
+) -> List[str]:
+    """
+    Write every view in every format under out_dir; returns the written paths
+    (sorted). formats defaults to available_formats(). workers > 1 writes that
+    many files at a time on a thread pool.
+    """
+    formats = [f for f in (available_formats() if formats is None else formats) if f in FORMATS]
+    week_of = week_of or datetime.date.today()
+    stamp = datetime.datetime.now(datetime.timezone.utc)
+    views = build_views(sessions)
+
+    jobs: List[Tuple[Callable, tuple]] = []
+    paths: List[str] = []
+    for fmt in formats:
+        if fmt == "xlsx":
+            os.makedirs(out_dir, exist_ok=True)
+            for kind, named in views.items():
+                if named:
+                    path = os.path.join(out_dir, f"{kind}.xlsx")
+                    jobs.append((write_xlsx, (path, named)))
+                    paths.append(path)
+            continue
+        for kind, named in views.items():
+            folder = os.path.join(out_dir, fmt, kind)
+            os.makedirs(folder, exist_ok=True)
+            taken: Dict[str, int] = {}
+            for name, view in named.items():
+                stem = safe_name(name)
+                taken[stem] = taken.get(stem, 0) + 1
+                if taken[stem] > 1:  # two names that sanitize alike
+                    stem = f"{stem}_{taken[stem]}"
+                path = os.path.join(folder, f"{stem}.{fmt}")
+                if fmt == "csv":
+                    jobs.append((write_csv, (path, view)))
+                elif fmt == "json":
+                    jobs.append((write_json, (path, name, view)))
+                else:
+                    jobs.append((write_ics, (path, name, view, week_of, stamp)))
+                paths.append(path)
+
+    if workers is not None and workers > 1 and len(jobs) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for fut in [ex.submit(fn, *args) for fn, args in jobs]:
+                fut.result()
+    else:
+        for fn, args in jobs:
+            fn(*args)
+    return sorted(paths)
@@ -0,0 +1,114 @@
+"""
+Feasibility of (course, slot, room) cells for BeePlan.
+
+Course c may sit in room r at slot s when the room is big enough and of the
+course's type (same partition rules as scheduler.RoomIndex), the slot is not
+blocked, the instructor is available and no reservation (common schedule)
+holds the room, instructor or year. That test separates into three factors:
+- per course: a slot mask (blocked slots, availability, instructor/year reservations)
+- per room: a slot mask (room reservations)
+- per (course, room): whether the room fits (capacity and type)
+Domains and re-checks combine the two masks with one AND where the room
+fits, so nothing of size courses x slots x rooms is built.
+"""
+from typing import Dict, List, Optional, Tuple
+
+from scheduler import (
+    ALL_SLOTS,
+    BLOCKED_MASK,
+    Classroom,
+    Course,
+    Placement,
+    Reservations,
+    RoomIndex,
+    Schedule,
+    slot_index,
+)
+
+
+def _type_ok(rooms: List[Classroom]) -> Tuple[List[bool], List[bool]]:
+    """Per room: usable by lab courses, usable by theory courses."""
+    has_lab = any(r.room_type == "lab" for r in rooms)
+    has_theory = any(r.room_type == "theory" for r in rooms)
+    lab_ok = [r.room_type == "lab" or not has_lab for r in rooms]
+    theory_ok = [r.room_type == "theory" or not has_theory for r in rooms]
+    return lab_ok, theory_ok
+
+
+def course_slot_masks(
+    courses: List[Course],
+    blocked: int = BLOCKED_MASK,
+    availability: Optional[Dict[str, int]] = None,
+    reserved: Optional[Reservations] = None,
+) -> List[int]:
+    """
+    Per course: slots it may use in any room. availability maps
+    instructor_id -> mask of slots they can teach; instructors not listed are
+    always available.
+    """
+    availability = availability or {}
+    reserved = reserved or Reservations()
+    open_slots = ALL_SLOTS & ~blocked
+    return [open_slots & availability.get(c.instructor_id, ALL_SLOTS) & ~reserved.course_mask(c) for c in courses]
+
+
+def room_slot_masks(rooms: List[Classroom], reserved: Optional[Reservations] = None) -> Dict[str, int]:
+    """room_id -> slots the room is not reserved."""
+    held = reserved.rooms if reserved else {}
+    return {r.id: ALL_SLOTS & ~held.get(r.id, 0) for r in rooms}
+
+
+def feasible_domains(
+    courses: List[Course],
+    rooms: List[Classroom],
+    blocked: int = BLOCKED_MASK,
+    availability: Optional[Dict[str, int]] = None,
+    reserved: Optional[Reservations] = None,
+) -> List[Dict[str, int]]:
+    """
+    Per course: room_id -> mask of legal slots, for every room of its type that
+    fits (the CSP engine's initial domains).
+    """
+    room_index = RoomIndex(rooms)
+    room_masks = room_slot_masks(rooms, reserved)
+    return [
+        {r.id: mask & room_masks[r.id] for r in room_index.fitting(c)}
+        for c, mask in zip(courses, course_slot_masks(courses, blocked, availability, reserved))
+    ]
+
+
+def illegal_placements(
+    courses: List[Course],
+    rooms: List[Classroom],
+    schedule: Schedule,
+    blocked: int = BLOCKED_MASK,
+    availability: Optional[Dict[str, int]] = None,
+    reserved: Optional[Reservations] = None,
+) -> List[Tuple[Tuple[int, int], Placement]]:
+    """
+    Bulk re-check of a finished schedule against capacity, room type, blocked
+    slots, availability and reservations: per placement, the course's slot
+    mask, the room's slot mask and whether the room fits the course.
+    Placements of unknown courses or rooms are reported as illegal.
+    """
+    by_code: Dict[str, int] = {}
+    for n, c in enumerate(courses):
+        by_code.setdefault(c.code, n)
+    col = {r.id: n for n, r in enumerate(rooms)}
+    lab_ok, theory_ok = _type_ok(rooms)
+    course_masks = course_slot_masks(courses, blocked, availability, reserved)
+    room_masks = room_slot_masks(rooms, reserved)
+
+    bad = []
+    for key, row in schedule.items():
+        bit = 1 << slot_index(*key)
+        for p in row.values():
+            c, r = by_code.get(p.course_code), col.get(p.room_id)
+            if c is None or r is None:
+                bad.append((key, p))
+                continue
+            course, room = courses[c], rooms[r]
+            fits = room.capacity >= course.students and (lab_ok[r] if course.is_lab else theory_ok[r])
+            if not (fits and course_masks[c] & room_masks[room.id] & bit):
+                bad.append((key, p))
+    return bad
@@ -0,0 +1,210 @@
+"""
+On-disk cache of parsed BeePlan inputs.
+
+Parsed records (Course/Instructor/Classroom dataclasses) are stored as
+pickled field tuples, one file per (content hash, record type). An index
+remembers each source path's mtime, size and hash:
+- same path, mtime and size -> the stored hash is trusted, no re-read
+- changed mtime/size -> the file is re-hashed; identical content still hits,
+  different content is re-parsed and the stale entry is replaced
+Entries are evicted least-recently-used once the cache exceeds max_bytes.
+Several processes may share a cache (folder loads, batch runs): index.json is
+only read-modified-written under an exclusive lock on index.lock, entry files
+are written atomically, and entry files missing from the index are adopted
+at the next eviction so they still count against max_bytes.
+Entry names key the record type, its fields and the caller's parser version.
+"""
+import dataclasses
+import errno
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Type
+
+CACHE_FORMAT = 1
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def default_cache_dir() -> str:
+    env = os.environ.get("BEEPLAN_CACHE_DIR")
+    if env:
+        return env
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "beeplan")
+
+
+def file_digest(path: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class ParsedInputCache:
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(self.cache_dir, "index.json")
+        self.lock_path = os.path.join(self.cache_dir, "index.lock")
+        self.hits = 0
+        self.misses = 0
+
+    # -------- Index ----------
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Exclusive lock on the index across processes."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self.lock_path, "a+b") as f:
+            if os.name == "nt":
+                import msvcrt
+
+                f.seek(0)
+                while True:
+                    try:
+                        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError as e:  # LK_LOCK gives up after ~10 s
+                        if e.errno != errno.EDEADLOCK:
+                            raise
+                try:
+                    yield
+                finally:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _read_index(self) -> Dict:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("format") == CACHE_FORMAT:
+                return index
+        except (OSError, ValueError):
+            pass
+        return {"format": CACHE_FORMAT, "sources": {}, "entries": {}}
+
+    def _write_index(self, index: Dict) -> None:
+        self._atomic_write(self.index_path, json.dumps(index).encode("utf-8"))
+
+    def _atomic_write(self, path: str, data: bytes) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    # -------- Lookup ----------
+    @staticmethod
+    def _entry_name(digest: str, cls: Type, version: str = "") -> str:
+        # record fields and parser version are part of the key, so changing
+        # either invalidates old entries
+        names = ",".join(f.name for f in dataclasses.fields(cls))
+        tag = hashlib.blake2b(f"{cls.__name__}:{names}:{version}".encode(), digest_size=4).hexdigest()
+        return f"{digest}-{cls.__name__.lower()}-{tag}.pkl"
+
+    def load(self, path: str, cls: Type, parse: Callable[[str], List], version: str = "") -> List:
+        """
+        Parsed records for path: from the cache if the content is unchanged, else
+        via parse(path). version identifies the parser (bump it when parsing or
+        field aliases change). The lock is not held while hashing or parsing.
+        """
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        with self._locked():
+            source = self._read_index()["sources"].get(path)
+        if source and source["mtime_ns"] == st.st_mtime_ns and source["size"] == st.st_size:
+            digest = source["digest"]
+        else:
+            digest = file_digest(path)
+
+        name = self._entry_name(digest, cls, version)
+        entry_path = os.path.join(self.cache_dir, name)
+        records = None
+        try:
+            with open(entry_path, "rb") as f:
+                records = [cls(*row) for row in pickle.load(f)]
+        except (OSError, pickle.UnpicklingError, EOFError, TypeError):
+            records = None  # missing or damaged entry: (re)build it below
+
+        written = None
+        if records is None:
+            self.misses += 1
+            records = parse(path)
+            names = [f.name for f in dataclasses.fields(cls)]
+            rows = [tuple(getattr(r, n) for n in names) for r in records]
+            data = pickle.dumps(rows, protocol=pickle.HIGHEST_PROTOCOL)
+            self._atomic_write(entry_path, data)
+            written = len(data)
+        else:
+            self.hits += 1
+
+        with self._locked():
+            index = self._read_index()
+            index["sources"][path] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "digest": digest}
+            entry = index["entries"].get(name)
+            if written is not None or entry is None:  # new, or written by a process that lost its index update
+                index["entries"][name] = {"bytes": written if written is not None else _file_bytes(entry_path),
+                                          "used": time.time()}
+                self._evict(index, keep=name)
+            else:
+                entry["used"] = time.time()
+            self._write_index(index)
+        return records
+
+    def _evict(self, index: Dict, keep: str) -> None:
+        """Drop least-recently-used entries until the cache fits max_bytes (index lock held)."""
+        entries = index["entries"]
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".pkl") and name not in entries:  # orphan: count it, oldest first
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    entries[name] = {"bytes": os.path.getsize(path), "used": os.path.getmtime(path)}
+                except OSError:
+                    pass
+        total = sum(e["bytes"] for e in entries.values())
+        for name in sorted(entries, key=lambda n: entries[n]["used"]):
+            if total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            total -= entries.pop(name)["bytes"]
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except OSError:
+                pass
+        live = {name.split("-", 1)[0] for name in entries}
+        index["sources"] = {p: s for p, s in index["sources"].items() if s["digest"] in live}
+
+    def clear(self) -> None:
+        with self._locked():
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".pkl"):
+                    try:
+                        os.remove(os.path.join(self.cache_dir, name))
+                    except OSError:
+                        pass
+            self._write_index({"format": CACHE_FORMAT, "sources": {}, "entries": {}})
+
+
+def _file_bytes(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
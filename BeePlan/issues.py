@@ -0,0 +1,97 @@
+"""
+Structured schedule issues for BeePlan.
+
+Engines report problems as Issue records instead of preformatted lines, so
+callers can group, count and page through them without parsing text:
+- Issue.message renders the classic report line ("CONFLICT: ...", "WARNING: ...")
+- IssueReport keeps the issues of a run together with their positions per
+  severity and per type, updated as issues are added, so counts and filtered
+  pages never rescan the list
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Sequence
+
+CRITICAL = "critical"
+WARNING = "warning"
+
+# Issue types raised by the engines and the all-years merge
+INSTRUCTOR_OVERLAP = "instructor_overlap"
+ROOM_OVERLAP = "room_overlap"
+NO_ROOM = "capacity"
+UNSCHEDULED = "unscheduled"
+YEAR_CLASH = "year_clash"
+
+# type -> report line; other types (e.g. validation findings) show their detail
+MESSAGES = {
+    INSTRUCTOR_OVERLAP: "CONFLICT: Instructor overlap at {day} {time} ({detail} vs {course}) instructor={instructor}",
+    ROOM_OVERLAP: "CONFLICT: Room overlap at {day} {time} room={room} ({detail} vs {course})",
+    NO_ROOM: "WARNING: Capacity - No room fits {course} ({detail}).",
+    UNSCHEDULED: "WARNING: Unscheduled - Could not place {course} (no available slot).",
+    YEAR_CLASH: "{course}: {instructor} also teaches another year at {day} {time}",
+}
+NO_ISSUES = "No conflicts or warnings found."
+
+
+@dataclass(frozen=True)
+class Issue:
+    type: str
+    severity: str  # CRITICAL or WARNING
+    course: str = ""
+    day: str = ""  # a scheduler.DAYS name, "" when the issue is not tied to a slot
+    time: str = ""  # a scheduler.TIMES label
+    room: str = ""
+    instructor: str = ""
+    detail: str = ""  # the other course of an overlap, the class size, ...
+
+    @property
+    def message(self) -> str:
+        return MESSAGES.get(self.type, "{detail}").format_map(vars(self))
+
+
+def report_lines(issues: Iterable[Issue]) -> List[str]:
+    """The engines' classic report: one line per issue, or a single "no issues" line."""
+    return [issue.message for issue in issues] or [NO_ISSUES]
+
+
+class IssueReport:
+    """
+    Issues of a run plus, per severity and per type, the positions of its
+    issues in the list. Built once per result; views read counts and pages.
+    """
+
+    def __init__(self, issues: Iterable[Issue] = ()):
+        self.issues: List[Issue] = []
+        self.by_severity: Dict[str, List[int]] = {}
+        self.by_type: Dict[str, List[int]] = {}
+        self.extend(issues)
+
+    def extend(self, issues: Iterable[Issue]) -> None:
+        for issue in issues:
+            n = len(self.issues)
+            self.issues.append(issue)
+            self.by_severity.setdefault(issue.severity, []).append(n)
+            self.by_type.setdefault(issue.type, []).append(n)
+
+    def __len__(self) -> int:
+        return len(self.issues)
+
+    def count(self, severity: str) -> int:
+        return len(self.by_severity.get(severity, ()))
+
+    def type_counts(self) -> Dict[str, int]:
+        """type -> count, most frequent first."""
+        return {t: len(pos) for t, pos in sorted(self.by_type.items(), key=lambda item: (-len(item[1]), item[0]))}
+
+    def positions(self, group: str = "") -> Sequence[int]:
+        """Positions of a severity or a type ("" = every issue)."""
+        if not group:
+            return range(len(self.issues))
+        return self.by_severity.get(group) or self.by_type.get(group, [])
+
+    def page(self, number: int, size: int, group: str = "") -> List[Issue]:
+        """Issues of page `number` (0-based) of a group."""
+        positions = self.positions(group)
+        return [self.issues[i] for i in positions[number * size:(number + 1) * size]]
+
+    def page_count(self, size: int, group: str = "") -> int:
+        return max(1, -(-len(self.positions(group)) // size))
@@ -0,0 +1,325 @@
+"""
+Local-search improver for BeePlan schedules.
+
+Starts from a greedy schedule and runs simulated annealing over feasible
+timetables: move, swap and Kempe-chain moves reshuffle placed courses, and
+insert/eject moves bring unscheduled courses in (possibly pushing clashing
+ones out). The cost is the number of unscheduled courses, updated
+incrementally per move. Several seeded restarts can run in a process pool;
+the best one wins.
+"""
+import math
+import random
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from issues import Issue
+from scheduler import (
+    SLOT_COUNT,
+    Classroom,
+    Course,
+    OccupancyIndex,
+    Placement,
+    Progress,
+    Reservations,
+    RoomIndex,
+    Schedule,
+    greedy_schedule,
+    slot_index,
+    slot_of,
+    unplaced_issue,
+)
+
+DEFAULT_ITERATIONS = 20000
+
+Cell = Tuple[int, str]  # (slot bit index, room_id)
+
+
+class _State:
+    """
+    A feasible timetable: every placed course is clash-free by construction.
+    Placed courses are also kept in a list with each one's position (removal
+    swaps the last one in), so moves draw a random course in O(1), and each
+    slot's courses are a set.
+    """
+
+    def __init__(self, courses: List[Course], rooms: List[Classroom], start: Dict[int, Cell],
+                 reserved: Optional[Reservations] = None):
+        self.courses = courses
+        self.room_index = RoomIndex(rooms)
+        self.fits = [self.room_index.fitting(c) for c in courses]
+        self.index = OccupancyIndex(reserved=reserved)
+        self.cells: Dict[int, Cell] = {}
+        self.placed: List[int] = []
+        self.position: Dict[int, int] = {}  # var -> index in placed
+        self.by_slot: Dict[int, Set[int]] = {}
+        self.open_slots = [i for i in range(SLOT_COUNT) if not (self.index.blocked >> i) & 1]
+        for var, (slot, room_id) in start.items():
+            self.put(var, slot, room_id)
+        # only courses with a fitting room can ever be placed
+        self.unscheduled = [v for v in range(len(courses)) if v not in self.cells and self.fits[v]]
+
+    @property
+    def cost(self) -> int:
+        return len(self.unscheduled)
+
+    # -------- Cell bookkeeping ----------
+    def put(self, var: int, slot: int, room_id: str) -> None:
+        day_idx, time_idx = slot_of(slot)
+        self.index.reserve(day_idx, time_idx, self.courses[var], room_id)
+        self.cells[var] = (slot, room_id)
+        self.position[var] = len(self.placed)
+        self.placed.append(var)
+        self.by_slot.setdefault(slot, set()).add(var)
+
+    def take(self, var: int) -> Cell:
+        slot, room_id = self.cells.pop(var)
+        day_idx, time_idx = slot_of(slot)
+        self.index.release(day_idx, time_idx, self.courses[var], room_id)
+        pos, last = self.position.pop(var), self.placed.pop()
+        if last != var:
+            self.placed[pos] = last
+            self.position[last] = pos
+        self.by_slot[slot].discard(var)
+        return slot, room_id
+
+    def random_placed(self, rng: random.Random) -> int:
+        return self.placed[rng.randrange(len(self.placed))]
+
+    def free_room(self, var: int, slot: int) -> Optional[str]:
+        """Smallest fitting room free at slot, if the course's instructor and year are free too."""
+        course = self.courses[var]
+        bit = 1 << slot
+        if self.index.held(course) & bit:
+            return None
+        room = self.room_index.smallest_free(course, bit, self.index.rooms)
+        return room.id if room else None
+
+    def clashes(self, a: int, b: int) -> bool:
+        ca, cb = self.courses[a], self.courses[b]
+        return ca.instructor_id == cb.instructor_id or bool(ca.year and ca.year == cb.year)
+
+    def relocate(self, moving: List[Tuple[int, int]]) -> bool:
+        """
+        Move each (var, new_slot) at once, picking rooms in the new slots.
+        All or nothing: on failure the old cells are restored.
+        """
+        old = [(var, self.take(var)) for var, _ in moving]
+        done: List[int] = []
+        for var, slot in moving:
+            room_id = self.free_room(var, slot)
+            if room_id is None:
+                for v in done:
+                    self.take(v)
+                for v, (s, r) in old:
+                    self.put(v, s, r)
+                return False
+            self.put(var, slot, room_id)
+            done.append(var)
+        return True
+
+    def snapshot(self) -> Dict[int, Cell]:
+        return dict(self.cells)
+
+
+# -------- Moves ----------
+# Each returns (delta_cost, undo) or None if the move is not possible.
+def _move(state: _State, rng: random.Random):
+    if not state.cells:
+        return None
+    var = state.random_placed(rng)
+    old_slot, old_room = state.cells[var]
+    slot = rng.choice(state.open_slots)
+    if slot == old_slot or not state.relocate([(var, slot)]):
+        return None
+
+    def undo():
+        state.take(var)
+        state.put(var, old_slot, old_room)
+    return 0, undo
+
+
+def _swap(state: _State, rng: random.Random):
+    if len(state.cells) < 2:
+        return None
+    i = rng.randrange(len(state.placed))
+    j = rng.randrange(len(state.placed) - 1)
+    a, b = state.placed[i], state.placed[j + (j >= i)]
+    (sa, ra), (sb, rb) = state.cells[a], state.cells[b]
+    if sa == sb or not state.relocate([(a, sb), (b, sa)]):
+        return None
+
+    def undo():
+        state.take(a)
+        state.take(b)
+        state.put(a, sa, ra)
+        state.put(b, sb, rb)
+    return 0, undo
+
+
+def _kempe(state: _State, rng: random.Random):
+    """Swap the slots of a connected clash component spanning two slots."""
+    if not state.cells:
+        return None
+    start = state.random_placed(rng)
+    s1 = state.cells[start][0]
+    s2 = rng.choice(state.open_slots)
+    if s1 == s2:
+        return None
+    pool = list(state.by_slot.get(s1, ())) + list(state.by_slot.get(s2, ()))
+    chain = [start]
+    seen = {start}
+    i = 0
+    while i < len(chain):
+        cur = chain[i]
+        for other in pool:
+            if other not in seen and state.clashes(cur, other):
+                seen.add(other)
+                chain.append(other)
+        i += 1
+    old = {var: state.cells[var] for var in chain}
+    moving = [(var, s2 if old[var][0] == s1 else s1) for var in chain]
+    if not state.relocate(moving):
+        return None
+
+    def undo():
+        for var in chain:
+            state.take(var)
+        for var in chain:
+            state.put(var, *old[var])
+    return 0, undo
+
+
+def _insert(state: _State, rng: random.Random):
+    """Place an unscheduled course, ejecting whatever blocks the chosen slot."""
+    if not state.unscheduled:
+        return None
+    pos = rng.randrange(len(state.unscheduled))
+    var = state.unscheduled[pos]
+    slot = rng.choice(state.open_slots)
+
+    ejected = [v for v in state.by_slot.get(slot, ()) if state.clashes(var, v)]
+    old = {v: state.take(v) for v in ejected}
+    room_id = state.free_room(var, slot)
+    if room_id is None:
+        # all fitting rooms taken: eject the occupant of one of them
+        occupants = {state.cells[v][1]: v for v in state.by_slot.get(slot, ())}
+        fitting = [r.id for r in state.fits[var] if r.id in occupants]
+        if fitting:
+            victim = occupants[rng.choice(fitting)]
+            old[victim] = state.take(victim)
+            ejected.append(victim)
+            room_id = state.free_room(var, slot)
+    if room_id is None:
+        for v, (s, r) in old.items():
+            state.put(v, s, r)
+        return None
+
+    state.put(var, slot, room_id)
+    state.unscheduled[pos] = state.unscheduled[-1]
+    state.unscheduled.pop()
+    state.unscheduled.extend(ejected)
+
+    def undo():
+        state.take(var)
+        del state.unscheduled[len(state.unscheduled) - len(ejected):]  # appended above
+        for v, (s, r) in old.items():
+            state.put(v, s, r)
+        state.unscheduled.append(var)
+    return len(ejected) - 1, undo
+
+
+_MOVES = ((_insert, 0.4), (_move, 0.2), (_swap, 0.2), (_kempe, 0.2))
+
+
+def _anneal(args, progress: Optional[Progress] = None) -> Tuple[int, Dict[int, Cell]]:
+    """One seeded run; top-level so worker processes can pickle it (progress only in-process)."""
+    courses, rooms, start, seed, iterations, time_limit, reserved = args
+    rng = random.Random(seed)
+    state = _State(courses, rooms, start, reserved)
+    best_cost, best = state.cost, state.snapshot()
+    deadline = time.monotonic() + time_limit if time_limit else None
+    moves = [m for m, _ in _MOVES]
+    weights = [w for _, w in _MOVES]
+    t0, t_end = 1.0, 0.01
+
+    for it in range(iterations):
+        if best_cost == 0:
+            break
+        if it % 256 == 0:
+            if deadline is not None and time.monotonic() > deadline:
+                break
+            if progress is not None:
+                progress(len(best), len(courses), 0)
+        temp = t0 * (t_end / t0) ** (it / iterations)
+        applied = rng.choices(moves, weights)[0](state, rng)
+        if applied is None:
+            continue
+        delta, undo = applied
+        if delta > 0 and rng.random() >= math.exp(-delta / temp):
+            undo()
+            continue
+        if state.cost < best_cost:
+            best_cost, best = state.cost, state.snapshot()
+    return best_cost, best
+
+
+def improve_schedule(
+    courses: List[Course],
+    rooms: List[Classroom],
+    schedule: Optional[Schedule] = None,
+    seed: int = 0,
+    iterations: int = DEFAULT_ITERATIONS,
+    time_limit: Optional[float] = None,
+    restarts: int = 1,
+    workers: Optional[int] = None,
+    reserved: Optional[Reservations] = None,
+    progress: Optional[Progress] = None,
+) -> Tuple[Schedule, List[Issue], int, int]:
+    """
+    Improve a schedule (greedy_schedule's by default) by local search.
+    Reserved cells (the common schedule) stay off limits throughout.
+    Runs `restarts` annealing runs seeded from `seed`, in a process pool when
+    workers > 1, and keeps the one with the fewest unscheduled courses (ties go
+    to the lowest restart). The iteration budget is deterministic for a seed;
+    time_limit (seconds per run) is a wall-clock cap and is not. progress
+    follows the greedy start and then the in-process annealing runs, and ends
+    at the courses placed by the kept run.
+    Returns the same tuple as the scheduling engines.
+    """
+    courses_sorted = sorted(courses, key=lambda c: c.code)
+    if schedule is None:
+        schedule = greedy_schedule(courses, rooms, reserved, progress)[0]
+
+    by_code: Dict[str, List[int]] = {}
+    for var, course in enumerate(courses_sorted):
+        by_code.setdefault(course.code, []).append(var)
+    start: Dict[int, Cell] = {}
+    for (day_idx, time_idx), row in sorted(schedule.items()):
+        for room_id, placement in sorted(row.items()):
+            vars_ = by_code.get(placement.course_code)
+            if vars_:
+                start[vars_.pop(0)] = (slot_index(day_idx, time_idx), room_id)
+
+    jobs = [(courses_sorted, rooms, start, seed + i, iterations, time_limit, reserved)
+            for i in range(max(1, restarts))]
+    if workers is not None and workers > 1 and len(jobs) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            runs = list(ex.map(_anneal, jobs))
+    else:
+        runs = [_anneal(job, progress) for job in jobs]
+    _, cells = min(runs, key=lambda run: run[0])
+    if progress is not None:
+        progress(len(cells), len(courses_sorted), 0)
+
+    result: Schedule = {}
+    for var, (slot, room_id) in cells.items():
+        course = courses_sorted[var]
+        result.setdefault(slot_of(slot), {})[room_id] = Placement(course.code, course.instructor_id, room_id)
+
+    room_index = RoomIndex(rooms)
+    issues = [unplaced_issue(course, room_index.smallest(course) is not None)
+              for var, course in enumerate(courses_sorted) if var not in cells]
+    return result, issues, 0, len(issues)
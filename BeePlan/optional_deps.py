@@ -0,0 +1,25 @@
+"""
+Optional dependencies, imported on first use.
+
+openpyxl (CommonSchedule.xlsx, XLSX export) is slow to import and may be
+missing. Modules ask for it here when they need it instead of at import
+time, so headless callers (beeplan_cli, batch runs) start without paying
+for a library they never touch.
+"""
+import importlib
+import importlib.util
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def optional(name: str):
+    """The imported module, or None if it is not installed."""
+    try:
+        return importlib.import_module(name)
+    except Exception:
+        return None
+
+
+def installed(name: str) -> bool:
+    """True if the module is available, without importing it."""
+    return importlib.util.find_spec(name) is not None
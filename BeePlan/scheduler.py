@@ -1,5 +1,8 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from issues import CRITICAL, INSTRUCTOR_OVERLAP, NO_ROOM, ROOM_OVERLAP, UNSCHEDULED, WARNING, Issue
 
 DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
 TIMES = ["09:20", "10:20", "11:20", "12:20", "13:20", "14:20", "15:20", "16:20"]
@@ -7,6 +10,11 @@ TIMES = ["09:20", "10:20", "11:20", "12:20", "13:20", "14:20", "15:20", "16:20"]
 # Friday exam block 13:20–15:10 -> block 13:20 and 14:20 slots
 BLOCKED = {(4, 4), (4, 5)}  # (day_idx, time_idx)
 
+# Bitset layout: one bit per slot, numbered in the scheduler's scan order
+# (time-major), so the lowest free bit is the first slot the greedy pass tries.
+SLOT_COUNT = len(DAYS) * len(TIMES)
+ALL_SLOTS = (1 << SLOT_COUNT) - 1
+
 
 @dataclass(frozen=True)
 class Course:
@@ -14,6 +22,7 @@ class Course:
     instructor_id: str
     students: int
     is_lab: bool = False
+    year: int = 0  # 0 = not tied to a year cohort
 
 
 @dataclass(frozen=True)
@@ -21,6 +30,7 @@ class Classroom:
     id: str
     name: str
     capacity: int
+    room_type: str = "theory"  # "lab" or "theory"
 
 
 @dataclass(frozen=True)
@@ -36,75 +46,601 @@ class Placement:
     room_id: str
 
 
+# (day_idx, time_idx) -> room_id -> Placement: one row of the slot x room matrix per slot
+Schedule = Dict[Tuple[int, int], Dict[str, Placement]]
+
+# progress(done, total, conflicts_so_far): engines report as they go; raising aborts the run.
+# The greedy pass counts the courses it has dealt with (placed or not), so it ends
+# at total; the search engines count the courses of their best assignment so far.
+Progress = Callable[[int, int, int], None]
+
+
+def slot_index(day_idx: int, time_idx: int) -> int:
+    return time_idx * len(DAYS) + day_idx
+
+
+def slot_of(index: int) -> Tuple[int, int]:
+    """Inverse of slot_index: bit position -> (day_idx, time_idx)."""
+    time_idx, day_idx = divmod(index, len(DAYS))
+    return day_idx, time_idx
+
+
+def slot_bit(day_idx: int, time_idx: int) -> int:
+    return 1 << slot_index(day_idx, time_idx)
+
+
+def slots_to_mask(slots: Iterable[Tuple[int, int]]) -> int:
+    mask = 0
+    for day_idx, time_idx in slots:
+        mask |= slot_bit(day_idx, time_idx)
+    return mask
+
+
+def iter_slots(mask: int) -> Iterator[Tuple[int, int]]:
+    """Yield (day_idx, time_idx) for every set bit, lowest (earliest) first."""
+    while mask:
+        low = mask & -mask
+        yield slot_of(low.bit_length() - 1)
+        mask ^= low
+
+
+BLOCKED_MASK = slots_to_mask(BLOCKED)
+
+
+@dataclass
+class Reservations:
+    """
+    Cells taken before scheduling starts (e.g. the faculty common schedule):
+    slot masks per room, instructor and year, plus slots closed to everyone.
+    `unavailable` holds the slots instructors cannot teach (their availability);
+    engines keep out of them like blocked slots and do not report them as overlaps.
+    """
+    slots: int = 0
+    rooms: Dict[str, int] = field(default_factory=dict)
+    instructors: Dict[str, int] = field(default_factory=dict)
+    years: Dict[int, int] = field(default_factory=dict)
+    unavailable: Dict[str, int] = field(default_factory=dict)
+
+    def reserve(self, day_idx: int, time_idx: int, room_id: Optional[str] = None,
+                instructor_id: Optional[str] = None, year: int = 0) -> None:
+        """Take one slot; with no room, instructor or year it is closed to everyone."""
+        bit = slot_bit(day_idx, time_idx)
+        if room_id:
+            self.rooms[room_id] = self.rooms.get(room_id, 0) | bit
+        if instructor_id:
+            self.instructors[instructor_id] = self.instructors.get(instructor_id, 0) | bit
+        if year:
+            self.years[year] = self.years.get(year, 0) | bit
+        if not (room_id or instructor_id or year):
+            self.slots |= bit
+
+    def with_availability(self, availability: Dict[str, int]) -> "Reservations":
+        """A copy in which each instructor of `availability` (id -> mask of teachable slots) keeps to it."""
+        out = Reservations(self.slots, dict(self.rooms), dict(self.instructors), dict(self.years),
+                           dict(self.unavailable))
+        for instructor_id, mask in availability.items():
+            out.unavailable[instructor_id] = out.unavailable.get(instructor_id, 0) | (ALL_SLOTS & ~mask)
+        return out
+
+    def course_mask(self, course: Course) -> int:
+        """Slots the course cannot use whatever the room."""
+        mask = self.slots | self.instructors.get(course.instructor_id, 0) | self.unavailable.get(course.instructor_id, 0)
+        if course.year:
+            mask |= self.years.get(course.year, 0)
+        return mask
+
+
+class OccupancyIndex:
+    """
+    Bitmask occupancy over the DAYS x TIMES grid.
+    Keeps one integer per instructor, per room and per year; BLOCKED is folded
+    in as a global mask, so a slot probe is a single AND.
+    Year 0 courses are not tied to a cohort and never reserve a year mask.
+    Reservations, if given, start out as occupied; instructors' unavailable
+    slots stay in their own map and never change.
+    """
+
+    def __init__(self, blocked: int = BLOCKED_MASK, reserved: Optional[Reservations] = None):
+        self.blocked = blocked
+        self.instructors: Dict[str, int] = {}
+        self.rooms: Dict[str, int] = {}
+        self.years: Dict[int, int] = {}
+        self.unavailable: Dict[str, int] = {}
+        if reserved is not None:
+            self.blocked |= reserved.slots
+            self.instructors.update(reserved.instructors)
+            self.rooms.update(reserved.rooms)
+            self.years.update(reserved.years)
+            self.unavailable.update(reserved.unavailable)
+
+    def held(self, course: Course) -> int:
+        """Slots the course's instructor or year already uses, or the instructor cannot teach."""
+        return (self.instructors.get(course.instructor_id, 0) | self.unavailable.get(course.instructor_id, 0)
+                | self.years.get(course.year, 0))
+
+    def busy_mask(self, instructor_id: str, room_id: str, year: Optional[int] = None) -> int:
+        mask = (self.blocked | self.instructors.get(instructor_id, 0) | self.unavailable.get(instructor_id, 0)
+                | self.rooms.get(room_id, 0))
+        if year is not None:
+            mask |= self.years.get(year, 0)
+        return mask
+
+    def is_free(self, day_idx: int, time_idx: int, instructor_id: str, room_id: str) -> bool:
+        return not (slot_bit(day_idx, time_idx) & self.busy_mask(instructor_id, room_id))
+
+    def reserve(self, day_idx: int, time_idx: int, course: Course, room_id: str) -> None:
+        bit = slot_bit(day_idx, time_idx)
+        self.instructors[course.instructor_id] = self.instructors.get(course.instructor_id, 0) | bit
+        self.rooms[room_id] = self.rooms.get(room_id, 0) | bit
+        if course.year:
+            self.years[course.year] = self.years.get(course.year, 0) | bit
+
+    def release(self, day_idx: int, time_idx: int, course: Course, room_id: str) -> None:
+        bit = slot_bit(day_idx, time_idx)
+        self.instructors[course.instructor_id] = self.instructors.get(course.instructor_id, 0) & ~bit
+        self.rooms[room_id] = self.rooms.get(room_id, 0) & ~bit
+        if course.year:
+            self.years[course.year] = self.years.get(course.year, 0) & ~bit
+
+
 def pick_room(course: Course, rooms: List[Classroom]) -> Optional[Classroom]:
-    """Pick the smallest room that fits (simple heuristic)."""
+    """Pick the smallest room that fits (one-off lookup; engines use RoomIndex)."""
     candidates = [r for r in rooms if r.capacity >= course.students]
-    candidates.sort(key=lambda r: r.capacity)
-    return candidates[0] if candidates else None
+    return min(candidates, key=lambda r: r.capacity) if candidates else None
+
+
+class RoomIndex:
+    """
+    Rooms sorted by capacity and partitioned by type, built once per run.
+    Lab courses use the lab rooms and other courses the theory rooms; when a
+    partition is empty the course may use any room. Lookups bisect to the
+    smallest room that fits and walk up to larger rooms from there.
+    """
+
+    def __init__(self, rooms: List[Classroom]):
+        self.rooms = sorted(rooms, key=lambda r: r.capacity)
+        self.capacities = [r.capacity for r in self.rooms]
+        self.partitions: Dict[str, Tuple[List[Classroom], List[int]]] = {}
+        for kind in ("lab", "theory"):
+            part = [r for r in self.rooms if r.room_type == kind]
+            if part:
+                self.partitions[kind] = (part, [r.capacity for r in part])
+
+    def _partition(self, course: Course) -> Tuple[List[Classroom], List[int]]:
+        kind = "lab" if course.is_lab else "theory"
+        return self.partitions.get(kind, (self.rooms, self.capacities))
+
+    def fitting(self, course: Course) -> List[Classroom]:
+        """All rooms of the course's type that fit it, smallest first."""
+        rooms, caps = self._partition(course)
+        return rooms[bisect_left(caps, course.students):]
+
+    def smallest(self, course: Course) -> Optional[Classroom]:
+        rooms, caps = self._partition(course)
+        i = bisect_left(caps, course.students)
+        return rooms[i] if i < len(rooms) else None
+
+    def smallest_free(self, course: Course, bit: int, occupancy: Dict[str, int]) -> Optional[Classroom]:
+        """Smallest fitting room whose occupancy mask is clear at `bit`, else the next larger one."""
+        rooms, caps = self._partition(course)
+        for i in range(bisect_left(caps, course.students), len(rooms)):
+            if not occupancy.get(rooms[i].id, 0) & bit:
+                return rooms[i]
+        return None
+
+
+class FreeRoomIndex:
+    """
+    Free fitting rooms per slot, as bitmasks instead of walks over the rooms.
+    Rooms of a partition are sorted by capacity, so a course fits every room
+    from its first fitting position up. Per partition and slot this keeps one
+    integer with a bit per free room position: the slot is open for a course
+    when any bit at or above its first position is set, and the smallest free
+    fitting room is the lowest such bit. Call taken()/freed() after the shared
+    occupancy changes. Open masks are cached per (partition, first position)
+    until the highest free position of one of the partition's slots moves.
+    """
+
+    def __init__(self, room_index: RoomIndex, occupancy: Dict[str, int]):
+        self.room_index = room_index
+        self.parts: Dict[int, List[Classroom]] = {}
+        for rooms, _ in [(room_index.rooms, None)] + list(room_index.partitions.values()):
+            self.parts[id(rooms)] = rooms
+        self.positions: Dict[str, List[Tuple[int, int]]] = {}  # room_id -> (partition, position)
+        self.free: Dict[int, List[int]] = {}  # partition -> per slot: bit per free room position
+        self.open: Dict[int, Dict[int, int]] = {}  # partition -> first position -> open slot mask
+        for part, rooms in self.parts.items():
+            masks = [0] * SLOT_COUNT
+            for pos, room in enumerate(rooms):
+                self.positions.setdefault(room.id, []).append((part, pos))
+                busy = occupancy.get(room.id, 0)
+                for s in range(SLOT_COUNT):
+                    if not busy >> s & 1:
+                        masks[s] |= 1 << pos
+            self.free[part] = masks
+            self.open[part] = {}
+
+    def open_mask(self, course: Course) -> int:
+        """Slots where at least one fitting room of the course's type is free."""
+        rooms, caps = self.room_index._partition(course)
+        first = bisect_left(caps, course.students)
+        cache = self.open[id(rooms)]
+        mask = cache.get(first)
+        if mask is None:
+            mask = 0
+            for s, free in enumerate(self.free[id(rooms)]):
+                if free >> first:
+                    mask |= 1 << s
+            cache[first] = mask
+        return mask
+
+    def smallest(self, course: Course, slot: int) -> Optional[Classroom]:
+        """Smallest free fitting room at a slot (bit index)."""
+        rooms, caps = self.room_index._partition(course)
+        first = bisect_left(caps, course.students)
+        free = self.free[id(rooms)][slot] >> first
+        if not free:
+            return None
+        return rooms[first + (free & -free).bit_length() - 1]
+
+    def taken(self, room_id: str, slot: int) -> None:
+        for part, pos in self.positions.get(room_id, ()):
+            masks = self.free[part]
+            top = masks[slot].bit_length()
+            masks[slot] &= ~(1 << pos)
+            if masks[slot].bit_length() != top:
+                self.open[part].clear()
+
+    def freed(self, room_id: str, slot: int) -> None:
+        for part, pos in self.positions.get(room_id, ()):
+            masks = self.free[part]
+            top = masks[slot].bit_length()
+            masks[slot] |= 1 << pos
+            if masks[slot].bit_length() != top:
+                self.open[part].clear()
+
+
+def first_fit(
+    course: Course, index: OccupancyIndex, room_index: RoomIndex,
+    free_rooms: Optional[FreeRoomIndex] = None,
+) -> Optional[Tuple[int, int, Classroom]]:
+    """
+    Earliest slot free for the course's instructor and year with a fitting free room.
+    With free_rooms (kept in step with index) the slot is found with masks alone.
+    """
+    busy = index.blocked | index.held(course)
+    if free_rooms is not None:
+        free = ALL_SLOTS & ~busy & free_rooms.open_mask(course)
+        if not free:
+            return None
+        slot = (free & -free).bit_length() - 1
+        day_idx, time_idx = slot_of(slot)
+        return day_idx, time_idx, free_rooms.smallest(course, slot)
+    for day_idx, time_idx in iter_slots(ALL_SLOTS & ~busy):
+        room = room_index.smallest_free(course, slot_bit(day_idx, time_idx), index.rooms)
+        if room is not None:
+            return day_idx, time_idx, room
+    return None
+
+
+def unplaced_issue(course: Course, fits: bool) -> Issue:
+    """Warning for a course left out: no slot was free, or (fits=False) no room is big enough."""
+    if not fits:
+        return Issue(NO_ROOM, WARNING, course.code, instructor=course.instructor_id,
+                     detail=f"{course.students} students")
+    return Issue(UNSCHEDULED, WARNING, course.code, instructor=course.instructor_id)
+
+
+def placement_count(schedule: Schedule) -> int:
+    return sum(len(row) for row in schedule.values())
+
+
+def room_views(schedule: Schedule) -> Dict[str, Dict[Tuple[int, int], Placement]]:
+    """Per-room timetables: room_id -> (day_idx, time_idx) -> Placement."""
+    views: Dict[str, Dict[Tuple[int, int], Placement]] = {}
+    for key, row in schedule.items():
+        for room_id, placement in row.items():
+            views.setdefault(room_id, {})[key] = placement
+    return views
+
+
+def instructor_views(schedule: Schedule) -> Dict[str, Dict[Tuple[int, int], Placement]]:
+    """Per-instructor timetables: instructor_id -> (day_idx, time_idx) -> Placement."""
+    views: Dict[str, Dict[Tuple[int, int], Placement]] = {}
+    for key, row in schedule.items():
+        for placement in row.values():
+            views.setdefault(placement.instructor_id, {})[key] = placement
+    return views
 
 
 def generate_schedule(
     courses: List[Course],
     rooms: List[Classroom],
-) -> Tuple[Dict[Tuple[int, int], Placement], List[str], int, int]:
+    engine: str = "greedy",
+    reserved: Optional[Reservations] = None,
+) -> Tuple[Schedule, List[str], int, int]:
+    """
+    Schedule courses with a named engine from engine.ENGINES ("greedy", "csp", ...).
+    Returns (schedule, report_lines, conflicts, warnings); the engines themselves
+    return issues.Issue records in place of the lines (see engine.ScheduleResult).
+    """
+    from engine import run_engine
+    return run_engine(engine, courses, rooms, reserved).as_tuple()
+
+
+def greedy_schedule(
+    courses: List[Course],
+    rooms: List[Classroom],
+    reserved: Optional[Reservations] = None,
+    progress: Optional[Progress] = None,
+) -> Tuple[Schedule, List[Issue], int, int]:
     """
     Greedy deterministic scheduler.
+    Each course takes the earliest slot where its instructor and year are free
+    and some fitting room is free, in the smallest such room. Reserved cells
+    (e.g. the common schedule) are never used. The slot is found with masks
+    (FreeRoomIndex answers "is a fitting room free" and "which is the
+    smallest"), so rooms are never walked. progress is called after every course.
     Returns:
-      schedule: (day_idx, time_idx) -> Placement
-      report_lines: list of warnings/conflicts
+      schedule: (day_idx, time_idx) -> room_id -> Placement
+      issues: Issue per conflict met and per course left out
       conflicts_count
       warnings_count
     """
-    schedule: Dict[Tuple[int, int], Placement] = {}
-    report: List[str] = []
+    schedule: Schedule = {}
+    issues: List[Issue] = []
     conflicts = 0
     warnings = 0
+    index = OccupancyIndex(reserved=reserved)
+    room_index = RoomIndex(rooms)
+    free_rooms = FreeRoomIndex(room_index, index.rooms)
 
     courses_sorted = sorted(courses, key=lambda c: c.code)
+    total = len(courses_sorted)
+    done = 0  # courses processed, placed or not
 
     for course in courses_sorted:
-        room = pick_room(course, rooms)
-        if room is None:
+        if progress is not None:
+            progress(done, total, conflicts)
+        done += 1
+        preferred = room_index.smallest(course)
+        if preferred is None:
             warnings += 1
-            report.append(f"WARNING: Capacity - No room fits {course.code} ({course.students} students).")
+            issues.append(unplaced_issue(course, fits=False))
             continue
 
-        placed = False
-
-        for time_idx in range(len(TIMES)):
-            for day_idx in range(len(DAYS)):
-                if (day_idx, time_idx) in BLOCKED:
-                    continue
-
-                key = (day_idx, time_idx)
-
-                if key not in schedule:
-                    schedule[key] = Placement(course.code, course.instructor_id, room.id)
-                    placed = True
-                    break
-                else:
-                    existing = schedule[key]
-                    if existing.instructor_id == course.instructor_id:
-                        conflicts += 1
-                        report.append(
-                            f"CONFLICT: Instructor overlap at {DAYS[day_idx]} {TIMES[time_idx]} "
-                            f"({existing.course_code} vs {course.code}) instructor={course.instructor_id}"
-                        )
-                    if existing.room_id == room.id:
-                        conflicts += 1
-                        report.append(
-                            f"CONFLICT: Room overlap at {DAYS[day_idx]} {TIMES[time_idx]} "
-                            f"room={room.id} ({existing.course_code} vs {course.code})"
-                        )
-
-            if placed:
-                break
-
-        if not placed:
+        open_slots = free_rooms.open_mask(course)
+        inst_mask = index.instructors.get(course.instructor_id, 0)
+        busy = index.blocked | index.held(course)
+        free = open_slots & ~busy
+        first = free & -free
+        # slots the instructor cannot teach are skipped like blocked ones, unreported
+        scanned = (first - 1 if first else ALL_SLOTS) & ~index.blocked & ~index.unavailable.get(course.instructor_id, 0)
+
+        # Slots passed on the way: instructor already teaching, or every fitting room taken.
+        for day_idx, time_idx in iter_slots(scanned & (inst_mask | ~open_slots)):
+            bit = slot_bit(day_idx, time_idx)
+            row = schedule.get((day_idx, time_idx), {})
+            # (a reserved cell has no placement; it is reported as the common schedule)
+            if inst_mask & bit:
+                existing = next((p for p in row.values() if p.instructor_id == course.instructor_id), None)
+                conflicts += 1
+                issues.append(Issue(INSTRUCTOR_OVERLAP, CRITICAL, course.code, DAYS[day_idx], TIMES[time_idx],
+                                    instructor=course.instructor_id,
+                                    detail=existing.course_code if existing else "common schedule"))
+            if not open_slots & bit:
+                existing = row.get(preferred.id)
+                conflicts += 1
+                issues.append(Issue(ROOM_OVERLAP, CRITICAL, course.code, DAYS[day_idx], TIMES[time_idx],
+                                    preferred.id, course.instructor_id,
+                                    existing.course_code if existing else "common schedule"))
+
+        if not first:
             warnings += 1
-            report.append(f"WARNING: Unscheduled - Could not place {course.code} (no available slot).")
+            issues.append(unplaced_issue(course, fits=True))
+            continue
+
+        slot = first.bit_length() - 1
+        room = free_rooms.smallest(course, slot)
+        day_idx, time_idx = slot_of(slot)
+        schedule.setdefault((day_idx, time_idx), {})[room.id] = Placement(course.code, course.instructor_id, room.id)
+        index.reserve(day_idx, time_idx, course, room.id)
+        free_rooms.taken(room.id, slot)
+
+    if progress is not None:
+        progress(done, total, conflicts)
+
+    return schedule, issues, conflicts, warnings
+
+
+# -----------------------------
+# Incremental scheduling
+# -----------------------------
+@dataclass
+class ScheduleDiff:
+    """Cells changed by one Scheduler edit; a move shows up in both lists."""
+    added: List[Tuple[Tuple[int, int], Placement]] = field(default_factory=list)
+    removed: List[Tuple[Tuple[int, int], Placement]] = field(default_factory=list)
+    unscheduled: List[str] = field(default_factory=list)  # codes left without a slot
+
+    def extend(self, other: "ScheduleDiff") -> None:
+        self.added.extend(other.added)
+        self.removed.extend(other.removed)
+        self.unscheduled.extend(other.unscheduled)
+
+
+class Scheduler:
+    """
+    Stateful scheduler for small edits.
+    The initial placement matches greedy_schedule. add_course, remove_course and
+    update_course then repair only the cells they touch (plus at most one course
+    displaced from them) and return a ScheduleDiff instead of rebuilding.
+    Courses are keyed by code.
+    """
+
+    def __init__(self, rooms: List[Classroom], courses: Iterable[Course] = (),
+                 reserved: Optional[Reservations] = None):
+        self.room_index = RoomIndex(rooms)
+        self.index = OccupancyIndex(reserved=reserved)
+        self.free_rooms = FreeRoomIndex(self.room_index, self.index.rooms)
+        self.schedule: Schedule = {}
+        self.courses: Dict[str, Course] = {}
+        self.where: Dict[str, Tuple[Tuple[int, int], Placement]] = {}
+        self.unscheduled: Set[str] = set()  # codes of courses without a cell
+        for course in sorted(courses, key=lambda c: c.code):
+            if course.code in self.courses:
+                raise ValueError(f"Duplicate course code: {course.code}")
+            self.courses[course.code] = course
+            self.unscheduled.add(course.code)
+            self._place(course, ScheduleDiff())
+
+    # -------- Cell bookkeeping ----------
+    def _put(self, course: Course, day_idx: int, time_idx: int, room_id: str, diff: ScheduleDiff) -> None:
+        key = (day_idx, time_idx)
+        placement = Placement(course.code, course.instructor_id, room_id)
+        self.schedule.setdefault(key, {})[room_id] = placement
+        self.index.reserve(day_idx, time_idx, course, room_id)
+        self.free_rooms.taken(room_id, slot_index(day_idx, time_idx))
+        self.where[course.code] = (key, placement)
+        self.unscheduled.discard(course.code)
+        diff.added.append((key, placement))
+
+    def _take(self, code: str, diff: ScheduleDiff) -> Optional[Tuple[int, int]]:
+        """Lift a course out of its cell; returns the freed slot."""
+        if code not in self.where:
+            return None
+        key, placement = self.where.pop(code)
+        self.unscheduled.add(code)
+        row = self.schedule[key]
+        del row[placement.room_id]
+        if not row:
+            del self.schedule[key]
+        self.index.release(key[0], key[1], self.courses[code], placement.room_id)
+        self.free_rooms.freed(placement.room_id, slot_index(*key))
+        diff.removed.append((key, placement))
+        return key
+
+    def _place(self, course: Course, diff: ScheduleDiff) -> bool:
+        spot = first_fit(course, self.index, self.room_index, self.free_rooms)
+        if spot is None:
+            return False
+        day_idx, time_idx, room = spot
+        self._put(course, day_idx, time_idx, room.id, diff)
+        return True
+
+    def _place_with_ejection(self, course: Course, diff: ScheduleDiff) -> bool:
+        """
+        First fit, else free a slot by moving one course out of it, provided that
+        course finds another cell by first fit. Otherwise nothing changes.
+        """
+        if self._place(course, diff):
+            return True
+        fits = self.room_index.fitting(course)
+        if not fits:
+            return False
+
+        for day_idx, time_idx in iter_slots(ALL_SLOTS & ~self.index.blocked):
+            row = self.schedule.get((day_idx, time_idx), {})
+            clashing = [
+                p for p in row.values()
+                if p.instructor_id == course.instructor_id
+                or (course.year and self.courses[p.course_code].year == course.year)
+            ]
+            if len(clashing) > 1:
+                continue
+            # one clashing course must go; otherwise any occupant of a fitting room
+            victims = clashing or [row[r.id] for r in fits if r.id in row]
+
+            for victim in victims:
+                trial = ScheduleDiff()
+                self._take(victim.course_code, trial)
+                bit = slot_bit(day_idx, time_idx)
+                room = self.free_rooms.smallest(course, slot_index(day_idx, time_idx))
+                busy = self.index.held(course)
+                if room is not None and not busy & bit:
+                    self._put(course, day_idx, time_idx, room.id, trial)
+                    if self._place(self.courses[victim.course_code], trial):
+                        diff.extend(trial)
+                        return True
+                    self._take(course.code, trial)
+                # roll back: the victim returns to its old cell
+                self._put(self.courses[victim.course_code], day_idx, time_idx, victim.room_id, ScheduleDiff())
+        return False
+
+    def _refill(self, diff: ScheduleDiff) -> None:
+        """
+        Give unscheduled courses a chance at cells freed by an edit. Only the
+        slots the edit removed placements from got freer, so only courses whose
+        instructor and year are free in one of them, with a fitting room free
+        there, are retried (in code order).
+        """
+        freed = 0
+        for (day_idx, time_idx), _ in diff.removed:
+            freed |= slot_bit(day_idx, time_idx)
+        freed &= ~self.index.blocked
+        if not freed:
+            return
+        courses = self.courses
+        candidates = []
+        for code in self.unscheduled:
+            course = courses[code]
+            free = freed & ~self.index.held(course)
+            if free and free & self.free_rooms.open_mask(course):
+                candidates.append(code)
+        for code in sorted(candidates):
+            if code in self.unscheduled:
+                self._place(self.courses[code], diff)
+
+    # -------- Edits ----------
+    def add_course(self, course: Course) -> ScheduleDiff:
+        if course.code in self.courses:
+            raise ValueError(f"Course already scheduled: {course.code}")
+        diff = ScheduleDiff()
+        self.courses[course.code] = course
+        self.unscheduled.add(course.code)
+        if not self._place_with_ejection(course, diff):
+            diff.unscheduled.append(course.code)
+        return diff
+
+    def remove_course(self, code: str) -> ScheduleDiff:
+        if code not in self.courses:
+            raise KeyError(code)
+        diff = ScheduleDiff()
+        freed = self._take(code, diff)
+        del self.courses[code]
+        self.unscheduled.discard(code)
+        if freed is not None:
+            self._refill(diff)
+        return diff
+
+    def update_course(self, course: Course) -> ScheduleDiff:
+        """Replace a course by code, keeping its cell when the new data still fits there."""
+        if course.code not in self.courses:
+            raise KeyError(course.code)
+        diff = ScheduleDiff()
+        freed = self._take(course.code, diff)
+        self.courses[course.code] = course
+
+        if freed is not None:
+            day_idx, time_idx = freed
+            old_room = diff.removed[-1][1].room_id
+            bit = slot_bit(day_idx, time_idx)
+            busy = self.index.held(course)
+            if not busy & bit and any(r.id == old_room for r in self.room_index.fitting(course)):
+                self._put(course, day_idx, time_idx, old_room, diff)
+                if diff.added[-1] == diff.removed[-1]:
+                    return ScheduleDiff()
+                return diff
 
-    if not report:
-        report = ["No conflicts or warnings found."]
+        if not self._place_with_ejection(course, diff):
+            diff.unscheduled.append(course.code)
+        if freed is not None:
+            self._refill(diff)
+        return diff
 
-    return schedule, report, conflicts, warnings
+    # -------- Results ----------
+    def result(self) -> Tuple[Schedule, List[Issue], int, int]:
+        """Current state in the engines' (schedule, issues, conflicts, warnings) form."""
+        issues = [unplaced_issue(self.courses[code], self.room_index.smallest(self.courses[code]) is not None)
+                  for code in sorted(self.unscheduled)]
+        return self.schedule, issues, 0, len(issues)
@@ -0,0 +1,168 @@
+"""
+Canvas timetable for BeePlan.
+
+TimetableCanvas draws a grid of text cells on one Canvas instead of one
+widget per cell:
+- row and column headers sit on their own canvases, scrolled with the body
+- cells are created lazily, only for rows that have been scrolled into view,
+  so grids with hundreds of rows (per room / per instructor) stay cheap
+- show() compares against what is on screen and re-configures only the
+  cells whose text changed
+- a single click binding finds the cell from the click position
+"""
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+Key = Tuple[Hashable, Hashable]  # (row key, column key)
+
+
+class TimetableCanvas(tk.Frame):
+    def __init__(self, master, colors: Callable[[str], Tuple[str, str]],
+                 on_click: Optional[Callable[[Hashable, Hashable, str], None]] = None,
+                 cell_width: int = 120, cell_height: int = 56,
+                 header_width: int = 90, header_height: int = 44,
+                 font=("Segoe UI", 9, "bold"), border: str = "#0a49b5",
+                 bg: str = "#cfe9ff", header_bg: str = "#eaf6ff"):
+        super().__init__(master, bg=bg)
+        self.colors = colors  # text -> (fill, text colour)
+        self.on_click = on_click
+        self.cell_width, self.cell_height = cell_width, cell_height
+        self.header_width, self.header_height = header_width, header_height
+        self.font, self.border, self.header_bg = font, border, header_bg
+
+        self.rows: List[Hashable] = []
+        self.columns: List[Hashable] = []
+        self.texts: Dict[Key, str] = {}  # what should be shown; missing keys are empty
+        self.items: Dict[Key, Tuple[int, int]] = {}  # (rectangle, text) of drawn cells
+        self.drawn: Dict[Key, str] = {}  # text currently drawn in each cell
+        self.drawn_rows: Set[int] = set()
+
+        canvas = dict(bg=bg, highlightthickness=0)
+        self.corner = tk.Canvas(self, width=header_width, height=header_height, **canvas)
+        self.col_header = tk.Canvas(self, height=header_height, **canvas)
+        self.row_header = tk.Canvas(self, width=header_width, yscrollincrement=cell_height, **canvas)
+        self.body = tk.Canvas(self, yscrollincrement=cell_height, **canvas)
+        ysb = ttk.Scrollbar(self, orient="vertical", command=self.body.yview)
+        xsb = ttk.Scrollbar(self, orient="horizontal", command=self.body.xview)
+        self.body.config(xscrollcommand=lambda first, last: self._scrolled_x(xsb, first, last),
+                         yscrollcommand=lambda first, last: self._scrolled_y(ysb, first, last))
+
+        self.corner.grid(row=0, column=0, sticky="nsew")
+        self.col_header.grid(row=0, column=1, sticky="ew")
+        self.row_header.grid(row=1, column=0, sticky="ns")
+        self.body.grid(row=1, column=1, sticky="nsew")
+        ysb.grid(row=1, column=2, sticky="ns")
+        xsb.grid(row=2, column=1, sticky="ew")
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(1, weight=1)
+
+        self.body.bind("<Button-1>", self._clicked)
+        self.body.bind("<Configure>", lambda e: self._draw_visible())
+        for widget in (self.body, self.row_header):
+            widget.bind("<MouseWheel>", lambda e: self.body.yview_scroll(-1 if e.delta > 0 else 1, "units"))
+            widget.bind("<Button-4>", lambda e: self.body.yview_scroll(-1, "units"))
+            widget.bind("<Button-5>", lambda e: self.body.yview_scroll(1, "units"))
+
+    # -------- Layout ----------
+    def set_layout(self, rows: Sequence[Hashable], columns: Sequence[Hashable],
+                   row_labels: Optional[Sequence[str]] = None,
+                   column_labels: Optional[Sequence[str]] = None,
+                   cell_size: Optional[Tuple[int, int]] = None) -> bool:
+        """
+        Set the row/column keys (and optionally the (width, height) of a cell);
+        redraws from scratch only if they changed. True if they did.
+        """
+        rows, columns = list(rows), list(columns)
+        size = cell_size or (self.cell_width, self.cell_height)
+        if rows == self.rows and columns == self.columns and size == (self.cell_width, self.cell_height):
+            return False
+        self.rows, self.columns = rows, columns
+        self.cell_width, self.cell_height = size
+        for c in (self.col_header, self.row_header, self.body):
+            c.delete("all")
+        self.items, self.drawn, self.drawn_rows = {}, {}, set()
+
+        cw, ch = self.cell_width, self.cell_height
+        width, height = cw * len(columns), ch * len(rows)
+        self.body.config(scrollregion=(0, 0, width, height), yscrollincrement=ch)
+        self.col_header.config(scrollregion=(0, 0, width, self.header_height))
+        self.row_header.config(scrollregion=(0, 0, self.header_width, height), yscrollincrement=ch)
+        for i, label in enumerate(column_labels or [str(c) for c in columns]):
+            self._header(self.col_header, i * cw, 0, (i + 1) * cw, self.header_height, label)
+        for i, label in enumerate(row_labels or [str(r) for r in rows]):
+            self._header(self.row_header, 0, i * ch, self.header_width, (i + 1) * ch, label)
+        self.body.xview_moveto(0)
+        self.body.yview_moveto(0)
+        self._draw_visible()
+        return True
+
+    def _header(self, canvas: tk.Canvas, x0: int, y0: int, x1: int, y1: int, label: str) -> None:
+        canvas.create_rectangle(x0 + 2, y0 + 2, x1 - 2, y1 - 2, fill=self.header_bg, outline=self.border, width=2)
+        canvas.create_text((x0 + x1) / 2, (y0 + y1) / 2, text=label, font=("Segoe UI", 10, "bold"),
+                           fill="#111", width=x1 - x0 - 8, justify="center")
+
+    # -------- Cells ----------
+    def show(self, cells: Dict[Key, str]) -> int:
+        """Display cells ((row, column) -> text); returns how many drawn cells were repainted."""
+        old, self.texts = self.texts, cells
+        changed = 0
+        for key in set(old) | set(cells):
+            if key in self.items and self.drawn[key] != cells.get(key, ""):
+                self._paint(key)
+                changed += 1
+        self._draw_visible()
+        return changed
+
+    def _paint(self, key: Key) -> None:
+        rect, text_id = self.items[key]
+        text = self.texts.get(key, "")
+        fill, fg = self.colors(text)
+        self.body.itemconfig(rect, fill=fill)
+        self.body.itemconfig(text_id, text=text, fill=fg)
+        self.drawn[key] = text
+
+    def _draw_visible(self) -> None:
+        """Create the cells of rows scrolled into view for the first time."""
+        if not self.rows:
+            return
+        ch, cw = self.cell_height, self.cell_width
+        top = int(self.body.canvasy(0) // ch)
+        bottom = int(self.body.canvasy(max(self.body.winfo_height(), ch)) // ch)
+        for r in range(max(0, top), min(len(self.rows), bottom + 1)):
+            if r in self.drawn_rows:
+                continue
+            self.drawn_rows.add(r)
+            y0 = r * ch
+            for c, column in enumerate(self.columns):
+                key = (self.rows[r], column)
+                x0 = c * cw
+                rect = self.body.create_rectangle(x0 + 2, y0 + 2, x0 + cw - 2, y0 + ch - 2,
+                                                  outline=self.border, width=2)
+                text_id = self.body.create_text(x0 + cw / 2, y0 + ch / 2, font=self.font,
+                                                width=cw - 8, justify="center")
+                self.items[key] = (rect, text_id)
+                self._paint(key)
+
+    # -------- Scrolling / clicks ----------
+    def _scrolled_x(self, bar: ttk.Scrollbar, first: str, last: str) -> None:
+        bar.set(first, last)
+        self.col_header.xview_moveto(first)
+
+    def _scrolled_y(self, bar: ttk.Scrollbar, first: str, last: str) -> None:
+        bar.set(first, last)
+        self.row_header.yview_moveto(first)
+        self._draw_visible()
+
+    def cell_at(self, x: int, y: int) -> Optional[Key]:
+        """(row, column) under a point in widget coordinates, or None outside the grid."""
+        r = int(self.body.canvasy(y) // self.cell_height)
+        c = int(self.body.canvasx(x) // self.cell_width)
+        if 0 <= r < len(self.rows) and 0 <= c < len(self.columns):
+            return self.rows[r], self.columns[c]
+        return None
+
+    def _clicked(self, event) -> None:
+        key = self.cell_at(event.x, event.y)
+        if key is not None and self.on_click is not None:
+            self.on_click(key[0], key[1], self.texts.get(key, ""))
@@ -0,0 +1,102 @@
+"""
+Input validation for BeePlan.
+
+validate_inputs checks the parsed dashboard data before scheduling, in one
+pass per entity list with hash indexes (instructor names, course codes) and
+a single max over room capacities:
+- duplicate course codes
+- courses whose instructor is missing from the loaded instructors
+- courses larger than every room
+- availability entries that are not a known day/time slot
+Each problem is a Finding; finding_issues turns them into the report's
+issues.Issue records so they are listed next to the scheduling issues.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, List
+
+from common_schedule import day_index, time_index
+from entity_store import CourseStore
+from issues import CRITICAL, Issue
+
+ERROR = "error"
+WARNING = "warning"
+
+# Finding kinds
+DUPLICATE_CODE = "duplicate_code"
+UNKNOWN_INSTRUCTOR = "unknown_instructor"
+UNASSIGNED_INSTRUCTOR = "unassigned_instructor"
+OVERSIZED_COURSE = "oversized_course"
+BAD_AVAILABILITY = "bad_availability"
+
+
+@dataclass(frozen=True)
+class Finding:
+    kind: str
+    severity: str  # ERROR or WARNING
+    subject: str   # course code or instructor name
+    message: str
+
+
+def _course_columns(courses):
+    """(codes, students, instructor names) without building a record per course."""
+    if isinstance(courses, CourseStore):
+        names = courses.instructors.names
+        return courses.codes, courses.students, [names[i] for i in courses.instructor_ids]
+    courses = list(courses)
+    return [c.code for c in courses], [c.students for c in courses], [c.instructor for c in courses]
+
+
+def validate_inputs(courses, instructors: Iterable = (), classrooms: Iterable = ()) -> List[Finding]:
+    """
+    Findings for the loaded data, in input order within each check.
+    The instructor check only runs once instructors are loaded, and the
+    capacity check once classrooms are.
+    """
+    findings: List[Finding] = []
+
+    known = set()
+    for ins in instructors:
+        known.add(ins.name)
+        for entry in ins.available or ():
+            day, time = entry if isinstance(entry, tuple) and len(entry) == 2 else (entry, None)
+            if day_index(day) is None or time_index(time) is None:
+                findings.append(Finding(BAD_AVAILABILITY, WARNING, ins.name,
+                                        f"Instructor {ins.name}: availability entry {entry!r} is not a known day/time slot."))
+
+    biggest = max((r.capacity for r in classrooms), default=None)
+    codes, students, names = _course_columns(courses)
+    seen: Dict[str, int] = {}
+    for code, size, name in zip(codes, students, names):
+        count = seen.get(code, 0) + 1
+        seen[code] = count
+        if count == 2:  # report each duplicated code once
+            findings.append(Finding(DUPLICATE_CODE, ERROR, code, f"Course code {code} appears more than once."))
+        if not name:
+            findings.append(Finding(UNASSIGNED_INSTRUCTOR, WARNING, code, f"Course {code} has no instructor."))
+        elif known and name not in known:
+            findings.append(Finding(UNKNOWN_INSTRUCTOR, ERROR, code,
+                                    f"Course {code}: instructor {name} is not in the loaded instructors."))
+        if biggest is not None and size > biggest:
+            findings.append(Finding(OVERSIZED_COURSE, ERROR, code,
+                                    f"Course {code} has {size} students; the largest room holds {biggest}."))
+    return findings
+
+
+def finding_issues(findings: Iterable[Finding]) -> List[Issue]:
+    """Findings as report issues; errors are critical."""
+    issues = []
+    for f in findings:
+        severity = CRITICAL if f.severity == ERROR else f.severity
+        if f.kind == BAD_AVAILABILITY:  # subject is an instructor
+            issues.append(Issue(f.kind, severity, instructor=f.subject, detail=f.message))
+        else:
+            issues.append(Issue(f.kind, severity, f.subject, detail=f.message))
+    return issues
+
+
+def summarize(findings: List[Finding]) -> Dict[str, int]:
+    """kind -> count."""
+    counts: Dict[str, int] = {}
+    for f in findings:
+        counts[f.kind] = counts.get(f.kind, 0) + 1
+    return counts
@@ -0,0 +1,109 @@
+"""
+Synthetic BeePlan workloads.
+
+Writes Courses / Instructors / Classrooms files in the schemas that
+parse_courses, parse_instructors and parse_classrooms accept. JSON files use
+the canonical keys; CSV files use alias headers (courseCode, studentCount, ...)
+so both lookup paths get exercised. Output is fully determined by the seed.
+
+Usage:
+    python workload.py OUT_DIR --courses 5000 [--seed 1] [--formats json csv]
+"""
+import argparse
+import csv
+import json
+import os
+import random
+from typing import Dict, List
+
+DEPARTMENTS = ["CENG", "SENG", "MATH", "PHYS", "EE", "IE", "ME", "CHEM"]
+AVAIL_DAYS = ["MON", "TUE", "WED", "THU", "FRI"]
+AVAIL_TIMES = ["9:20", "10:20", "11:20", "12:20", "13:20", "14:20", "15:20", "16:20"]
+
+
+def make_workload(n_courses: int, seed: int = 1) -> Dict[str, List[dict]]:
+    """Rows for each entity; roughly 4 courses per instructor and 10 per room."""
+    rng = random.Random(seed)
+    n_instructors = max(5, n_courses // 4)
+    n_rooms = max(3, n_courses // 10)
+
+    instructors = []
+    for i in range(n_instructors):
+        row = {"name": f"Instructor {i + 1:05d}"}
+        if rng.random() < 0.3:
+            # part-time: a handful of available slots
+            slots = rng.sample([(d, t) for d in AVAIL_DAYS for t in AVAIL_TIMES], rng.randint(6, 20))
+            row["available"] = [f"{d}-{t}" for d, t in sorted(slots)]
+        instructors.append(row)
+
+    classrooms = []
+    for i in range(n_rooms):
+        lab = rng.random() < 0.2
+        classrooms.append({
+            "name": f"{'LAB' if lab else 'D'}-{i + 1:04d}",
+            "capacity": rng.choice([30, 40, 50, 60, 80, 100, 120, 150, 200]),
+        })
+
+    courses = []
+    for i in range(n_courses):
+        dept = DEPARTMENTS[i % len(DEPARTMENTS)]
+        number = 100 + i // len(DEPARTMENTS)
+        lab = rng.random() < 0.15
+        year = rng.randint(1, 4)
+        courses.append({
+            "code": f"{dept}{year}{number:04d}{'L' if lab else ''}",
+            "name": f"{dept} Course {number}{' Lab' if lab else ''}",
+            "year": year,
+            "students": rng.randint(10, 150),
+            "hours": rng.randint(1, 4),
+            "instructor": instructors[rng.randrange(n_instructors)]["name"],
+        })
+
+    return {"Courses": courses, "Instructors": instructors, "Classrooms": classrooms}
+
+
+# CSV header aliases (all accepted by the parsers' pick() lookups)
+CSV_HEADERS = {
+    "Courses": {"code": "courseCode", "name": "courseName", "year": "classYear",
+                "students": "studentCount", "hours": "weeklyHours", "instructor": "instructorName"},
+    "Instructors": {"name": "instructorName"},
+    "Classrooms": {"name": "roomName", "capacity": "roomCapacity"},
+}
+
+
+def write_workload(out_dir: str, n_courses: int, seed: int = 1, formats=("json", "csv")) -> Dict[str, str]:
+    """Write the workload; returns {"Courses.json": path, ...}."""
+    os.makedirs(out_dir, exist_ok=True)
+    data = make_workload(n_courses, seed)
+    paths: Dict[str, str] = {}
+    for entity, rows in data.items():
+        if "json" in formats:
+            path = os.path.join(out_dir, f"{entity}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({entity.lower(): rows}, f, ensure_ascii=False)
+            paths[f"{entity}.json"] = path
+        if "csv" in formats:
+            path = os.path.join(out_dir, f"{entity}.csv")
+            headers = CSV_HEADERS[entity]
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=list(headers.values()))
+                writer.writeheader()
+                for row in rows:
+                    writer.writerow({alias: row[key] for key, alias in headers.items()})
+            paths[f"{entity}.csv"] = path
+    return paths
+
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Generate a synthetic BeePlan workload.")
+    ap.add_argument("out_dir")
+    ap.add_argument("--courses", type=int, default=500)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--formats", nargs="+", default=["json", "csv"], choices=["json", "csv"])
+    args = ap.parse_args(argv)
+    for name, path in write_workload(args.out_dir, args.courses, args.seed, args.formats).items():
+        print(f"{name}: {path}")
+
+
+if __name__ == "__main__":
+    main()
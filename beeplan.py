@@ -0,0 +1,15 @@
+# beeplan.py
+# Command-line entry point: the headless CLI lives in BeePlan/beeplan_cli.py.
+# Run from the repository root with: python beeplan.py schedule --folder <data folder> --out <output folder>
+
+import os
+import sys
+
+APP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "BeePlan")
+
+if __name__ == "__main__":
+    sys.path.insert(0, APP_DIR)
+    # imported (not run as __main__) so process-pool workers can find its functions
+    from beeplan_cli import main
+
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+Shared fixtures for the BeePlan tests.
+
+The application modules live flat in BeePlan/ and import each other by bare
+name, so that folder goes first on sys.path (ahead of the repository root's
+launcher shims of the same names). The parsed-input cache is pointed at a
+scratch folder for the session, so tests never read or fill the user's cache.
+"""
+import os
+import random
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "BeePlan")
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
+
+CACHE_DIR = tempfile.mkdtemp(prefix="beeplan-test-cache-")
+os.environ["BEEPLAN_CACHE_DIR"] = CACHE_DIR  # read when beeplan_core is first imported
+
+from scheduler import BLOCKED_MASK, Classroom, Course, RoomIndex, slot_bit  # noqa: E402
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+
+def make_courses(n, seed=1, instructors=6, years=4, labs=True):
+    """n random courses over a few instructors and years (deterministic per seed)."""
+    rng = random.Random(seed)
+    return [
+        Course(code=f"C{i:03d}", instructor_id=f"I{rng.randrange(instructors)}",
+               students=rng.choice([20, 30, 45, 60, 90]), is_lab=labs and rng.random() < 0.2,
+               year=rng.randint(1, years) if years else 0)
+        for i in range(n)
+    ]
+
+
+def make_rooms(n=4, labs=1):
+    """n rooms of growing capacity; the first `labs` of them are labs."""
+    return [
+        Classroom(id=f"R{i}", name=f"Room {i}", capacity=30 + 20 * i, room_type="lab" if i < labs else "theory")
+        for i in range(n)
+    ]
+
+
+def check_schedule(schedule, courses, rooms, reserved=None):
+    """
+    Assert a schedule is a valid timetable: every placement is a known course
+    placed once, in a fitting room of its type, outside the blocked slots and
+    reserved cells, with no instructor or year in two places at once.
+    """
+    by_code = {c.code: c for c in courses}
+    fitting = RoomIndex(rooms)
+    seen = set()
+    for (day_idx, time_idx), row in schedule.items():
+        bit = slot_bit(day_idx, time_idx)
+        assert not bit & BLOCKED_MASK, f"placement in a blocked slot {(day_idx, time_idx)}"
+        instructors, years = set(), set()
+        for room_id, p in row.items():
+            assert p.room_id == room_id
+            course = by_code[p.course_code]
+            assert p.course_code not in seen, f"{p.course_code} placed twice"
+            seen.add(p.course_code)
+            assert p.instructor_id == course.instructor_id
+            assert room_id in {r.id for r in fitting.fitting(course)}, f"{course.code} does not fit {room_id}"
+            assert course.instructor_id not in instructors, f"{course.instructor_id} double-booked"
+            instructors.add(course.instructor_id)
+            if course.year:
+                assert course.year not in years, f"year {course.year} double-booked"
+                years.add(course.year)
+            if reserved is not None:
+                assert not bit & reserved.course_mask(course), f"{course.code} in a reserved cell"
+                assert not bit & reserved.rooms.get(room_id, 0), f"{room_id} reserved at {(day_idx, time_idx)}"
+    return seen
+
+
+@pytest.fixture
+def courses():
+    return make_courses(40)
+
+
+@pytest.fixture
+def rooms():
+    return make_rooms()
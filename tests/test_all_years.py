@@ -0,0 +1,93 @@
+import random
+
+from beeplan_core import Classroom, CommonSchedule, Course, Instructor, generate_all_years
+from common_schedule import CommonSession
+
+
+def app_courses(n, seed=1, instructors=8):
+    rng = random.Random(seed)
+    return [Course(code=f"SE{y}{i:02d}", year=y, students=rng.choice([20, 40, 60]),
+                   instructor=f"Dr {rng.randrange(instructors)}")
+            for y in (1, 2, 3, 4) for i in range(n)]
+
+
+def clash_free(results, courses):
+    """No instructor in two years at once and no room used twice, except where a clash is reported."""
+    by_code = {c.code: c for c in courses}
+    teaching, rooms = {}, {}
+    for year, result in sorted(results.items()):
+        reported = {(i.course, i.type) for i in result["issues"].issues}
+        for (day, time, code), room in zip(result["placements"], result["placement_rooms"]):
+            instructor = by_code[code].instructor
+            if teaching.setdefault((day, time, instructor), code) != code:
+                assert (code, "year_clash") in reported, f"{instructor} double-booked at {day} {time}"
+            if rooms.setdefault((day, time, room), code) != code:
+                assert (code, "room_overlap") in reported, f"{room} double-booked at {day} {time}"
+
+
+def cell_of(result, code):
+    for (day, time, c), room in zip(result["placements"], result["placement_rooms"]):
+        if c == code:
+            return day, time, room
+    return None
+
+
+def test_merge_is_clash_free_and_independent_of_workers():
+    courses = app_courses(12, seed=2)
+    classrooms = [Classroom("A1", 40), Classroom("A2", 60), Classroom("B1", 60)]
+    one = generate_all_years(courses, workers=1, classrooms=classrooms)
+    two = generate_all_years(courses, workers=2, classrooms=classrooms)
+    clash_free(one, courses)
+    for year in (1, 2, 3, 4):
+        for key in ("schedule", "placements", "placement_rooms", "clashes", "conflicts"):
+            assert one[year][key] == two[year][key]
+
+
+def test_room_clash_takes_another_room_of_the_same_slot():
+    courses = [Course("SE101", year=1, students=30, instructor="Dr A"),
+               Course("SE201", year=2, students=30, instructor="Dr B")]
+    results = generate_all_years(courses, workers=1, classrooms=[Classroom("A1", 40), Classroom("A2", 40)])
+    assert cell_of(results[1], "SE101") == ("MON", "9:20", "A1")
+    assert cell_of(results[2], "SE201") == ("MON", "9:20", "A2")
+    assert results[2]["clashes"] == []
+
+
+def test_instructor_of_two_years_is_moved_to_a_free_slot():
+    courses = [Course("SE101", year=1, students=30, instructor="Dr A"),
+               Course("SE201", year=2, students=30, instructor="Dr A")]
+    results = generate_all_years(courses, workers=1, classrooms=[Classroom("A1", 40)])
+    assert cell_of(results[1], "SE101") == ("MON", "9:20", "A1")
+    assert cell_of(results[2], "SE201") == ("MON", "10:20", "A1")
+    assert results[2]["schedule"]["MON"]["10:20"] == "SE201"
+    assert results[2]["schedule"]["MON"]["9:20"] == ""
+    assert results[2]["clashes"] == []
+
+
+def test_merge_keeps_to_instructor_availability():
+    courses = [Course("SE101", year=1, students=30, instructor="Dr A"),
+               Course("SE201", year=2, students=30, instructor="Dr A")]
+    instructors = [Instructor("Dr A", [("MON", "9:20"), ("THU", "15:20")])]
+    results = generate_all_years(courses, workers=1, classrooms=[Classroom("A1", 40)], instructors=instructors)
+    assert cell_of(results[1], "SE101")[:2] == ("MON", "9:20")
+    assert cell_of(results[2], "SE201")[:2] == ("THU", "15:20")
+
+
+def test_merge_keeps_out_of_reserved_cells():
+    courses = [Course("SE101", year=1, students=30, instructor="Dr A"),
+               Course("SE201", year=2, students=30, instructor="Dr A")]
+    # year 2 has a common course at MON 10:20, so SE201 moves on to the slot after it
+    common = CommonSchedule([CommonSession(0, 1, "COMMON1", year=2)])
+    results = generate_all_years(courses, workers=1, classrooms=[Classroom("A1", 40)], common=common)
+    assert cell_of(results[2], "SE201")[:2] == ("MON", "11:20")
+    assert results[2]["schedule"]["MON"]["10:20"] == "COMMON1\n(Common)"
+
+
+def test_unresolvable_clash_is_reported():
+    courses = [Course("SE101", year=1, students=30, instructor="Dr A"),
+               Course("SE201", year=2, students=30, instructor="Dr A")]
+    instructors = [Instructor("Dr A", [("MON", "9:20")])]
+    results = generate_all_years(courses, workers=1, classrooms=[Classroom("A1", 40)], instructors=instructors)
+    assert results[2]["clashes"] == ["SE201: Dr A also teaches another year at Monday 09:20",
+                                     "CONFLICT: Room overlap at Monday 09:20 room=A1 (SE101 vs SE201)"]
+    assert results[2]["conflicts"] == 2
+    clash_free(results, courses)
@@ -0,0 +1,84 @@
+import json
+import multiprocessing
+import os
+
+import pytest
+
+import beeplan_cli
+from beeplan_cli import main, read_manifest, run_batch
+from workload import write_workload
+
+
+@pytest.fixture(scope="module")
+def manifest(tmp_path_factory):
+    base = tmp_path_factory.mktemp("departments")
+    for n, name in enumerate(("ceng", "seng", "math")):
+        write_workload(str(base / name), 60 + 20 * n, seed=n, formats=("json",) if n % 2 else ("csv",))
+    (base / "empty").mkdir()
+    path = base / "departments.json"
+    path.write_text(json.dumps({"departments": [
+        {"name": "Computer Eng.", "folder": "ceng"},
+        {"name": "Software", "folder": "seng", "engine": "csp", "year": 2},
+        "math",
+        {"name": "Broken", "folder": "empty"},
+    ]}), encoding="utf-8")
+    return path
+
+
+def department_outputs(out_dir):
+    outputs = {}
+    for dirpath, _, names in os.walk(out_dir):
+        for name in names:
+            if not name.startswith("summary."):
+                with open(os.path.join(dirpath, name), "rb") as f:
+                    outputs[os.path.relpath(os.path.join(dirpath, name), out_dir)] = f.read()
+    return outputs
+
+
+def test_read_manifest(tmp_path):
+    text = tmp_path / "list.txt"
+    text.write_text("# departments\nceng\n\nsub/ceng  # same name, separate output\n", encoding="utf-8")
+    departments = read_manifest(str(text))
+    assert [(d["name"], d["slug"]) for d in departments] == [("ceng", "ceng"), ("ceng", "ceng_2")]
+    assert departments[1]["folder"] == os.path.join(str(tmp_path), "sub/ceng")
+    bad = tmp_path / "bad.json"
+    bad.write_text('[{"name": "no folder"}]', encoding="utf-8")
+    with pytest.raises(ValueError, match="needs a folder"):
+        read_manifest(str(bad))
+
+
+def test_batch_rows_and_outputs_do_not_depend_on_workers(manifest, tmp_path):
+    departments = read_manifest(str(manifest))
+    serial = run_batch(departments, str(tmp_path / "serial"), workers=1)
+    pooled = run_batch(departments, str(tmp_path / "pooled"), workers=3)
+    strip = lambda rows: [{k: v for k, v in r.items() if k != "seconds"} for r in rows]
+    assert strip(serial) == strip(pooled)
+    assert [r["status"] for r in serial] == ["ok", "ok", "ok", "failed"]
+    assert list(serial[1]["years"]) == ["2"]
+    assert department_outputs(tmp_path / "serial") == department_outputs(tmp_path / "pooled")
+    assert sorted(os.listdir(tmp_path / "serial")) == ["Computer_Eng.", "Software", "math"]
+
+
+def test_batch_command_writes_a_summary(manifest, tmp_path, capsys):
+    assert main(["batch", str(manifest), "--out", str(tmp_path), "--workers", "2", "--format", "csv"]) == 1
+    summary = json.loads((tmp_path / "summary.json").read_text(encoding="utf-8"))
+    assert summary["totals"]["ok"] == 3 and summary["totals"]["failed"] == 1
+    assert summary["departments"][3]["error"].startswith("ValueError: No courses to schedule")
+    assert "3/4 departments scheduled" in capsys.readouterr().out
+    assert (tmp_path / "summary.csv").read_text(encoding="utf-8").splitlines()[0] == \
+        ",".join(beeplan_cli.SUMMARY_FIELDS)
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="the crash is patched in before forking")
+def test_a_dead_worker_only_fails_its_department(manifest, tmp_path, monkeypatch):
+    schedule_files = beeplan_cli.schedule_files
+
+    def crash_on_math(paths, out_dir, *args, **kwargs):
+        if os.path.basename(out_dir) == "math":
+            os._exit(1)
+        return schedule_files(paths, out_dir, *args, **kwargs)
+
+    monkeypatch.setattr(beeplan_cli, "schedule_files", crash_on_math)
+    rows = run_batch(read_manifest(str(manifest)), str(tmp_path), workers=2)
+    assert [(r["status"], r["error"]) for r in rows[:3]] == [("ok", ""), ("ok", ""), ("failed", "worker process died")]
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".running")]
@@ -0,0 +1,78 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from beeplan_cli import main
+from conftest import APP_DIR
+from workload import write_workload
+
+ROOT = os.path.dirname(APP_DIR)
+
+
+@pytest.fixture(scope="module")
+def folder(tmp_path_factory):
+    folder = tmp_path_factory.mktemp("department")
+    write_workload(str(folder), 160, seed=7, formats=("json",))
+    return folder
+
+
+def read_outputs(out_dir):
+    outputs = {}
+    for name in sorted(os.listdir(out_dir)):
+        with open(os.path.join(out_dir, name), "rb") as f:
+            outputs[name] = f.read()
+    return outputs
+
+
+def test_schedule_writes_schedule_and_report(folder, tmp_path, capsys):
+    assert main(["schedule", "--folder", str(folder), "--out", str(tmp_path), "--workers", "1"]) == 0
+    assert sorted(os.listdir(tmp_path)) == ["report.csv", "report.json", "schedule.csv", "schedule.json"]
+    out = capsys.readouterr().out
+    assert out.startswith("Year 1: ") and "Wrote 4 files" in out
+
+
+@pytest.mark.parametrize("engine", ["greedy", "csp", "anneal"])
+def test_output_does_not_depend_on_workers(folder, tmp_path, engine):
+    runs = []
+    for workers in ("1", "2", "4"):
+        out = tmp_path / workers
+        assert main(["schedule", "--folder", str(folder), "--out", str(out), "--engine", engine,
+                     "--workers", workers]) == 0
+        runs.append(read_outputs(out))
+    assert runs[0] == runs[1] == runs[2]
+
+
+def test_output_does_not_depend_on_the_cache(folder, tmp_path):
+    for run in ("cold", "warm", "uncached"):
+        args = ["schedule", "--folder", str(folder), "--out", str(tmp_path / run), "--year", "2"]
+        assert main(args + (["--no-cache"] if run == "uncached" else [])) == 0
+    assert read_outputs(tmp_path / "cold") == read_outputs(tmp_path / "warm") == read_outputs(tmp_path / "uncached")
+
+
+def test_errors_exit_with_status_1(folder, tmp_path, capsys):
+    assert main(["schedule", "--classrooms", str(folder / "Classrooms.json"), "--out", str(tmp_path)]) == 1
+    assert "beeplan: error: No courses to schedule" in capsys.readouterr().err
+    assert main(["schedule", "--folder", str(folder), "--out", str(tmp_path), "--engine", "nope"]) == 1
+    assert "Unknown scheduling engine" in capsys.readouterr().err
+
+
+def test_cli_runs_without_gui_modules(folder, tmp_path):
+    script = (
+        "import sys\n"
+        f"sys.path.insert(0, {APP_DIR!r})\n"
+        "from beeplan_cli import main\n"
+        f"code = main(['schedule', '--folder', {str(folder)!r}, '--out', {str(tmp_path)!r}, '--workers', '1'])\n"
+        "assert code == 0, code\n"
+        "loaded = sorted(m for m in ('tkinter', 'openpyxl', 'beeplan_app') if m in sys.modules)\n"
+        "assert not loaded, loaded\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, capture_output=True)
+
+
+def test_root_launcher(folder, tmp_path):
+    done = subprocess.run([sys.executable, os.path.join(ROOT, "beeplan.py"), "schedule", "--folder", str(folder),
+                           "--out", str(tmp_path), "--format", "csv"], capture_output=True, text=True)
+    assert done.returncode == 0, done.stderr
+    assert sorted(os.listdir(tmp_path)) == ["report.csv", "schedule.csv"]
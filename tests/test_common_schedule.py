@@ -0,0 +1,68 @@
+import datetime
+
+import pytest
+
+import common_schedule
+from beeplan_core import Classroom, Course, generate_schedule
+from common_schedule import CommonSchedule, CommonSession, day_index, load_common_schedule, time_index
+from scheduler import slot_bit
+
+SESSIONS = [
+    CommonSession(0, 0, "TURK101", year=1),
+    CommonSession(1, 2, "HIST201", room_id="A1", instructor_id="Dr H", year=2),
+    CommonSession(2, 3, "", room_id="A1"),  # room-only booking
+    CommonSession(3, 4, "ASSEMBLY"),  # closes the slot for everyone
+]
+
+
+def test_day_and_time_cells():
+    assert [day_index(v) for v in ("Mon", "monday", " TUE ", datetime.date(2026, 10, 16), "SUN", None)] == \
+        [0, 0, 1, 4, None, None]
+    assert [time_index(v) for v in ("9:20", "09:20", "10:20-11:10", "16.20", datetime.time(13, 20), "8:00", "x")] == \
+        [0, 0, 1, 7, 4, None, None]
+
+
+def test_reservations_and_year_cells():
+    common = CommonSchedule(list(SESSIONS))
+    reserved = common.reservations()
+    assert reserved.years == {1: slot_bit(0, 0), 2: slot_bit(1, 2)}
+    assert reserved.rooms == {"A1": slot_bit(1, 2) | slot_bit(2, 3)}
+    assert reserved.instructors == {"Dr H": slot_bit(1, 2)}
+    assert reserved.slots == slot_bit(3, 4)
+    assert sorted(common.by_slot(1)) == [(0, 0), (3, 4)]
+    assert sorted(common.by_slot()) == [(0, 0), (1, 2), (3, 4)]
+
+
+def test_dashboard_schedule_keeps_out_of_common_cells():
+    common = CommonSchedule([CommonSession(0, 0, "TURK101", year=1), CommonSession(1, 0, "", room_id="A1")])
+    courses = [Course("SE101", year=1, students=30, instructor="Dr A"),
+               Course("SE102", year=1, students=30, instructor="Dr B")]
+    result = generate_schedule(courses, year_filter=1, classrooms=[Classroom("A1", 40)], common=common)
+    grid = result["schedule"]
+    assert grid["MON"]["9:20"] == "TURK101\n(Common)"
+    assert grid["TUE"]["9:20"] == ""  # only the room is booked, and the pool has no other
+    assert (grid["WED"]["9:20"], grid["THU"]["9:20"]) == ("SE101", "SE102")
+
+
+def test_missing_openpyxl_is_reported(monkeypatch):
+    monkeypatch.setattr(common_schedule, "optional", lambda name: None)
+    with pytest.raises(RuntimeError, match="openpyxl"):
+        load_common_schedule("CommonSchedule.xlsx")
+
+
+def test_load_common_schedule(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["Title row"])
+    ws.append(["Day", "Start Time", "Course Code", "Room", "Instructor", "Year", "Hours"])
+    ws.append(["Monday", "09:20", "TURK101", "", "", 1, 2])
+    ws.append(["FRI", datetime.time(16, 20), "HIST201", "A1", "Dr H", 2, 3])  # runs past the last slot
+    ws.append([None, None, None])
+    ws.append(["Someday", "09:20", "BAD"])
+    path = tmp_path / "CommonSchedule.xlsx"
+    wb.save(path)
+    common = load_common_schedule(str(path))
+    assert common.sessions == [CommonSession(0, 0, "TURK101", year=1), CommonSession(0, 1, "TURK101", year=1),
+                               CommonSession(4, 7, "HIST201", "A1", "Dr H", 2)]
+    assert common.skipped == 1
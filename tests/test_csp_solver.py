@@ -0,0 +1,46 @@
+from conftest import check_schedule, make_courses, make_rooms
+from csp_solver import csp_schedule
+from issues import NO_ROOM
+from scheduler import Classroom, Course, greedy_schedule, placement_count, slot_bit, slots_to_mask
+
+
+def test_csp_schedule_is_valid(courses, rooms):
+    schedule, issues, conflicts, warnings = csp_schedule(courses, rooms)
+    placed = check_schedule(schedule, courses, rooms)
+    assert conflicts == 0
+    assert warnings == len(issues) == len(courses) - len(placed)
+
+
+def test_csp_places_at_least_as_many_as_greedy():
+    for seed in range(5):
+        courses, rooms = make_courses(60, seed=seed), make_rooms(3)
+        schedule = csp_schedule(courses, rooms)[0]
+        check_schedule(schedule, courses, rooms)
+        assert placement_count(schedule) >= placement_count(greedy_schedule(courses, rooms)[0])
+
+
+def test_csp_backtracks_out_of_the_greedy_choice():
+    # A is free in slots 0 and 1, B only in slot 0: greedy gives A slot 0 and strands B
+    rooms = [Classroom("R1", "R1", 50)]
+    courses = [Course("A", "I1", 10), Course("B", "I2", 10)]
+    availability = {"I1": slots_to_mask([(0, 0), (1, 0)]), "I2": slot_bit(0, 0)}
+    schedule, issues, _, _ = csp_schedule(courses, rooms, availability=availability)
+    where = {p.course_code: key for key, row in schedule.items() for p in row.values()}
+    assert where == {"A": (1, 0), "B": (0, 0)}
+    assert issues == []
+
+
+def test_csp_reports_courses_no_room_fits():
+    rooms = [Classroom("R1", "R1", 50)]
+    courses = [Course("A", "I1", 10), Course("BIG", "I2", 500)]
+    schedule, issues, _, warnings = csp_schedule(courses, rooms)
+    assert placement_count(schedule) == 1
+    assert [(i.type, i.course) for i in issues] == [(NO_ROOM, "BIG")]
+    assert warnings == 1
+
+
+def test_csp_node_limit_still_returns_a_valid_schedule():
+    courses, rooms = make_courses(120, seed=7), make_rooms(2)
+    schedule, _, _, warnings = csp_schedule(courses, rooms, max_nodes=5)
+    placed = check_schedule(schedule, courses, rooms)
+    assert len(placed) + warnings == len(courses)
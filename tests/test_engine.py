@@ -0,0 +1,90 @@
+import pytest
+
+import engine
+from beeplan_core import EXAM_BLOCK, Classroom as AppClassroom, Course as AppCourse, generate_schedule
+from conftest import check_schedule, make_courses, make_rooms
+from engine import ENGINES, ScheduleResult, model_from_app, run_app, run_engine
+from issues import NO_ISSUES
+from scheduler import Classroom, Course, Reservations, generate_schedule as schedule_by_name
+
+
+def reservations():
+    reserved = Reservations()
+    reserved.reserve(0, 0)  # closed to everyone
+    reserved.reserve(1, 0, room_id="R2")
+    reserved.reserve(2, 0, instructor_id="I1")
+    reserved.reserve(3, 0, year=2)
+    return reserved
+
+
+@pytest.mark.parametrize("name", ["greedy", "csp", "anneal"])
+def test_engines_return_valid_schedules(name):
+    courses, rooms = make_courses(60, seed=9), make_rooms(3)
+    result = run_engine(name, courses, rooms)
+    assert isinstance(result, ScheduleResult) and result.engine == name
+    placed = check_schedule(result.schedule, courses, rooms)
+    assert result.placed == len(placed)
+    assert result.placements() == sorted(result.placements(), key=lambda kp: (kp[0], kp[1].room_id))
+
+
+@pytest.mark.parametrize("name", ["greedy", "csp", "anneal"])
+def test_engines_keep_out_of_reserved_cells(name):
+    courses, rooms = make_courses(60, seed=9), make_rooms(3)
+    reserved = reservations()
+    result = run_engine(name, courses, rooms, reserved)
+    check_schedule(result.schedule, courses, rooms, reserved)
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError, match="Unknown scheduling engine"):
+        run_engine("nope", [], [])
+
+
+def test_plain_backend_gets_no_keywords(monkeypatch):
+    calls = []
+
+    def plain(courses, rooms):
+        calls.append((courses, rooms))
+        return {}, [], 0, 0
+
+    monkeypatch.setattr(engine, "ENGINES", dict(ENGINES))
+    engine.register_engine("plain")(plain)
+    result = run_engine("plain", [], [])
+    assert calls == [([], [])]
+    assert result.report == [NO_ISSUES]
+    assert result.as_tuple() == ({}, [NO_ISSUES], 0, 0)
+
+
+def test_generate_schedule_returns_report_lines():
+    rooms = [Classroom("R1", "R1", 50)]
+    schedule, report, conflicts, warnings = schedule_by_name([Course("A", "I1", 10), Course("B", "I2", 99)], rooms)
+    assert [p.course_code for row in schedule.values() for p in row.values()] == ["A"]
+    assert report == ["WARNING: Capacity - No room fits B (99 students)."]
+    assert (conflicts, warnings) == (0, 1)
+
+
+def test_model_from_app():
+    courses = [AppCourse("SE101", year=1, students=40, instructor="Dr A"),
+               AppCourse("SE101L", year=1, students=20),
+               AppCourse("SE2LAB", year=2, students=20)]
+    model, rooms = model_from_app(courses, [])
+    assert [c.is_lab for c in model] == [False, True, True]
+    assert model[1].instructor_id != model[2].instructor_id  # unassigned courses never clash
+    assert [(r.id, r.capacity) for r in rooms] == [("TBA-1", 40), ("TBA-2", 40)]
+    _, rooms = model_from_app(courses, [AppClassroom("A1", 30)])
+    assert [(r.id, r.capacity) for r in rooms] == [("A1", 30)]
+
+
+def test_run_app_filters_by_year():
+    courses = [AppCourse("SE101", year=1, instructor="Dr A"), AppCourse("SE201", year=2, instructor="Dr B")]
+    result = run_app(courses, year_filter=2, engine="csp")
+    assert [p.course_code for _, p in result.placements()] == ["SE201"]
+
+
+def test_grid_marks_every_blocked_slot_as_exam():
+    result = generate_schedule([AppCourse("SE101", year=1, instructor="Dr A")], year_filter=1)
+    assert len(EXAM_BLOCK) == 2
+    for (day, time), text in EXAM_BLOCK.items():
+        assert result["schedule"][day][time] == text
+    assert result["schedule"]["MON"]["9:20"] == "SE101"
+    assert (result["scheduled_courses"], result["conflicts"]) == (1, 0)
@@ -0,0 +1,83 @@
+import pytest
+
+from beeplan_core import Classroom, Course, Instructor
+from engine import model_from_app, run_app
+from entity_store import CourseStore, EntityIndex, InstructorStore, Interner, RoomStore, courses_of_year
+
+COURSES = [
+    Course("SE101", "Intro", 1, 40, 3, "Dr A"),
+    Course("SE101L", "Intro Lab", 1, 20, 2, "Dr B"),
+    Course("SE201", "Design", 2, 2 ** 40, 1, ""),  # counts from input files may exceed 32 bits
+    Course("SE301", "Testing", 3, 35, 2, "Dr A"),
+]
+
+
+def fields(c):
+    return c.code, c.name, c.year, c.students, c.hours, c.instructor
+
+
+def test_course_store_round_trip():
+    store = CourseStore.from_courses(COURSES)
+    assert len(store) == len(COURSES)
+    assert [fields(v) for v in store] == [fields(c) for c in COURSES]
+    assert fields(store[-1]) == fields(COURSES[-1])
+    assert [v.is_lab for v in store] == [False, True, False, False]
+    assert store[0].instructor_id == store[3].instructor_id
+    with pytest.raises(IndexError):
+        store[len(COURSES)]
+
+
+def test_course_store_take_and_year():
+    store = CourseStore.from_courses(COURSES)
+    assert [v.code for v in store.take([3, 0])] == ["SE301", "SE101"]
+    assert [v.code for v in courses_of_year(store, 1)] == ["SE101", "SE101L"]
+    assert isinstance(courses_of_year(store, 1), CourseStore)
+    assert [c.code for c in courses_of_year(COURSES, 1)] == ["SE101", "SE101L"]
+
+
+def test_store_feeds_the_engine_like_a_list():
+    store = CourseStore.from_courses(COURSES)
+    rooms = [Classroom("A1", 50)]
+    assert model_from_app(store, rooms) == model_from_app(COURSES, rooms)
+    assert model_from_app(store, []) == model_from_app(COURSES, [])
+    assert run_app(store, rooms, year_filter=1).placements() == run_app(COURSES, rooms, year_filter=1).placements()
+
+
+def test_instructor_store_shares_the_interner():
+    interner = Interner()
+    instructors = InstructorStore.from_instructors(
+        [Instructor("Dr A", [("MON", "9:20")]), Instructor("Dr B")], interner)
+    courses = CourseStore.from_courses(COURSES, interner)
+    assert [(i.name, i.available) for i in instructors] == [("Dr A", [("MON", "9:20")]), ("Dr B", None)]
+    assert courses[0].instructor_id == instructors[0].id
+    assert len(interner) == 3  # Dr A, Dr B and the unassigned ""
+
+
+def test_room_store():
+    store = RoomStore.from_classrooms([Classroom("A1", 40), Classroom("B2", 3_000_000_000)])
+    assert [(r.name, r.capacity) for r in store] == [("A1", 40), ("B2", 3_000_000_000)]
+    assert store[-1].name == "B2"
+    with pytest.raises(IndexError):
+        store[2]
+
+
+# -----------------------------
+# Entity indexes
+# -----------------------------
+@pytest.mark.parametrize("as_store", [False, True])
+def test_entity_index_lookups(as_store):
+    courses = COURSES + [Course("SE101", "Duplicate", 4, 1, 1, "Dr C")]
+    instructors = [Instructor("Dr A"), Instructor("Dr B"), Instructor("Dr A", [("MON", "9:20")])]
+    if as_store:
+        interner = Interner()
+        courses = CourseStore.from_courses(courses, interner)
+        instructors = InstructorStore.from_instructors(instructors, interner)
+    index = EntityIndex(courses, instructors)
+    assert index.course("SE101").name == "Intro"  # the first of a duplicated code
+    assert index.course("NOPE") is None
+    assert [c.code for c in index.courses_of_instructor("Dr A")] == ["SE101", "SE301"]
+    assert [c.code for c in index.courses_of_instructor("")] == ["SE201"]
+    assert [c.code for c in index.courses_of_year(1)] == ["SE101", "SE101L"]
+    assert index.courses_of_year(9) == []
+    assert index.instructor("Dr A").available is None
+    assert index.instructor("Dr Z") is None
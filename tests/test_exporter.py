@@ -0,0 +1,91 @@
+import datetime
+import json
+import os
+
+import pytest
+
+import exporter
+from beeplan_core import Classroom, Course, export_sessions, generate_schedule
+from entity_store import EntityIndex
+from exporter import Session, build_views, export_all, write_xlsx
+
+SESSIONS = [
+    Session(2, "TUE", "9:20", "SE201", "Dr A", "A1"),
+    Session(1, "MON", "10:20", "SE102", "Dr A", "A1"),
+    Session(1, "MON", "9:20", "SE101", "Dr B", ""),
+    Session(1, "FRI", "16:20", "SE103", "Dr A/B", "B; 2"),
+    Session(1, "THU", "11:20", "SE104", "Dr A:B", "B; 2"),
+]
+
+
+def relative(paths, root):
+    return [os.path.relpath(p, root).replace(os.sep, "/") for p in paths]
+
+
+def test_views_are_grouped_and_ordered():
+    views = build_views(SESSIONS)
+    assert sorted(views["years"]) == ["Year 1", "Year 2"]
+    assert [s.code for s in views["years"]["Year 1"]] == ["SE101", "SE102", "SE104", "SE103"]
+    assert [s.code for s in views["instructors"]["Dr A"]] == ["SE102", "SE201"]
+    assert sorted(views["rooms"]) == ["A1", "B; 2"]  # sessions without a room are left out
+
+
+def test_export_all_writes_every_view(tmp_path):
+    paths = export_all(SESSIONS, str(tmp_path), formats=["csv", "json", "ics"], week_of=datetime.date(2026, 10, 14))
+    assert "csv/instructors/Dr_A_B.csv" in relative(paths, tmp_path)
+    assert "csv/instructors/Dr_A_B_2.csv" in relative(paths, tmp_path)  # names that sanitize alike
+    assert len(paths) == 3 * (2 + 4 + 2)
+    with open(tmp_path / "csv" / "years" / "Year_1.csv", encoding="utf-8") as f:
+        assert f.read().splitlines()[:2] == ["Day,Time,Course,Instructor,Room,Year", "MON,9:20,SE101,Dr B,,1"]
+    with open(tmp_path / "json" / "rooms" / "B_2.json", encoding="utf-8") as f:
+        doc = json.load(f)
+    assert doc["view"] == "B; 2" and [s["code"] for s in doc["sessions"]] == ["SE104", "SE103"]
+
+
+def test_ics_events(tmp_path):
+    path = tmp_path / "view.ics"
+    long_name = "Prof " + "Çok Uzun İsim " * 8
+    exporter.write_ics(str(path), "B; 2", [Session(1, "FRI", "16:20", "SE103", long_name, "B; 2")],
+                       datetime.date(2026, 10, 14), datetime.datetime(2026, 10, 1, 12, 0))
+    data = path.read_bytes()
+    lines = data.decode("utf-8").split("\r\n")
+    assert "DTSTART:20261016T162000" in lines and "DTEND:20261016T171000" in lines
+    assert r"LOCATION:B\; 2" in lines and "DTSTAMP:20261001T120000Z" in lines
+    assert all(len(line.encode("utf-8")) <= 75 for line in lines)
+    unfolded = data.decode("utf-8").replace("\r\n ", "")
+    assert f"SUMMARY:SE103 ({long_name})" in unfolded
+
+
+def test_pooled_export_writes_the_same_files(tmp_path):
+    week = datetime.date(2026, 10, 14)
+    one = export_all(SESSIONS, str(tmp_path / "one"), formats=["csv", "json"], week_of=week)
+    many = export_all(SESSIONS, str(tmp_path / "many"), formats=["csv", "json"], week_of=week, workers=4)
+    assert relative(one, tmp_path / "one") == relative(many, tmp_path / "many")
+    for a, b in zip(one, many):
+        with open(a, "rb") as fa, open(b, "rb") as fb:
+            assert fa.read() == fb.read()
+
+
+def test_xlsx_needs_openpyxl(tmp_path, monkeypatch):
+    monkeypatch.setattr(exporter, "installed", lambda name: False)
+    assert exporter.available_formats() == ["csv", "json", "ics"]
+    monkeypatch.setattr(exporter, "optional", lambda name: None)
+    with pytest.raises(RuntimeError, match="openpyxl"):
+        write_xlsx(str(tmp_path / "years.xlsx"), build_views(SESSIONS)["years"])
+
+
+def test_xlsx_sheets(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    paths = export_all(SESSIONS, str(tmp_path), formats=["xlsx"])
+    assert relative(paths, tmp_path) == ["instructors.xlsx", "rooms.xlsx", "years.xlsx"]
+    wb = openpyxl.load_workbook(tmp_path / "instructors.xlsx", read_only=True)
+    assert wb.sheetnames == ["Dr A", "Dr B", "Dr A_B", "Dr A_B~2"]
+
+
+def test_export_sessions_from_results():
+    courses = [Course("SE101", year=1, instructor="Dr A"), Course("SE201", year=2, instructor="Dr B")]
+    results = {1: generate_schedule(courses, year_filter=1), 2: generate_schedule(courses, 2, [Classroom("A1", 10)])}
+    assert export_sessions(results, EntityIndex(courses)) == [
+        Session(1, "MON", "9:20", "SE101", "Dr A", ""),  # stand-in TBA rooms are not exported
+        Session(2, "MON", "9:20", "SE201", "Dr B", "A1"),
+    ]
@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from beeplan_core import Instructor
+from conftest import check_schedule, make_courses, make_rooms
+from engine import availability_from_app, run_engine
+from feasibility import feasible_domains, illegal_placements
+from scheduler import (
+    ALL_SLOTS,
+    BLOCKED_MASK,
+    SLOT_COUNT,
+    Course,
+    Placement,
+    Reservations,
+    RoomIndex,
+    slot_bit,
+    slot_of,
+)
+
+
+def random_reservations(rng, rooms):
+    reserved = Reservations()
+    for _ in range(12):
+        d, t = slot_of(rng.randrange(SLOT_COUNT))
+        kind = rng.randrange(4)
+        reserved.reserve(d, t, room_id=rng.choice(rooms).id if kind == 0 else None,
+                         instructor_id=f"I{rng.randrange(6)}" if kind == 1 else None,
+                         year=rng.randint(1, 4) if kind == 2 else 0)
+    return reserved
+
+
+def test_feasible_domains_match_brute_force():
+    rng = random.Random(8)
+    courses, rooms = make_courses(30, seed=8), make_rooms(4, labs=1)
+    availability = {"I1": rng.getrandbits(SLOT_COUNT), "I3": rng.getrandbits(SLOT_COUNT)}
+    reserved = random_reservations(rng, rooms)
+    index = RoomIndex(rooms)
+    domains = feasible_domains(courses, rooms, availability=availability, reserved=reserved)
+    for course, domain in zip(courses, domains):
+        assert set(domain) == {r.id for r in index.fitting(course)}
+        for room_id, mask in domain.items():
+            for s in range(SLOT_COUNT):
+                bit = 1 << s
+                legal = (not bit & BLOCKED_MASK and bit & availability.get(course.instructor_id, ALL_SLOTS)
+                         and not bit & reserved.course_mask(course) and not bit & reserved.rooms.get(room_id, 0))
+                assert bool(mask & bit) == bool(legal)
+
+
+def test_illegal_placements_flags_each_rule():
+    rooms = make_rooms(2, labs=0)  # R0 (30 seats), R1 (50 seats)
+    courses = [Course("A", "I1", 45), Course("B", "I2", 10), Course("C", "I3", 10), Course("D", "I4", 10)]
+    reserved = Reservations()
+    reserved.reserve(2, 0, room_id="R0")
+    schedule = {
+        (0, 0): {"R0": Placement("A", "I1", "R0")},  # too small
+        (4, 4): {"R0": Placement("B", "I2", "R0")},  # exam block
+        (1, 0): {"R0": Placement("C", "I3", "R0")},  # outside I3's availability
+        (2, 0): {"R0": Placement("D", "I4", "R0")},  # room reserved
+        (3, 0): {"R0": Placement("X", "I9", "R0"),  # unknown course
+                 "R1": Placement("A", "I1", "R1")},  # legal
+    }
+    bad = illegal_placements(courses, rooms, schedule, availability={"I3": slot_bit(0, 0)}, reserved=reserved)
+    assert sorted(p.course_code for _, p in bad) == ["A", "B", "C", "D", "X"]
+
+
+@pytest.mark.parametrize("engine", ["greedy", "csp", "anneal"])
+def test_engines_keep_to_availability(engine):
+    rng = random.Random(6)
+    courses, rooms = make_courses(50, seed=6), make_rooms(3)
+    availability = {f"I{i}": rng.getrandbits(SLOT_COUNT) | slot_bit(0, 0) for i in range(3)}
+    result = run_engine(engine, courses, rooms, availability=availability)
+    check_schedule(result.schedule, courses, rooms, Reservations().with_availability(availability))
+    assert illegal_placements(courses, rooms, result.schedule, availability=availability) == []
+
+
+def test_availability_from_app():
+    instructors = [
+        Instructor("Dr A", [("MON", "9:20"), ("Tuesday", "10:20-11:10"), "garbage", ("SUN", "9:20")]),
+        Instructor("Dr B", None),
+        Instructor("Dr C", [("MON", "8:00")]),  # nothing that names a slot: unrestricted
+    ]
+    assert availability_from_app(instructors) == {"Dr A": slot_bit(0, 0) | slot_bit(1, 1)}
@@ -0,0 +1,88 @@
+import os
+
+import beeplan_core
+from beeplan_core import Classroom, load_cached, load_json_or_csv, parse_classrooms
+from input_cache import ParsedInputCache
+
+
+def write_rooms(path, rooms):
+    path.write_text("name,capacity\n" + "".join(f"{n},{c}\n" for n, c in rooms), encoding="utf-8")
+
+
+def parse(path):
+    return parse_classrooms(load_json_or_csv(path))
+
+
+def entries(cache_dir):
+    return sorted(n for n in os.listdir(cache_dir) if n.endswith(".pkl"))
+
+
+def test_hit_after_miss(tmp_path):
+    src = tmp_path / "Classrooms.csv"
+    write_rooms(src, [("A1", 40), ("B2", 60)])
+    cache = ParsedInputCache(str(tmp_path / "cache"))
+    first = cache.load(str(src), Classroom, parse)
+    assert first == [Classroom("A1", 40), Classroom("B2", 60)]
+    assert cache.load(str(src), Classroom, parse) == first
+    assert (cache.hits, cache.misses) == (1, 1)
+    # another instance (e.g. a worker process) shares the entries
+    other = ParsedInputCache(str(tmp_path / "cache"))
+    assert other.load(str(src), Classroom, parse) == first and other.hits == 1
+
+
+def test_content_hash_decides(tmp_path):
+    src = tmp_path / "Classrooms.csv"
+    write_rooms(src, [("A1", 40)])
+    cache = ParsedInputCache(str(tmp_path / "cache"))
+    cache.load(str(src), Classroom, parse)
+    write_rooms(src, [("A1", 40)])  # rewritten, same content
+    os.utime(src, ns=(1, 1))
+    cache.load(str(src), Classroom, parse)
+    assert (cache.hits, cache.misses) == (1, 1)
+    write_rooms(src, [("A1", 45)])  # same size, new content
+    os.utime(src, ns=(2, 2))
+    assert cache.load(str(src), Classroom, parse) == [Classroom("A1", 45)]
+    assert cache.misses == 2
+
+
+def test_parser_version_is_part_of_the_key(tmp_path):
+    src = tmp_path / "Classrooms.csv"
+    write_rooms(src, [("A1", 40)])
+    cache = ParsedInputCache(str(tmp_path / "cache"))
+    cache.load(str(src), Classroom, parse, version="1")
+    cache.load(str(src), Classroom, parse, version="2")
+    cache.load(str(src), Classroom, parse, version="1")
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert len(entries(cache.cache_dir)) == 2
+
+
+def test_damaged_entry_is_rebuilt(tmp_path):
+    src = tmp_path / "Classrooms.csv"
+    write_rooms(src, [("A1", 40)])
+    cache = ParsedInputCache(str(tmp_path / "cache"))
+    cache.load(str(src), Classroom, parse)
+    (name,) = entries(cache.cache_dir)
+    with open(os.path.join(cache.cache_dir, name), "wb") as f:
+        f.write(b"not a pickle")
+    assert cache.load(str(src), Classroom, parse) == [Classroom("A1", 40)]
+    assert cache.misses == 2
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ParsedInputCache(str(tmp_path / "cache"), max_bytes=1)
+    for n in range(3):
+        src = tmp_path / f"Classrooms{n}.csv"
+        write_rooms(src, [(f"R{n}", 10 + n)])
+        cache.load(str(src), Classroom, parse)
+        assert len(entries(cache.cache_dir)) == 1  # only the entry just written is kept
+    cache.clear()
+    assert entries(cache.cache_dir) == []
+
+
+def test_load_cached_uses_the_shared_cache(tmp_path):
+    src = tmp_path / "Classrooms.csv"
+    write_rooms(src, [("A1", 40)])
+    hits = beeplan_core.INPUT_CACHE.hits
+    assert load_cached(str(src), "classrooms") == load_cached(str(src), "classrooms") == [Classroom("A1", 40)]
+    assert beeplan_core.INPUT_CACHE.hits == hits + 1
+    assert beeplan_core.INPUT_CACHE.cache_dir == os.environ["BEEPLAN_CACHE_DIR"]
@@ -0,0 +1,93 @@
+from issues import (
+    CRITICAL,
+    INSTRUCTOR_OVERLAP,
+    NO_ISSUES,
+    NO_ROOM,
+    ROOM_OVERLAP,
+    UNSCHEDULED,
+    WARNING,
+    YEAR_CLASH,
+    Issue,
+    IssueReport,
+    report_lines,
+)
+from scheduler import DAYS, TIMES, Classroom, Course, greedy_schedule
+
+ISSUES = [
+    Issue(ROOM_OVERLAP, CRITICAL, "SE102", "Monday", "09:20", "A1", "Dr B", "SE101"),
+    Issue(UNSCHEDULED, WARNING, "SE103"),
+    Issue(INSTRUCTOR_OVERLAP, CRITICAL, "SE104", "Tuesday", "10:20", instructor="Dr A", detail="SE101"),
+    Issue(ROOM_OVERLAP, CRITICAL, "SE105", "Monday", "09:20", "A1", "Dr C", "SE101"),
+    Issue(NO_ROOM, WARNING, "SE106", detail="400 students"),
+    Issue(YEAR_CLASH, CRITICAL, "SE201", "Friday", "16:20", instructor="Dr A"),
+    Issue("duplicate_code", CRITICAL, "SE101", detail="Course code SE101 appears more than once."),
+]
+
+
+def test_messages():
+    assert [i.message for i in ISSUES] == [
+        "CONFLICT: Room overlap at Monday 09:20 room=A1 (SE101 vs SE102)",
+        "WARNING: Unscheduled - Could not place SE103 (no available slot).",
+        "CONFLICT: Instructor overlap at Tuesday 10:20 (SE101 vs SE104) instructor=Dr A",
+        "CONFLICT: Room overlap at Monday 09:20 room=A1 (SE101 vs SE105)",
+        "WARNING: Capacity - No room fits SE106 (400 students).",
+        "SE201: Dr A also teaches another year at Friday 16:20",
+        "Course code SE101 appears more than once.",
+    ]
+    assert report_lines([]) == [NO_ISSUES]
+    assert report_lines(ISSUES[:1]) == [ISSUES[0].message]
+
+
+def test_report_counts_and_groups():
+    report = IssueReport(ISSUES[:4])
+    report.extend(ISSUES[4:])
+    assert len(report) == 7
+    assert (report.count(CRITICAL), report.count(WARNING), report.count("info")) == (5, 2, 0)
+    assert list(report.type_counts().items())[0] == (ROOM_OVERLAP, 2)
+    assert list(report.positions(ROOM_OVERLAP)) == [0, 3]
+    assert list(report.positions(WARNING)) == [1, 4]
+    assert list(report.positions()) == list(range(7))
+    assert report.positions("nope") == []
+
+
+def test_report_pages():
+    report = IssueReport(ISSUES)
+    assert report.page_count(3) == 3
+    assert report.page(2, 3) == ISSUES[6:]
+    assert report.page(0, 2, CRITICAL) == [ISSUES[0], ISSUES[2]]
+    assert report.page(5, 2, CRITICAL) == []
+    assert IssueReport().page_count(3) == 1
+
+
+def test_engine_issues_use_the_engine_day_and_time_names():
+    rooms = [Classroom("R1", "R1", 50)]
+    courses = [Course("A", "I1", 10), Course("B", "I1", 10), Course("C", "I2", 10)]
+    _, issues, conflicts, _ = greedy_schedule(courses, rooms)
+    report = IssueReport(issues)
+    assert conflicts == len(report.positions(CRITICAL)) > 0
+    for issue in issues:
+        assert issue.day in DAYS and issue.time in TIMES
+    assert report.page(0, 1, INSTRUCTOR_OVERLAP)[0] == Issue(
+        INSTRUCTOR_OVERLAP, CRITICAL, "B", "Monday", "09:20", instructor="I1", detail="A")
+
+
+def test_cli_report_lists_input_findings_once(tmp_path):
+    import csv
+    import json
+
+    from beeplan_cli import schedule_files
+
+    courses = tmp_path / "Courses.json"
+    courses.write_text(json.dumps([
+        {"code": "SE101", "year": 1, "instructor": "Dr A"},
+        {"code": "SE101", "year": 2, "instructor": "Dr A"},
+        {"code": "SE201", "year": 2, "students": 500, "instructor": "Dr B"},
+    ]), encoding="utf-8")
+    rooms = tmp_path / "Classrooms.json"
+    rooms.write_text(json.dumps([{"name": "A1", "capacity": 40}]), encoding="utf-8")
+    schedule_files({"courses": str(courses), "classrooms": str(rooms)}, str(tmp_path / "out"), workers=1)
+    with open(tmp_path / "out" / "report.csv", encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [(r["Source"], r["Type"], r["Course"]) for r in rows if r["Source"] == "validation"] == [
+        ("validation", "duplicate_code", "SE101"), ("validation", "oversized_course", "SE201")]
+    assert [(r["Year"], r["Type"], r["Day"]) for r in rows if r["Source"] == "engine"] == [("2", NO_ROOM, "")]
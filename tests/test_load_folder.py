@@ -0,0 +1,41 @@
+import os
+
+import pytest
+
+from beeplan_core import discover_data_files, load_folder, load_json_or_csv, parse_courses
+from workload import write_workload
+
+
+@pytest.fixture
+def folder(tmp_path):
+    write_workload(str(tmp_path), 80, seed=5)
+    return tmp_path
+
+
+def test_discover_prefers_json_and_ignores_case(tmp_path):
+    for name in ("COURSES.csv", "courses.JSON", "Instructors.csv", "commonSchedule.XLSX", "notes.txt"):
+        (tmp_path / name).write_text("", encoding="utf-8")
+    found = {kind: os.path.basename(path) for kind, path in discover_data_files(str(tmp_path)).items()}
+    assert found == {"courses": "courses.JSON", "instructors": "Instructors.csv", "common": "commonSchedule.XLSX"}
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_load_folder_parses_every_file(folder, workers):
+    calls = []
+    loaded, errors = load_folder(str(folder), workers=workers,
+                                 on_loaded=lambda kind, path, records, error: calls.append((kind, error)))
+    assert errors == {}
+    assert sorted(calls) == [("classrooms", None), ("courses", None), ("instructors", None)]
+    assert loaded["courses"] == parse_courses(load_json_or_csv(str(folder / "Courses.json")))
+    assert (len(loaded["instructors"]), len(loaded["classrooms"])) == (20, 8)
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_a_broken_file_does_not_stop_the_others(folder, workers):
+    (folder / "Courses.json").write_text("[{", encoding="utf-8")
+    (folder / "CommonSchedule.xlsx").write_bytes(b"not a workbook")
+    failed = []
+    loaded, errors = load_folder(str(folder), workers=workers,
+                                 on_loaded=lambda kind, path, records, error: error and failed.append(kind))
+    assert sorted(errors) == sorted(failed) == ["common", "courses"]
+    assert sorted(loaded) == ["classrooms", "instructors"]
@@ -0,0 +1,161 @@
+import io
+import json
+
+import pytest
+
+import beeplan_core
+from beeplan_core import (
+    _JsonStream,
+    iter_json_or_csv,
+    load_json_or_csv,
+    parse_classrooms,
+    parse_courses,
+    parse_instructors,
+    stream_classrooms,
+    stream_courses,
+    stream_instructors,
+)
+from workload import write_workload
+
+DOCUMENT = [
+    1, -25, 3.5, 1e3, 12345678901234567890, 0, True, False, None,
+    "plain", "esc\"aped \\ çğ 😀", "", [], {}, [1, [2, [3]]],
+    {"code": "SE101", "year": 2, "students": 150, "available": [{"day": "MON", "time": "9:20"}]},
+    {"nested": {"deep": [1.25, "x", None]}, "n": -0.5},
+]
+
+
+# -----------------------------
+# Streaming JSON
+# -----------------------------
+@pytest.mark.parametrize("chunk_size", range(1, 30))
+def test_json_stream_round_trips_across_chunk_boundaries(chunk_size):
+    for text in (json.dumps(DOCUMENT), json.dumps(DOCUMENT, indent=2), json.dumps(DOCUMENT, separators=(",", ":"))):
+        stream = _JsonStream(io.StringIO(text), chunk_size=chunk_size)
+        assert list(stream.array_items()) == DOCUMENT
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7])
+def test_json_stream_reads_a_bare_number_at_end_of_file(chunk_size):
+    stream = _JsonStream(io.StringIO("12345.75"), chunk_size=chunk_size)
+    assert stream.value() == 12345.75
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1 << 16])
+def test_iter_json_or_csv_matches_load(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.setattr(beeplan_core, "_JsonStream",
+                        lambda f: _JsonStream(f, chunk_size=chunk_size))
+    rows = [{"code": f"SE{i}", "students": i * 7, "year": 1 + i % 4} for i in range(20)]
+    documents = {
+        "list.json": rows,
+        "items.json": {"items": rows},
+        "courses.json": {"department": "SENG", "version": 2.5, "courses": rows},
+        "single.json": {"code": "SE101", "students": 40},
+        "empty.json": [],
+    }
+    for name, doc in documents.items():
+        path = tmp_path / name
+        path.write_text(json.dumps(doc, indent=1), encoding="utf-8")
+        assert list(iter_json_or_csv(str(path))) == load_json_or_csv(str(path)), name
+
+
+def test_streaming_parsers_match_list_parsers(tmp_path):
+    paths = write_workload(str(tmp_path), 150, seed=3)
+    for fmt in ("json", "csv"):
+        assert list(stream_courses(paths[f"Courses.{fmt}"])) == parse_courses(load_json_or_csv(paths[f"Courses.{fmt}"]))
+        assert (list(stream_instructors(paths[f"Instructors.{fmt}"]))
+                == parse_instructors(load_json_or_csv(paths[f"Instructors.{fmt}"])))
+        assert (list(stream_classrooms(paths[f"Classrooms.{fmt}"]))
+                == parse_classrooms(load_json_or_csv(paths[f"Classrooms.{fmt}"])))
+
+
+def test_iter_json_or_csv_rejects_bad_input(tmp_path):
+    bad = tmp_path / "bad.json"
+    bad.write_text('[{"code": "SE101"}, {"code": ', encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(iter_json_or_csv(str(bad)))
+    with pytest.raises(ValueError):
+        list(iter_json_or_csv(str(tmp_path / "data.txt")))
+
+
+# -----------------------------
+# Field schema
+# -----------------------------
+ROWS = [
+    {"code": "SE101", "name": "Intro", "year": "2", "students": "40", "hours": 3, "instructor": "Dr A"},
+    {"CourseCode": "SE102", "courseName": "Design", "ClassYear": 3, "STUDENTCOUNT": 25, "instructorName": "Dr B"},
+    {"course": "SE103", "enrolled": 10},
+    {"name": "SE104"},
+    {"unrelated": 1},
+    {},
+]
+
+
+@pytest.mark.parametrize("fields", [beeplan_core.COURSE_FIELDS, beeplan_core.INSTRUCTOR_FIELDS,
+                                    beeplan_core.CLASSROOM_FIELDS, [(("code",), "")]])
+def test_row_schema_agrees_with_pick(fields):
+    schema = beeplan_core.RowSchema(fields)
+    for _ in range(2):  # second pass reads the cached getters
+        for row in ROWS:
+            expected = [beeplan_core.pick(row, *aliases, default=default) for aliases, default in fields]
+            assert list(schema.values(row)) == expected
+
+
+def test_row_schema_caps_its_layout_cache():
+    schema = beeplan_core.RowSchema(beeplan_core.CLASSROOM_FIELDS)
+    for i in range(schema.MAX_LAYOUTS + 10):
+        assert list(schema.values({f"extra{i}": 0, "name": f"R{i}"})) == [f"R{i}", 0]
+    assert len(schema._getters) == schema.MAX_LAYOUTS
+
+
+def test_parse_courses_reads_aliases_and_fallbacks():
+    courses = parse_courses(ROWS)
+    assert [(c.code, c.name, c.year, c.students, c.hours, c.instructor) for c in courses] == [
+        ("SE101", "Intro", 2, 40, 3, "Dr A"),
+        ("SE102", "Design", 3, 25, 1, "Dr B"),
+        ("SE103", "", 1, 10, 1, ""),
+        ("SE104", "SE104", 1, 0, 1, ""),
+    ]
+
+
+# -----------------------------
+# Chunked CSV ingest
+# -----------------------------
+CSV_TEXT = (
+    '\ufeffcourseCode,courseName,classYear,studentCount,instructorName\r\n'
+    'SE101,"Intro, part 1",1,40,Dr A\r\n'
+    'SE102,"Multi\r\nline ""quoted"" name",2,25,"Dr B"\r\n'
+    '\r\n'
+    'SE103,Çalışma,3,30,Dr Ç\r\n'
+    'SE104,"ends with newline\n",4,10,Dr D\r\n'
+    'SE105,last,1,5,Dr E'
+)
+
+
+@pytest.mark.parametrize("chunk_bytes", list(range(1, 40)) + [1 << 20])
+def test_chunked_csv_matches_the_streaming_loader(tmp_path, chunk_bytes):
+    path = tmp_path / "Courses.csv"
+    path.write_bytes(CSV_TEXT.encode("utf-8"))
+    expected = list(stream_courses(str(path)))
+    assert [c.code for c in expected] == ["SE101", "SE102", "SE103", "SE104", "SE105"]
+    assert beeplan_core.ingest_csv(str(path), "courses", workers=1, chunk_bytes=chunk_bytes) == expected
+
+
+def test_chunked_csv_in_a_pool(tmp_path):
+    paths = write_workload(str(tmp_path), 400, seed=6, formats=("csv",))
+    for kind, name in (("courses", "Courses.csv"), ("instructors", "Instructors.csv"), ("classrooms", "Classrooms.csv")):
+        expected = list(beeplan_core.LOADERS[kind][1](paths[name]))
+        assert beeplan_core.ingest_csv(paths[name], kind, workers=3, chunk_bytes=512) == expected
+
+
+def test_chunked_csv_edge_files(tmp_path, monkeypatch):
+    empty, header = tmp_path / "empty.csv", tmp_path / "header.csv"
+    empty.write_bytes(b"")
+    header.write_bytes(b"name,capacity\n")
+    assert beeplan_core.ingest_csv(str(empty), "classrooms") == []
+    assert beeplan_core.ingest_csv(str(header), "classrooms") == []
+    # parse_file only switches to chunks above the size threshold
+    path = tmp_path / "Courses.csv"
+    path.write_bytes(CSV_TEXT.encode("utf-8"))
+    monkeypatch.setattr(beeplan_core, "CSV_CHUNK_MIN_BYTES", 0)
+    assert beeplan_core.parse_file(str(path), "courses", workers=2) == list(stream_courses(str(path)))
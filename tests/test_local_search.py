@@ -0,0 +1,46 @@
+from conftest import check_schedule, make_courses, make_rooms
+from local_search import improve_schedule
+from scheduler import Classroom, Course, Reservations, greedy_schedule, placement_count
+
+
+def test_improve_schedule_is_valid_and_never_worse():
+    for seed in range(4):
+        courses, rooms = make_courses(90, seed=seed), make_rooms(2)
+        start = greedy_schedule(courses, rooms)[0]
+        schedule, issues, conflicts, warnings = improve_schedule(courses, rooms, iterations=2000, seed=seed)
+        placed = check_schedule(schedule, courses, rooms)
+        assert len(placed) >= placement_count(start)
+        assert conflicts == 0 and warnings == len(issues) == len(courses) - len(placed)
+
+
+def test_improve_schedule_is_deterministic_per_seed():
+    courses, rooms = make_courses(90, seed=1), make_rooms(2)
+    a = improve_schedule(courses, rooms, seed=3, iterations=1500)
+    assert improve_schedule(courses, rooms, seed=3, iterations=1500) == a
+
+
+def test_restart_portfolio_does_not_depend_on_workers():
+    courses, rooms = make_courses(90, seed=2), make_rooms(2)
+    serial = improve_schedule(courses, rooms, iterations=1000, restarts=3, workers=1)
+    pooled = improve_schedule(courses, rooms, iterations=1000, restarts=3, workers=2)
+    assert pooled == serial
+
+
+def test_improve_schedule_places_a_course_the_start_left_out():
+    rooms = [Classroom("R1", "R1", 50)]
+    courses = [Course("A", "I1", 10), Course("B", "I2", 10)]
+    start = {(0, 0): greedy_schedule(courses[:1], rooms)[0][(0, 0)]}
+    schedule, issues, _, _ = improve_schedule(courses, rooms, schedule=start, iterations=200)
+    assert placement_count(schedule) == 2 and issues == []
+
+
+def test_improve_schedule_keeps_out_of_reserved_cells():
+    courses, rooms = make_courses(60, seed=4), make_rooms(3)
+    reserved = Reservations()
+    for d in range(5):
+        reserved.reserve(d, 0)  # 09:20 closed every day
+        reserved.reserve(d, 1, room_id="R1")
+    reserved.reserve(0, 2, year=1)
+    reserved.reserve(1, 2, instructor_id="I0")
+    schedule, _, _, _ = improve_schedule(courses, rooms, reserved=reserved, iterations=2000)
+    check_schedule(schedule, courses, rooms, reserved)
@@ -0,0 +1,65 @@
+import pytest
+
+from beeplan_core import Classroom, Course, generate_all_years, generate_schedule
+from conftest import make_courses, make_rooms
+from engine import ScheduleCancelled, run_engine
+
+
+def recorder():
+    calls = []
+    return calls, lambda done, total, conflicts: calls.append((done, total, conflicts))
+
+
+@pytest.mark.parametrize("name", ["greedy", "csp", "anneal"])
+def test_engine_progress_is_monotonic_and_ends_at_the_result(name):
+    courses, rooms = make_courses(60, seed=10), make_rooms(2)
+    calls, progress = recorder()
+    result = run_engine(name, courses, rooms, progress=progress)
+    assert calls and all(total == len(courses) for _, total, _ in calls)
+    if name == "greedy":
+        # the greedy pass counts every course it has dealt with
+        assert [done for done, _, _ in calls] == list(range(len(courses) + 1))
+        assert calls[-1] == (len(courses), len(courses), result.conflicts)
+    else:
+        # the search engines end at the courses they placed
+        assert calls[-1][0] == result.placed
+
+
+@pytest.mark.parametrize("name", ["greedy", "csp", "anneal"])
+def test_raising_from_progress_cancels_the_run(name):
+    def progress(done, total, conflicts):
+        if done >= 3:
+            raise ScheduleCancelled()
+
+    with pytest.raises(ScheduleCancelled):
+        run_engine(name, make_courses(60, seed=10), make_rooms(2), progress=progress)
+
+
+def app_courses():
+    return [Course(f"SE{y}{i:02d}", year=y, students=30, instructor=f"Dr {i % 5}")
+            for y in (1, 2, 3, 4) for i in range(6)]
+
+
+def test_dashboard_progress_reaches_the_total():
+    calls, progress = recorder()
+    generate_schedule(app_courses(), year_filter=2, classrooms=[Classroom("A1", 40)], progress=progress)
+    assert calls[-1][:2] == (6, 6)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_all_years_progress_counts_over_every_year(workers):
+    calls, progress = recorder()
+    generate_all_years(app_courses(), workers=workers, classrooms=[Classroom("A1", 40)], progress=progress)
+    assert calls[-1][:2] == (24, 24)
+    assert [done for done, _, _ in calls] == sorted(done for done, _, _ in calls)
+    if workers > 1:
+        assert [done for done, _, _ in calls] == [6, 12, 18, 24]  # one report per finished year
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_all_years_cancel(workers):
+    def progress(done, total, conflicts):
+        raise ScheduleCancelled()
+
+    with pytest.raises(ScheduleCancelled):
+        generate_all_years(app_courses(), workers=workers, progress=progress)
@@ -0,0 +1,89 @@
+import random
+
+from conftest import make_rooms
+from scheduler import (
+    SLOT_COUNT,
+    Classroom,
+    Course,
+    FreeRoomIndex,
+    OccupancyIndex,
+    RoomIndex,
+    first_fit,
+    pick_room,
+)
+
+
+def fitting_rooms(course, rooms):
+    """Reference: rooms of the course's type (any room when the type has none) that fit, smallest first."""
+    kind = "lab" if course.is_lab else "theory"
+    typed = [r for r in rooms if r.room_type == kind] or rooms
+    return sorted((r for r in typed if r.capacity >= course.students), key=lambda r: r.capacity)
+
+
+COURSES = [Course(f"X{n}", "I1", students, is_lab) for n, (students, is_lab) in
+           enumerate((s, lab) for s in (0, 25, 30, 31, 70, 90, 91, 500) for lab in (False, True))]
+
+
+def test_room_index_matches_filter_and_sort():
+    for rooms in (make_rooms(5, labs=2), make_rooms(3, labs=0), make_rooms(3, labs=3)):
+        index = RoomIndex(rooms)
+        for course in COURSES:
+            expected = fitting_rooms(course, rooms)
+            assert index.fitting(course) == expected
+            assert index.smallest(course) == (expected[0] if expected else None)
+
+
+def test_pick_room_is_smallest_fitting():
+    rooms = make_rooms(4, labs=0)
+    assert pick_room(Course("A", "I1", 45), rooms).id == "R1"
+    assert pick_room(Course("A", "I1", 1000), rooms) is None
+
+
+def test_smallest_free_skips_busy_rooms():
+    rooms = make_rooms(4, labs=0)
+    index = RoomIndex(rooms)
+    course = Course("A", "I1", 45)
+    assert index.smallest_free(course, 1, {}).id == "R1"
+    assert index.smallest_free(course, 1, {"R1": 1}).id == "R2"
+    assert index.smallest_free(course, 1, {"R1": 1, "R2": 1, "R3": 1}) is None
+    assert index.smallest_free(course, 2, {"R1": 1}).id == "R1"
+
+
+def test_free_room_index_tracks_take_and_free():
+    rng = random.Random(4)
+    rooms = make_rooms(6, labs=2)
+    occupancy = {r.id: rng.getrandbits(SLOT_COUNT) for r in rooms}
+    index = RoomIndex(rooms)
+    free = FreeRoomIndex(index, occupancy)
+    for _ in range(300):
+        room, slot = rng.choice(rooms), rng.randrange(SLOT_COUNT)
+        if occupancy[room.id] >> slot & 1:
+            occupancy[room.id] &= ~(1 << slot)
+            free.freed(room.id, slot)
+        else:
+            occupancy[room.id] |= 1 << slot
+            free.taken(room.id, slot)
+        for course in COURSES[::3]:
+            fits = fitting_rooms(course, rooms)
+            expected = 0
+            for s in range(SLOT_COUNT):
+                if any(not occupancy[r.id] >> s & 1 for r in fits):
+                    expected |= 1 << s
+            assert free.open_mask(course) == expected
+            expected_room = next((r for r in fits if not occupancy[r.id] >> slot & 1), None)
+            assert free.smallest(course, slot) == expected_room
+
+
+def test_first_fit_agrees_with_and_without_free_room_index():
+    rooms = [Classroom("R1", "R1", 40), Classroom("R2", "R2", 80)]
+    index = OccupancyIndex()
+    room_index = RoomIndex(rooms)
+    rng = random.Random(2)
+    for n in range(40):
+        course = Course(f"C{n}", f"I{rng.randrange(5)}", rng.choice([20, 60]), year=rng.randint(1, 4))
+        free_rooms = FreeRoomIndex(room_index, index.rooms)
+        spot = first_fit(course, index, room_index)
+        assert first_fit(course, index, room_index, free_rooms) == spot
+        if spot is not None:
+            day_idx, time_idx, room = spot
+            index.reserve(day_idx, time_idx, course, room.id)
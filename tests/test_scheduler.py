@@ -0,0 +1,213 @@
+import random
+
+import pytest
+
+from conftest import check_schedule, make_courses, make_rooms
+from scheduler import (
+    ALL_SLOTS,
+    BLOCKED,
+    DAYS,
+    SLOT_COUNT,
+    TIMES,
+    Classroom,
+    Course,
+    OccupancyIndex,
+    Placement,
+    Reservations,
+    Scheduler,
+    greedy_schedule,
+    instructor_views,
+    iter_slots,
+    placement_count,
+    room_views,
+    slot_bit,
+    slot_index,
+    slot_of,
+    slots_to_mask,
+)
+
+
+# -----------------------------
+# Bitset occupancy index
+# -----------------------------
+def test_slot_index_round_trip():
+    seen = set()
+    for d in range(len(DAYS)):
+        for t in range(len(TIMES)):
+            i = slot_index(d, t)
+            assert slot_of(i) == (d, t)
+            seen.add(i)
+    assert seen == set(range(SLOT_COUNT))
+    assert slots_to_mask((slot_of(i) for i in range(SLOT_COUNT))) == ALL_SLOTS
+
+
+def test_iter_slots_is_time_major():
+    slots = list(iter_slots(ALL_SLOTS))
+    assert slots[:len(DAYS)] == [(d, 0) for d in range(len(DAYS))]
+    assert slots == sorted(slots, key=lambda s: (s[1], s[0]))
+    assert list(iter_slots(slots_to_mask(BLOCKED))) == sorted(BLOCKED, key=lambda s: (s[1], s[0]))
+
+
+def test_occupancy_reserve_and_release():
+    index = OccupancyIndex()
+    course = Course("A", "I1", 10, year=2)
+    assert index.is_free(0, 0, "I1", "R1")
+    index.reserve(0, 0, course, "R1")
+    assert not index.is_free(0, 0, "I1", "R2")  # instructor busy
+    assert not index.is_free(0, 0, "I2", "R1")  # room busy
+    assert index.is_free(0, 0, "I2", "R2")
+    assert index.busy_mask("I2", "R2", year=2) & slot_bit(0, 0)
+    index.release(0, 0, course, "R1")
+    assert index.is_free(0, 0, "I1", "R1")
+    assert not index.busy_mask("I1", "R1", year=2) & slot_bit(0, 0)
+
+
+def test_occupancy_blocks_exam_slots_and_ignores_year_zero():
+    index = OccupancyIndex()
+    for d, t in BLOCKED:
+        assert not index.is_free(d, t, "I1", "R1")
+    index.reserve(1, 1, Course("A", "I1", 10), "R1")
+    assert index.years == {}
+
+
+# -----------------------------
+# Greedy scheduler
+# -----------------------------
+def test_greedy_schedule_is_valid(courses, rooms):
+    schedule, issues, conflicts, warnings = greedy_schedule(courses, rooms)
+    placed = check_schedule(schedule, courses, rooms)
+    assert len(placed) == placement_count(schedule)
+    assert warnings == len(courses) - len(placed)
+
+
+def test_greedy_takes_earliest_free_slot():
+    rooms = [Classroom("R1", "R1", 50)]
+    courses = [Course("A", "I1", 10), Course("B", "I1", 10), Course("C", "I2", 10)]
+    schedule, _, _, _ = greedy_schedule(courses, rooms)
+    where = {p.course_code: key for key, row in schedule.items() for p in row.values()}
+    # one room: the courses queue up in scan order, Monday 09:20 first
+    assert where == {"A": (0, 0), "B": (1, 0), "C": (2, 0)}
+
+
+def test_greedy_is_deterministic():
+    courses, rooms = make_courses(80, seed=3), make_rooms(3)
+    assert greedy_schedule(courses, rooms) == greedy_schedule(list(reversed(courses)), rooms)
+
+
+# -----------------------------
+# Several rooms per slot
+# -----------------------------
+def test_parallel_courses_share_a_slot_in_different_rooms():
+    rooms = [Classroom("R1", "R1", 40), Classroom("R2", "R2", 80)]
+    courses = [Course("A", "I1", 30, year=1), Course("B", "I2", 60, year=2), Course("C", "I3", 30, year=3)]
+    schedule, issues, _, warnings = greedy_schedule(courses, rooms)
+    assert warnings == 0
+    # A and B fill both rooms at Monday 09:20; C moves on to the next slot
+    assert {r: p.course_code for r, p in schedule[(0, 0)].items()} == {"R1": "A", "R2": "B"}
+    assert {r: p.course_code for r, p in schedule[(1, 0)].items()} == {"R1": "C"}
+
+
+def test_same_instructor_or_year_never_share_a_slot():
+    rooms = [Classroom(f"R{i}", f"R{i}", 50) for i in range(3)]
+    courses = [Course("A", "I1", 10, year=1), Course("B", "I1", 10, year=2), Course("C", "I2", 10, year=1)]
+    schedule, _, _, _ = greedy_schedule(courses, rooms)
+    where = {p.course_code: key for key, row in schedule.items() for p in row.values()}
+    check_schedule(schedule, courses, rooms)
+    # B and C have neither instructor nor year in common, so only they may pair up
+    assert where["A"] != where["B"] and where["A"] != where["C"]
+    assert where["B"] == where["C"]
+
+
+def test_room_and_instructor_views():
+    rooms = [Classroom("R1", "R1", 40), Classroom("R2", "R2", 80)]
+    courses = [Course("A", "I1", 30), Course("B", "I2", 60), Course("C", "I1", 30)]
+    schedule, _, _, _ = greedy_schedule(courses, rooms)
+    by_room = room_views(schedule)
+    by_instructor = instructor_views(schedule)
+    assert sum(len(v) for v in by_room.values()) == sum(len(v) for v in by_instructor.values()) == 3
+    assert sorted(p.course_code for p in by_instructor["I1"].values()) == ["A", "C"]
+    for room_id, cells in by_room.items():
+        assert all(p.room_id == room_id for p in cells.values())
+
+
+# -----------------------------
+# Incremental Scheduler
+# -----------------------------
+def cells(schedule):
+    return {(key, p) for key, row in schedule.items() for p in row.values()}
+
+
+def test_scheduler_starts_from_the_greedy_schedule(courses, rooms):
+    assert Scheduler(rooms, courses).schedule == greedy_schedule(courses, rooms)[0]
+
+
+def test_scheduler_edits_keep_a_valid_schedule():
+    rng = random.Random(5)
+    rooms = make_rooms(2)
+    pool = make_courses(120, seed=5)
+    live = {c.code: c for c in pool[:70]}
+    scheduler = Scheduler(rooms, live.values())
+    spare = pool[70:]
+    for step in range(150):
+        before = cells(scheduler.schedule)
+        action = rng.random()
+        if action < 0.35 and spare:
+            course = spare.pop()
+            live[course.code] = course
+            diff = scheduler.add_course(course)
+        elif action < 0.7:
+            code = rng.choice(sorted(live))
+            del live[code]
+            diff = scheduler.remove_course(code)
+        else:
+            old = live[rng.choice(sorted(live))]
+            course = Course(old.code, f"I{rng.randrange(6)}", rng.choice([20, 45, 90]), old.is_lab, rng.randint(1, 4))
+            live[course.code] = course
+            diff = scheduler.update_course(course)
+        # the diff replays the edit
+        assert (before - set(diff.removed)) | set(diff.added) == cells(scheduler.schedule)
+        placed = check_schedule(scheduler.schedule, list(live.values()), rooms)
+        assert placed | scheduler.unscheduled == set(live)
+        assert not placed & scheduler.unscheduled
+
+
+def test_removing_a_course_refills_its_slot():
+    rooms = [Classroom("R1", "R1", 50)]
+    courses = [Course(f"C{n:02d}", f"I{n}", 10) for n in range(39)]  # one more than the open slots
+    scheduler = Scheduler(rooms, courses)
+    assert scheduler.unscheduled == {"C38"}
+    key = scheduler.where["C05"][0]
+    diff = scheduler.remove_course("C05")
+    assert diff.added == [(key, Placement("C38", "I38", "R1"))]
+    assert scheduler.unscheduled == set()
+
+
+def test_add_course_moves_one_course_to_make_room():
+    rooms = [Classroom("R1", "R1", 50)]
+    # B's instructor can only teach at Monday 09:20, which A took first
+    reserved = Reservations().with_availability({"I2": slot_bit(0, 0)})
+    scheduler = Scheduler(rooms, [Course("A", "I1", 10)], reserved=reserved)
+    diff = scheduler.add_course(Course("B", "I2", 10))
+    assert diff.unscheduled == []
+    assert scheduler.where["B"][0] == (0, 0)
+    assert scheduler.where["A"][0] != (0, 0)
+
+
+def test_update_in_place_is_an_empty_diff():
+    rooms = [Classroom("R1", "R1", 50)]
+    scheduler = Scheduler(rooms, [Course("A", "I1", 10)])
+    diff = scheduler.update_course(Course("A", "I1", 20))
+    assert diff.added == diff.removed == []
+    assert scheduler.where["A"][0] == (0, 0)
+
+
+def test_scheduler_rejects_unknown_and_duplicate_codes():
+    scheduler = Scheduler([Classroom("R1", "R1", 50)], [Course("A", "I1", 10)])
+    with pytest.raises(ValueError):
+        scheduler.add_course(Course("A", "I2", 10))
+    with pytest.raises(KeyError):
+        scheduler.remove_course("B")
+    with pytest.raises(KeyError):
+        scheduler.update_course(Course("B", "I1", 10))
+    with pytest.raises(ValueError):
+        Scheduler([], [Course("A", "I1", 10), Course("A", "I2", 10)])
@@ -0,0 +1,65 @@
+from types import SimpleNamespace
+
+import pytest
+
+tk = pytest.importorskip("tkinter")
+
+
+@pytest.fixture
+def root():
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("no display")
+    root.withdraw()
+    yield root
+    root.destroy()
+
+
+@pytest.fixture
+def grid(root):
+    from timetable_canvas import TimetableCanvas
+
+    clicks = []
+    colors = lambda text: ("#ffb5b5", "#d10000") if text.startswith("EXAM") else ("#eaf6ff", "#111")
+    canvas = TimetableCanvas(root, colors, on_click=lambda *args: clicks.append(args))
+    canvas.clicks = clicks
+    assert canvas.set_layout(["MON", "TUE"], ["9:20", "10:20", "11:20"])
+    return canvas
+
+
+def text_of(canvas, key):
+    return canvas.body.itemcget(canvas.items[key][1], "text")
+
+
+def test_layout_is_only_rebuilt_when_it_changes(grid):
+    assert not grid.set_layout(["MON", "TUE"], ["9:20", "10:20", "11:20"])
+    assert grid.set_layout(["MON", "TUE"], ["9:20", "10:20", "11:20"], cell_size=(100, 40))
+    assert grid.set_layout(["MON"], ["9:20"])
+    assert set(grid.items) == {("MON", "9:20")}
+
+
+def test_show_repaints_only_changed_cells(grid):
+    assert grid.show({("MON", "9:20"): "SE101", ("TUE", "11:20"): "EXAM"}) == 2
+    assert text_of(grid, ("MON", "9:20")) == "SE101"
+    assert grid.body.itemcget(grid.items[("TUE", "11:20")][0], "fill") == "#ffb5b5"
+    assert grid.show({("MON", "9:20"): "SE101", ("TUE", "11:20"): "EXAM"}) == 0
+    assert grid.show({("MON", "9:20"): "SE102"}) == 2  # one changed, one cleared
+    assert text_of(grid, ("TUE", "11:20")) == ""
+
+
+def test_clicks_find_the_cell(grid):
+    grid.show({("TUE", "10:20"): "SE201"})
+    assert grid.cell_at(grid.cell_width + 5, grid.cell_height + 5) == ("TUE", "10:20")
+    assert grid.cell_at(3 * grid.cell_width + 5, 5) is None
+    grid._clicked(SimpleNamespace(x=grid.cell_width + 5, y=grid.cell_height + 5))
+    grid._clicked(SimpleNamespace(x=5, y=5 * grid.cell_height))
+    assert grid.clicks == [("TUE", "10:20", "SE201")]
+
+
+def test_cell_colors():
+    from beeplan_app import cell_colors
+
+    assert cell_colors("EXAM\nBLOCK\n(13:20-15:10)") == ("#ffb5b5", "#d10000")
+    assert cell_colors("SENG101")[1] == "white"
+    assert cell_colors("") == ("#eaf6ff", "#111")
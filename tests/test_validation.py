@@ -0,0 +1,62 @@
+from beeplan_core import Classroom, Course, Instructor, iter_instructors
+from entity_store import CourseStore
+from issues import CRITICAL, WARNING
+from validation import (
+    BAD_AVAILABILITY,
+    DUPLICATE_CODE,
+    OVERSIZED_COURSE,
+    UNASSIGNED_INSTRUCTOR,
+    UNKNOWN_INSTRUCTOR,
+    finding_issues,
+    summarize,
+    validate_inputs,
+)
+
+COURSES = [
+    Course("SE101", students=40, instructor="Dr A"),
+    Course("SE102", students=400, instructor="Dr Z"),
+    Course("SE101", students=10, instructor="Dr A"),
+    Course("SE103", students=20),
+    Course("SE101", students=10, instructor="Dr A"),
+]
+INSTRUCTORS = list(iter_instructors([
+    {"name": "Dr A", "available": ["MON-9:20", {"day": "tue", "time": "10:20"}]},
+    {"name": "Dr B", "available": ["SUN-9:20", "whenever", {"day": "WED"}]},
+]))
+
+
+def test_each_check_reports_in_input_order():
+    findings = validate_inputs(COURSES, INSTRUCTORS, [Classroom("A1", 100)])
+    assert [(f.kind, f.subject) for f in findings] == [
+        (BAD_AVAILABILITY, "Dr B"),
+        (BAD_AVAILABILITY, "Dr B"),
+        (BAD_AVAILABILITY, "Dr B"),
+        (UNKNOWN_INSTRUCTOR, "SE102"),
+        (OVERSIZED_COURSE, "SE102"),
+        (DUPLICATE_CODE, "SE101"),  # once, however often it repeats
+        (UNASSIGNED_INSTRUCTOR, "SE103"),
+    ]
+    assert summarize(findings)[BAD_AVAILABILITY] == 3
+
+
+def test_checks_wait_for_their_inputs():
+    kinds = {f.kind for f in validate_inputs(COURSES)}
+    assert kinds == {DUPLICATE_CODE, UNASSIGNED_INSTRUCTOR}
+
+
+def test_store_and_list_give_the_same_findings():
+    assert validate_inputs(CourseStore.from_courses(COURSES), INSTRUCTORS, [Classroom("A1", 100)]) == \
+        validate_inputs(COURSES, INSTRUCTORS, [Classroom("A1", 100)])
+
+
+def test_findings_as_issues():
+    findings = validate_inputs(COURSES, [Instructor("Dr A", ["noon"])], [Classroom("A1", 100)])
+    issues = finding_issues(findings)
+    assert [(i.type, i.severity, i.course, i.instructor) for i in issues] == [
+        (BAD_AVAILABILITY, WARNING, "", "Dr A"),
+        (UNKNOWN_INSTRUCTOR, CRITICAL, "SE102", ""),
+        (OVERSIZED_COURSE, CRITICAL, "SE102", ""),
+        (DUPLICATE_CODE, CRITICAL, "SE101", ""),
+        (UNASSIGNED_INSTRUCTOR, WARNING, "SE103", ""),
+    ]
+    assert issues[2].message == "Course SE102 has 400 students; the largest room holds 100."
@@ -0,0 +1,41 @@
+import json
+
+from beeplan_core import load_json_or_csv, parse_classrooms, parse_courses, parse_instructors
+from benchmark import main as benchmark_main, run_benchmarks
+from workload import make_workload, write_workload
+
+
+def test_workload_is_determined_by_the_seed():
+    assert make_workload(200, seed=4) == make_workload(200, seed=4)
+    assert make_workload(200, seed=4) != make_workload(200, seed=5)
+    data = make_workload(200)
+    assert (len(data["Courses"]), len(data["Instructors"]), len(data["Classrooms"])) == (200, 50, 20)
+    assert len({c["code"] for c in data["Courses"]}) == 200
+
+
+def test_json_and_csv_files_parse_to_the_same_records(tmp_path):
+    paths = write_workload(str(tmp_path), 120, seed=2)
+    for entity, parse in (("Courses", parse_courses), ("Instructors", parse_instructors),
+                          ("Classrooms", parse_classrooms)):
+        from_json = parse(load_json_or_csv(paths[f"{entity}.json"]))
+        from_csv = parse(load_json_or_csv(paths[f"{entity}.csv"]))
+        assert len(from_json) == len(make_workload(120, seed=2)[entity])
+        if entity != "Instructors":  # the CSV has no availability column
+            assert from_csv == from_json
+    instructors = parse_instructors(load_json_or_csv(paths["Instructors.json"]))
+    part_time = [i for i in instructors if i.available]
+    assert part_time and all(isinstance(slot, tuple) for i in part_time for slot in i.available)
+
+
+def test_benchmark_rows(tmp_path):
+    report = run_benchmarks([30], ["greedy", "csp"], ["json"], memory=False)
+    stages = [(r["stage"], r.get("entity") or r.get("variant")) for r in report["results"]]
+    assert stages == [("load", "Courses"), ("parse", "Courses"), ("load", "Instructors"),
+                      ("parse", "Instructors"), ("load", "Classrooms"), ("parse", "Classrooms"),
+                      ("schedule", "greedy"), ("schedule", "csp"), ("schedule", "all_years")]
+    for row in report["results"]:
+        if row["stage"] == "schedule":
+            assert row["placed"] + row["unplaced"] == 30
+    out = tmp_path / "bench.json"
+    benchmark_main(["--sizes", "20", "--engines", "greedy", "--formats", "csv", "--out", str(out)])
+    assert json.loads(out.read_text())["meta"]["seed"] == 1